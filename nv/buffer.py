@@ -0,0 +1,345 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_right
+import re
+
+from sublime import Region
+
+# The size, in characters, of the chunks of buffer text read at a time.
+_CHUNK_SIZE = 512
+
+# The largest gap, in characters, between selections that a BufferSnapshot
+# reads across. Reading and scanning a gap this size is cheaper than the few
+# API calls that reading the lines on each side of it separately makes.
+_SNAPSHOT_GAP = 16384
+
+
+class BufferReader():
+
+    # Reads the text of a view in fixed-size chunks, so that scanning over a
+    # run of characters, e.g. a long run of whitespace, is a few API calls
+    # rather than an API call per character. The most recently read chunk is
+    # kept, so that scans near each other share reads.
+    #
+    # Points outside the buffer read as "\x00", as they do with view.substr().
+    #
+    # Attributes:
+    #   :view (sublime.View):
+    #   :size (int): The size of the buffer.
+
+    def __init__(self, view, chunk_size: int = _CHUNK_SIZE) -> None:
+        self.view = view
+        self.size = view.size()
+        self._chunk_size = chunk_size
+        self._a = 0
+        self._text = ''
+
+    def _read(self, a: int, b: int) -> str:
+        a = max(0, a)
+        b = min(self.size, b)
+        if not (self._a <= a and b <= self._a + len(self._text)):
+            self._a = a
+            self._text = self.view.substr(Region(a, b))
+
+        return self._text[a - self._a:b - self._a]
+
+    def _chunks_forward(self, pt: int):
+        # Yields (pt, text) chunks from pt to the end of the buffer.
+        while pt < self.size:
+            text = self._read(pt, pt + self._chunk_size)
+            yield pt, text
+            pt += len(text)
+
+    def _chunks_backward(self, pt: int):
+        # Yields (pt, text) chunks from pt, inclusive, back to the start of
+        # the buffer.
+        pt = min(pt + 1, self.size)
+        while pt > 0:
+            a = max(0, pt - self._chunk_size)
+            yield a, self._read(a, pt)
+            pt = a
+
+    def char(self, pt: int) -> str:
+        if pt < 0 or pt >= self.size:
+            return '\x00'
+
+        if not (self._a <= pt < self._a + len(self._text)):
+            self._read(pt, pt + self._chunk_size)
+
+        return self._text[pt - self._a]
+
+    def skip_forward(self, pt: int, chars: str) -> int:
+        # Returns the first point at or after pt that is not one of chars, or
+        # the size of the buffer if there isn't one.
+        if pt < 0 or pt >= self.size:
+            return pt
+
+        for a, text in self._chunks_forward(pt):
+            rest = text.lstrip(chars)
+            if rest:
+                return a + len(text) - len(rest)
+
+        return self.size
+
+    def skip_backward(self, pt: int, chars: str, stop: int = 0) -> int:
+        # Returns the first point at or before pt, and after stop, that is not
+        # one of chars, or stop if there isn't one.
+        if pt <= stop or pt >= self.size:
+            return pt
+
+        for a, text in self._chunks_backward(pt):
+            if a < stop:
+                text = text[stop - a:]
+                a = stop
+
+            rest = text.rstrip(chars)
+            if rest:
+                return a + len(rest) - 1
+
+            if a == stop:
+                break
+
+        return stop
+
+    def find_forward(self, pt: int, chars: str) -> int:
+        # Returns the first point at or after pt that is one of chars, or the
+        # size of the buffer plus one if there isn't one.
+        if pt > self.size:
+            return pt
+
+        pattern = re.compile('[%s]' % re.escape(chars))
+        for a, text in self._chunks_forward(max(0, pt)):
+            match = pattern.search(text)
+            if match:
+                return a + match.start()
+
+        return self.size + 1
+
+    def find_backward(self, pt: int, chars: str) -> int:
+        # Returns the first point at or before pt that is one of chars, or -1
+        # if there isn't one.
+        if pt < 0:
+            return pt
+
+        for a, text in self._chunks_backward(pt):
+            i = max(text.rfind(c) for c in chars)
+            if i != -1:
+                return a + i
+
+        return -1
+
+    def line_chunks(self, a: int, b: int):
+        # Yields (pt, text) chunks of the lines from a to b, where a is the
+        # start of a line and b is the end of a line. Each chunk is one or more
+        # whole lines, without the newline that follows the last one, so the
+        # lines of a chunk are text.split('\n'). A line longer than the chunk
+        # size is read as a chunk of its own.
+        while a <= b:
+            size = self._chunk_size
+            while True:
+                end = min(b, a + size)
+                text = self.view.substr(Region(a, end))
+                if end == b:
+                    break
+
+                i = text.rfind('\n')
+                if i != -1:
+                    text = text[:i]
+                    break
+
+                size *= 2
+
+            yield a, text
+            a += len(text) + 1
+
+
+def _runs(spans: list) -> list:
+    # Returns the [begin, end] runs of the sorted (begin, end) spans, where a
+    # run ends at a gap of more than _SNAPSHOT_GAP characters.
+    runs = []  # type: list
+    for begin, end in spans:
+        if runs and begin - runs[-1][1] <= _SNAPSHOT_GAP:
+            runs[-1][1] = max(runs[-1][1], end)
+        else:
+            runs.append([begin, end])
+
+    return runs
+
+
+class BufferSnapshot():
+
+    # A read-only stand-in for a view, for reading the lines around many
+    # selections, e.g. to move thousands of cursors. The lines of the
+    # selections are read with a few API calls per run of nearby selections,
+    # and the line, row, and text lookups within them are then answered
+    # without API calls. Other lookups, and any other attributes, are passed
+    # through to the view.
+    #
+    # The snapshot must not be used after the view is modified.
+    #
+    # Attributes:
+    #   :view (sublime.View):
+
+    def __init__(self, view, regions: list, before: int = 0, after: int = 0) -> None:
+        # Args:
+        #   view (View):
+        #   regions (list[Region]): The selections, which must not be empty.
+        #   before (int): The number of lines before each selection to read.
+        #   after (int): The number of lines after each selection to read.
+        self.view = view
+        self._size = view.size()
+        self._settings = None
+        self._folded_regions = None
+        self._rowcols = {}  # type: dict
+
+        # The [first, last] rows of the runs of nearby selections, with the
+        # runs that overlap or touch merged, so that the text between runs of
+        # selections far from each other isn't read.
+        rows = []  # type: list
+        for begin, end in _runs(sorted((region.begin(), region.end()) for region in regions)):
+            first_row = max(0, view.rowcol(begin)[0] - before)
+            last_row = view.rowcol(end)[0] + after
+            if rows and first_row <= rows[-1][1] + 1:
+                rows[-1][1] = max(rows[-1][1], last_row)
+            else:
+                rows.append([first_row, last_row])
+
+        # A list of (begin, end, first row, text, line starts) tuples, in
+        # buffer order.
+        self._chunks = [self._read(first_row, last_row) for first_row, last_row in rows]
+        self._chunk_begins = [chunk[0] for chunk in self._chunks]
+        self._chunk_rows = [chunk[2] for chunk in self._chunks]
+
+    def _read(self, first_row: int, last_row: int) -> tuple:
+        a = self.view.text_point(first_row, 0)
+        b = self.view.line(self.view.text_point(last_row, 0)).b
+        text = self.view.substr(Region(a, b))
+
+        starts = [a]
+        find = text.find
+        i = find('\n')
+        while i != -1:
+            starts.append(a + i + 1)
+            i = find('\n', i + 1)
+
+        return (a, b, first_row, text, starts)
+
+    def __getattr__(self, name: str):
+        return getattr(self.view, name)
+
+    def _chunk(self, pt: int):
+        # Return the chunk of pt, or None if pt is outside the chunks.
+        i = bisect_right(self._chunk_begins, pt) - 1
+        if i >= 0 and pt <= self._chunks[i][1]:
+            return self._chunks[i]
+
+        return None
+
+    def _line_index(self, chunk: tuple, pt: int) -> int:
+        return bisect_right(chunk[4], pt) - 1
+
+    def _line_end(self, chunk: tuple, i: int) -> int:
+        starts = chunk[4]
+        if i + 1 < len(starts):
+            return starts[i + 1] - 1
+
+        return chunk[1]
+
+    def size(self) -> int:
+        return self._size
+
+    def settings(self):
+        if self._settings is None:
+            self._settings = self.view.settings()
+
+        return self._settings
+
+    def folded_regions(self) -> list:
+        if self._folded_regions is None:
+            self._folded_regions = self.view.folded_regions()
+
+        return self._folded_regions
+
+    def line(self, x):
+        if isinstance(x, Region):
+            chunk = self._chunk(x.begin())
+            if chunk and x.end() <= chunk[1]:
+                return Region(
+                    chunk[4][self._line_index(chunk, x.begin())],
+                    self._line_end(chunk, self._line_index(chunk, x.end())))
+        else:
+            chunk = self._chunk(x)
+            if chunk:
+                i = self._line_index(chunk, x)
+
+                return Region(chunk[4][i], self._line_end(chunk, i))
+
+        return self.view.line(x)
+
+    def full_line(self, x):
+        line = self.line(x)
+        if line.b < self._size:
+            return Region(line.a, line.b + 1)
+
+        return line
+
+    def substr(self, x) -> str:
+        if isinstance(x, Region):
+            a = x.begin()
+            b = x.end()
+            chunk = self._chunk(a)
+            if chunk and b <= chunk[1]:
+                return chunk[3][a - chunk[0]:b - chunk[0]]
+        else:
+            chunk = self._chunk(x)
+            if chunk:
+                if x < chunk[1]:
+                    return chunk[3][x - chunk[0]]
+
+                if x < self._size:
+                    return '\n'
+
+        return self.view.substr(x)
+
+    def rowcol(self, pt: int) -> tuple:
+        chunk = self._chunk(pt)
+        if chunk:
+            i = self._line_index(chunk, pt)
+
+            return (chunk[2] + i, pt - chunk[4][i])
+
+        # Points outside the lines, e.g. the end of the buffer, are often
+        # looked up for every selection.
+        try:
+            return self._rowcols[pt]
+        except KeyError:
+            rowcol = self._rowcols[pt] = self.view.rowcol(pt)
+
+            return rowcol
+
+    def text_point(self, row: int, col: int) -> int:
+        j = bisect_right(self._chunk_rows, row) - 1
+        if j >= 0:
+            chunk = self._chunks[j]
+            i = row - chunk[2]
+            if i < len(chunk[4]):
+                pt = chunk[4][i] + col
+                if 0 <= col and pt <= self._line_end(chunk, i):
+                    return pt
+
+        return self.view.text_point(row, col)
@@ -41,11 +41,13 @@ def _init_common_panel_settings(panel) -> None:
 
 class Cmdline():
 
+    CONFIRM = ''
     EX = ':'
     SEARCH_BACKWARD = '?'
     SEARCH_FORWARD = '/'
 
     _TYPES = (
+        CONFIRM,
         EX,
         SEARCH_BACKWARD,
         SEARCH_FORWARD,
@@ -68,9 +70,9 @@ class Cmdline():
             'on_cancel': on_cancel,
         }
 
-    def prompt(self, initial_text: str) -> None:
+    def prompt(self, initial_text: str, caption: str = '') -> None:
         input_panel = self._window.show_input_panel(
-            caption='',
+            caption=caption,
             initial_text=self._type + initial_text,
             on_done=self._on_done,
             on_change=self._on_change,
@@ -78,7 +80,11 @@ class Cmdline():
         )
 
         input_panel.set_name('Command-line mode')
-        input_panel.settings().set('_nv_ex_mode', True)
+
+        # A confirm prompt is answered with a single key, so the command-line
+        # editing keys, e.g. history, don't apply.
+        if self._type != self.CONFIRM:
+            input_panel.settings().set('_nv_ex_mode', True)
 
         _init_common_panel_settings(input_panel)
 
@@ -87,10 +93,10 @@ class Cmdline():
             self._callbacks[callback](*args)
 
     def _is_valid_input(self, cmdline) -> bool:
-        return isinstance(cmdline, str) and len(cmdline) > 0 and cmdline[0] == self._type
+        return isinstance(cmdline, str) and cmdline.startswith(self._type)
 
     def _filter_input(self, inp: str) -> str:
-        return inp[1:]
+        return inp[len(self._type):]
 
     def _on_done(self, inp: str) -> None:
         if not self._is_valid_input(inp):
@@ -126,11 +132,15 @@ class CmdlineOutput():
     def disable_highlight_line(self):
         self._output.settings().set('highlight_line', False)
 
-    def show(self) -> None:
+    def show(self, prompt: bool = True) -> None:
         self._window.run_command('show_panel', {'panel': 'output.' + self._name})
         self._output.settings().set('nv_cmdline_output', True)
-        self.write('\nPress ENTER to continue')
-        self._window.focus_view(self._window.find_output_panel(self._name))
+
+        # Without the prompt the output is still being written, so leave the
+        # focus in the view, where <Esc> interrupts the command writing it.
+        if prompt:
+            self.write('\nPress ENTER to continue')
+            self._window.focus_view(self._window.find_output_panel(self._name))
 
     def write(self, text: str) -> None:
         self._output.set_read_only(False)
@@ -15,12 +15,23 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from timeit import default_timer
+
+from sublime import IGNORECASE
+from sublime import LITERAL
+from sublime import set_timeout
+
 from NeoVintageous.nv.cmdline import Cmdline
 from NeoVintageous.nv.history import history_update
 from NeoVintageous.nv.history import reset_cmdline_history
+from NeoVintageous.nv.options import get_option
+from NeoVintageous.nv.polyfill import view_find_all_in_range
+from NeoVintageous.nv.polyfill import view_find_iter
 from NeoVintageous.nv.search import add_search_highlighting
 from NeoVintageous.nv.search import clear_search_highlighting
+from NeoVintageous.nv.search import filter_literal_search_occurrences
 from NeoVintageous.nv.search import find_search_occurrences
+from NeoVintageous.nv.search import is_self_overlapping_pattern
 from NeoVintageous.nv.search import process_search_pattern
 from NeoVintageous.nv.settings import append_sequence
 from NeoVintageous.nv.settings import get_count
@@ -37,12 +48,99 @@ from NeoVintageous.nv.vi.search import reverse_find_wrapping
 from NeoVintageous.nv.vim import status_message
 
 
+# Buffers up to this size are searched for all occurrences in one go. Larger
+# buffers have the visible occurrences highlighted first and the rest of the
+# buffer is searched in time-sliced chunks.
+_INCSEARCH_SYNC_SIZE = 1000000
+
+# The maximum time, in seconds, of a chunk of an incremental search.
+_INCSEARCH_SLICE = 0.01
+
+
+class _IncrementalSearch():
+
+    # Finds the occurrences of the pattern as it is typed at the search prompt.
+    #
+    # When a literal pattern extends the previous literal pattern then the
+    # occurrences of the previous pattern are filtered, rather than searching
+    # the whole buffer again. Any pending chunks of a previous search are
+    # cancelled when the pattern changes.
+
+    def __init__(self, view):
+        self.view = view
+        self.generation = 0
+        self.pattern = None  # type: str
+        self.flags = 0
+        self.occurrences = None  # type: list
+
+    def reset(self, pattern: str = None, flags: int = 0, occurrences: list = None) -> None:
+        self.generation += 1
+        self.pattern = pattern
+        self.flags = flags
+        self.occurrences = occurrences
+
+    def candidates(self, pattern: str, flags: int):
+        # Returns:
+        #   list|None: The occurrences of the previous pattern that the
+        #       occurrences of pattern are a subset of, otherwise None.
+        if self.occurrences is None or not self.pattern:
+            return None
+
+        if flags != self.flags or not flags & LITERAL or not pattern.startswith(self.pattern):
+            return None
+
+        previous = self.pattern.lower() if flags & IGNORECASE else self.pattern
+        if self.occurrences and is_self_overlapping_pattern(previous):
+            return None
+
+        return self.occurrences
+
+    def search(self, pattern: str, flags: int, match) -> None:
+        candidates = self.candidates(pattern, flags)
+        self.reset(pattern, flags)
+
+        if candidates is not None:
+            source = filter_literal_search_occurrences(self.view, candidates, pattern, flags)
+        elif self.view.size() <= _INCSEARCH_SYNC_SIZE:
+            return self._done(find_search_occurrences(self.view, pattern, flags), match)
+        else:
+            source = view_find_iter(self.view, pattern, 0, flags)
+
+        if not self._step(self.generation, source, [], match):
+            visible = self.view.visible_region()
+            add_search_highlighting(
+                self.view,
+                view_find_all_in_range(self.view, pattern, visible.begin(), visible.end(), flags),
+                [match]
+            )
+
+    def _step(self, generation: int, source, occurrences: list, match) -> bool:
+        if generation != self.generation:
+            return True
+
+        deadline = default_timer() + _INCSEARCH_SLICE
+        for region in source:
+            occurrences.append(region)
+            if default_timer() > deadline:
+                set_timeout(lambda: self._step(generation, source, occurrences, match), 0)
+                return False
+
+        self._done(occurrences, match)
+
+        return True
+
+    def _done(self, occurrences: list, match) -> None:
+        self.occurrences = occurrences
+        add_search_highlighting(self.view, occurrences, [match])
+
+
 class CmdlineSearch():
 
     def __init__(self, view, forward: bool):
         self.view = view
         self.forward = forward
         self.type = Cmdline.SEARCH_FORWARD if self.forward else Cmdline.SEARCH_BACKWARD
+        self._incsearch = _IncrementalSearch(view)
 
     def run(self, edit, pattern: str = '') -> None:
         set_reset_during_init(self.view, False)
@@ -57,6 +155,7 @@ class CmdlineSearch():
         self._cmdline.prompt(pattern)
 
     def on_done(self, pattern: str) -> None:
+        self._incsearch.reset()
         history_update(self.type + pattern)
         reset_cmdline_history()
         clear_search_highlighting(self.view)
@@ -79,7 +178,11 @@ class CmdlineSearch():
             start = 0
             end = sel.b + 1 if not sel.empty() else sel.b
 
-        if self.forward:
+        # When the previous pattern had no occurrences then neither does a
+        # pattern that extends it, so there is no need to search at all.
+        if self._incsearch.candidates(pattern, flags) == []:
+            match = None
+        elif self.forward:
             match = find_wrapping(self.view,
                                   term=pattern,
                                   start=start,
@@ -97,12 +200,16 @@ class CmdlineSearch():
         clear_search_highlighting(self.view)
 
         if not match:
+            # Without 'wrapscan' there may be occurrences that weren't searched.
+            self._incsearch.reset(pattern, flags, [] if get_option(self.view, 'wrapscan') else None)
+
             return status_message('E486: Pattern not found: %s', pattern)
 
-        add_search_highlighting(self.view, find_search_occurrences(self.view, pattern, flags), [match])
+        self._incsearch.search(pattern, flags, match)
         show_if_not_visible(self.view, match)
 
     def on_cancel(self) -> None:
+        self._incsearch.reset()
         clear_search_highlighting(self.view)
         reset_command_data(self.view)
         reset_cmdline_history()
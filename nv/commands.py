@@ -32,6 +32,9 @@ from sublime_plugin import WindowCommand
 
 from NeoVintageous.nv import listener
 from NeoVintageous.nv import macros
+from NeoVintageous.nv import profiler
+from NeoVintageous.nv import shell
+from NeoVintageous.nv import trace
 from NeoVintageous.nv.cmdline import Cmdline
 from NeoVintageous.nv.cmdline_search import CmdlineSearch
 from NeoVintageous.nv.ex.completions import insert_best_cmdline_completion
@@ -40,6 +43,7 @@ from NeoVintageous.nv.ex.completions import reset_cmdline_completion_state
 from NeoVintageous.nv.ex_cmds import do_ex_cmd_edit_wrap
 from NeoVintageous.nv.ex_cmds import do_ex_cmdline
 from NeoVintageous.nv.ex_cmds import do_ex_command
+from NeoVintageous.nv.ex_cmds import do_substitute_confirm
 from NeoVintageous.nv.feed_key import FeedKeyHandler
 from NeoVintageous.nv.goto import GotoView
 from NeoVintageous.nv.goto import get_linewise_non_blank_target
@@ -136,6 +140,7 @@ from NeoVintageous.nv.utils import previous_non_folded_pt
 from NeoVintageous.nv.utils import regions_transform_extend_to_line_count
 from NeoVintageous.nv.utils import regions_transform_to_first_non_blank
 from NeoVintageous.nv.utils import regions_transformer
+from NeoVintageous.nv.utils import regions_transformer_batched
 from NeoVintageous.nv.utils import regions_transformer_indexed
 from NeoVintageous.nv.utils import regions_transformer_reversed
 from NeoVintageous.nv.utils import replace_line
@@ -210,6 +215,8 @@ from NeoVintageous.nv.window import window_tab_control
 
 
 __all__ = [
+    'NeoVintageousStartupReport',
+    'NeoVintageousTraceReport',
     'Neovintageous',
     'SequenceCommand',
     'nv_cmdline',
@@ -450,8 +457,14 @@ class nv_feed_key(WindowCommand):
             _log.exception(e)
             clean_views()
 
-        _log.info('key key finished in %s ms', '{:.1f}'
-                  .format((time.time() - start_time) * 1000))
+        if trace.log_info or trace.enabled:
+            elapsed = (time.time() - start_time) * 1000
+
+            if trace.log_info:
+                _log.info('key key finished in %.1f ms', elapsed)
+
+            if trace.enabled:
+                trace.record('key done', key, '{:.3f} ms'.format(elapsed))
 
 
 class nv_process_notation(WindowCommand):
@@ -530,6 +543,12 @@ class nv_view(TextCommand):
             self.view.insert(edit, 0, **kwargs)
         elif action == 'replace_line':
             replace_line(self.view, edit, **kwargs)
+        elif action == 'replace_content':
+            self.view.replace(edit, Region(0, self.view.size()), kwargs['text'])
+        elif action == 'substitute_confirm':
+            do_substitute_confirm(self.view, edit, **kwargs)
+        elif action == 'shell_job':
+            shell.do_shell_job(self.view, edit)
 
 
 class Neovintageous(WindowCommand):
@@ -549,6 +568,30 @@ class Neovintageous(WindowCommand):
             reveal_side_bar(self.window)
 
 
+class NeoVintageousStartupReport(WindowCommand):
+
+    def run(self):
+        view = self.window.new_file()
+        view.set_name('NeoVintageous Startup Report')
+        view.set_scratch(True)
+        view.run_command('nv_view', {'action': 'insert', 'text': profiler.report()})
+        view.set_read_only(True)
+
+
+class NeoVintageousTraceReport(WindowCommand):
+
+    def run(self, clear=False):
+        if clear:
+            trace.clear()
+            return
+
+        view = self.window.new_file()
+        view.set_name('NeoVintageous Trace Report')
+        view.set_scratch(True)
+        view.run_command('nv_view', {'action': 'insert', 'text': trace.report()})
+        view.set_read_only(True)
+
+
 # DEPRECATED Use nv_run_cmds instead
 class SequenceCommand(TextCommand):
 
@@ -795,6 +838,9 @@ class nv_enter_normal_mode(TextCommand):
 
         self.view.window().run_command('hide_overlay')
 
+        if mode == NORMAL and not from_init:
+            shell.cancel(self.view)
+
         if ((not from_init and (mode == NORMAL) and not get_sequence(self.view)) or not is_view(self.view)):
             # When nv_enter_normal_mode is requested from init_view, we
             # should not hide output panels; hide them only if the user
@@ -2702,7 +2748,7 @@ class nv_vi_l(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f)
 
 
 class nv_vi_h(TextCommand):
@@ -2752,7 +2798,7 @@ class nv_vi_h(TextCommand):
                 if any(self.view.rowcol(r.b - 1)[1] != min_ for r in self.view.sel()):
                     baseline = min_
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f)
 
 
 class nv_vi_j(TextCommand):
@@ -2831,7 +2877,7 @@ class nv_vi_j(TextCommand):
             visual_block.transform_target(next_line_target_pt)
             return
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f, after=count)
 
 
 class nv_vi_jump_back(TextCommand):
@@ -2918,7 +2964,7 @@ class nv_vi_k(TextCommand):
             visual_block.transform_target(prev_line_target_pt)
             return
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f, before=count)
 
 
 class nv_vi_gg(TextCommand):
@@ -3012,7 +3058,7 @@ class nv_vi_dollar(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f, after=count - 1)
 
 
 class nv_vi_w(TextCommand):
@@ -3117,7 +3163,7 @@ class nv_vi_zero(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f)
 
 
 class nv_vi_right_brace(TextCommand):
@@ -3430,7 +3476,7 @@ class nv_vi_underscore(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f, after=count - 1)
 
 
 class nv_vi_hat(TextCommand):
@@ -3454,7 +3500,7 @@ class nv_vi_hat(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f)
 
 
 class nv_vi_gj(TextCommand):
@@ -3925,7 +3971,7 @@ class nv_vi_minus(TextCommand):
 
             return s
 
-        regions_transformer(self.view, f)
+        regions_transformer_batched(self.view, f)
 
 
 class nv_vi_shift_enter(TextCommand):
@@ -27,6 +27,7 @@ from NeoVintageous.nv.session import session_on_close
 from NeoVintageous.nv.session import session_on_exit
 from NeoVintageous.nv.settings import get_mode
 from NeoVintageous.nv.settings import get_setting
+from NeoVintageous.nv.settings import settings_on_close
 from NeoVintageous.nv.state import init_view
 from NeoVintageous.nv.utils import fix_eol_cursor
 from NeoVintageous.nv.utils import is_view
@@ -241,6 +242,7 @@ class NeoVintageousEvents(EventListener):
 
     def on_close(self, view):
         session_on_close(view)
+        settings_on_close(view)
 
     def on_activated(self, view):
         if is_view(view):
@@ -311,20 +311,48 @@ def _scan_offset(state) -> tuple:
             return _scan_range, [TokenOffset(list(map(to_int, offsets)))]
 
 
+_routes_pattern = None
+_routes_commands = {}  # type: dict
+
+
+def _get_routes_pattern():
+    # Returns one pattern that matches all of the ex routes. Alternatives are
+    # tried in order, so the first route to match wins, as if each route were
+    # tried in turn. The command of the route that matched is found by the
+    # index of the group around the route.
+    #
+    # Returns:
+    #   Pattern
+    global _routes_pattern
+
+    if _routes_pattern is None or len(_routes_commands) != len(ex_routes):
+        _routes_commands.clear()
+        alternatives = []
+        group = 1
+        for route, command in ex_routes.items():
+            _routes_commands[group] = command
+            alternatives.append('(' + route.pattern + ')')
+            group += 1 + route.groups
+
+        _routes_pattern = re.compile('|'.join(alternatives))
+
+    return _routes_pattern
+
+
 def _scan_command(state) -> tuple:
     # Args:
     #   :state (_ScannerState):
     #
     # Returns:
     #   Tuple[None, list(TokenEof)]
-    for route, command in ex_routes.items():
-        if state.match(route):
-            state.ignore()
+    match = state.match(_get_routes_pattern())
+    if match:
+        state.ignore()
 
-            cmd = command(state)
+        cmd = _routes_commands[match.lastindex](state)
 
-            state.expect_eof(lambda: Exception("E492: Not an editor command: %s" % state.source))
+        state.expect_eof(lambda: Exception("E492: Not an editor command: %s" % state.source))
 
-            return None, [cmd, TokenEof()]
+        return None, [cmd, TokenEof()]
 
     raise Exception("E492: Not an editor command: %s" % state.source)
@@ -57,9 +57,10 @@ class TokenCommand(Token):
         #       that, in Vim, some ex commands work well with :global and others
         #       ignore :global ranges. However, according to the docs, all ex
         #       commands should work with :global ranges. At the time of
-        #       writing, the only command that supports the global_lines
-        #       argument is the "print" command e.g. print all lines matching
-        #       \d+ into new buffer: ":%global/\d+/print".
+        #       writing, the commands that support the global_lines argument
+        #       are "copy", "delete", "move", "normal", "print", and
+        #       "substitute" e.g. print all lines matching \d+ into new buffer:
+        #       ":%global/\d+/print".
         super().__init__(content=name)
 
         self.name = name
@@ -22,21 +22,27 @@ import re
 import sys
 import traceback
 
-from sublime import DIALOG_CANCEL
-from sublime import DIALOG_YES
+from sublime import HIDDEN
 from sublime import Region
 from sublime import set_timeout
 from sublime import version
-from sublime import yes_no_cancel_dialog
 
 from NeoVintageous.nv import shell
 from NeoVintageous.nv import variables
+from NeoVintageous.nv.buffer import BufferReader
+from NeoVintageous.nv.cmdline import Cmdline
 from NeoVintageous.nv.cmdline import CmdlineOutput
 from NeoVintageous.nv.ex.nodes import RangeNode
 from NeoVintageous.nv.ex.parser import parse_command_line
 from NeoVintageous.nv.ex.parser import resolve_address
+from NeoVintageous.nv.ex.tokens import TokenDigits
+from NeoVintageous.nv.ex.tokens import TokenDollar
+from NeoVintageous.nv.ex.tokens import TokenDot
+from NeoVintageous.nv.ex.tokens import TokenOffset
+from NeoVintageous.nv.ex.tokens import TokenPercent
 from NeoVintageous.nv.goto import GotoView
 from NeoVintageous.nv.goto import goto_help_subject
+from NeoVintageous.nv.help import helpgrep
 from NeoVintageous.nv.history import history
 from NeoVintageous.nv.mappings import mappings_add
 from NeoVintageous.nv.mappings import mappings_remove
@@ -55,7 +61,6 @@ from NeoVintageous.nv.polyfill import set_selection
 from NeoVintageous.nv.polyfill import spell_add
 from NeoVintageous.nv.polyfill import spell_undo
 from NeoVintageous.nv.polyfill import truncate
-from NeoVintageous.nv.polyfill import view_find_all_in_range
 from NeoVintageous.nv.polyfill import view_to_region
 from NeoVintageous.nv.registers import get_alternate_file_register
 from NeoVintageous.nv.registers import is_alternate_file_register
@@ -63,6 +68,8 @@ from NeoVintageous.nv.registers import registers_get_all
 from NeoVintageous.nv.registers import registers_set
 from NeoVintageous.nv.search import clear_search_highlighting
 from NeoVintageous.nv.search import is_smartcase_pattern
+from NeoVintageous.nv.session import get_session_view_value
+from NeoVintageous.nv.session import set_session_view_value
 from NeoVintageous.nv.settings import get_cmdline_cwd
 from NeoVintageous.nv.settings import get_ex_global_last_pattern
 from NeoVintageous.nv.settings import get_ex_shell_last_command
@@ -78,12 +85,12 @@ from NeoVintageous.nv.settings import set_last_substitute_search_pattern
 from NeoVintageous.nv.settings import set_last_substitute_string
 from NeoVintageous.nv.settings import set_setting
 from NeoVintageous.nv.ui import ui_bell
-from NeoVintageous.nv.utils import adding_regions
 from NeoVintageous.nv.utils import current_working_directory
 from NeoVintageous.nv.utils import expand_path
 from NeoVintageous.nv.utils import expand_to_realpath
 from NeoVintageous.nv.utils import get_line_count
 from NeoVintageous.nv.utils import glue_undo_groups
+from NeoVintageous.nv.utils import hide_panel
 from NeoVintageous.nv.utils import next_non_blank
 from NeoVintageous.nv.utils import regions_transformer
 from NeoVintageous.nv.utils import row_at
@@ -109,6 +116,10 @@ from NeoVintageous.nv.window import window_tab_control
 
 _log = logging.getLogger(__name__)
 
+# The size, in characters, of the chunks of buffer text that :substitute reads
+# at a time.
+_SUBSTITUTE_CHUNK_SIZE = 65536
+
 
 def ex_ascii(view, **kwargs) -> None:
     show_ascii(view)
@@ -212,10 +223,14 @@ def ex_close(window, forceit: bool = False, **kwargs) -> None:
     window_control(window, 'c', close_if_last=forceit)
 
 
-def ex_copy(view, edit, line_range: RangeNode, address=None, **kwargs) -> None:
+def ex_copy(view, edit, line_range: RangeNode, address=None, global_lines=None, **kwargs) -> None:
     if address is None:
         return status_message("E14: Invalid address")
 
+    # If :global called us, ignore the parsed range.
+    if global_lines:
+        return _global_move_or_copy(view, edit, global_lines, address, copy=True)
+
     source = line_range.resolve(view)
 
     destination = resolve_address(view, address)
@@ -252,11 +267,11 @@ def ex_delete(view, edit, register: str, line_range: RangeNode, global_lines=Non
     if r == Region(-1, -1):
         r = view.full_line(0)
 
-    rs = [r]
-
     # If :global called us, ignore the parsed range.
     if global_lines:
-        rs = [Region(a, b) for (a, b) in global_lines]
+        return _global_delete(view, edit, register, global_lines)
+
+    rs = [r]
 
     def _select(view, regions: list, register: str) -> None:
         view.sel().clear()
@@ -274,10 +289,7 @@ def ex_delete(view, edit, register: str, line_range: RangeNode, global_lines=Non
             registers_set(view, register, [text])
 
     # Save stuff to be deleted in register
-    if global_lines:
-        _select(view, [Region(r.a, r.b - 1) for r in rs], register)
-    else:
-        _select(view, [Region(r.a, r.b) for r in rs], register)
+    _select(view, [Region(r.a, r.b) for r in rs], register)
 
     # Build regions to be selected after deletion
     deleted_so_far = 0
@@ -383,31 +395,240 @@ def ex_global(window, view, pattern: str, line_range: RangeNode, cmd='print', **
     else:
         region = line_range.resolve(view)
 
-    matches = view_find_all_in_range(view, pattern, region.a, region.b)
-    if not matches:
+    # Handle `:g!`/`:global!` and `:v`/`:vglobal`
+    # The `!` is translated into `kwargs['forceit'] == True` and means we should
+    # pick all lines _not_ matching the pattern.
+    inverse = kwargs.get('forceit', False)
+
+    lines = _global_lines(view, pattern, region)
+    if not lines and not inverse:
         return status_message('Pattern not found: %s', pattern)
 
-    matches = [view.full_line(r.begin()) for r in matches]
-    matches = [[r.a, r.b] for r in matches]
+    if inverse:
+        lines = _global_inverse_lines(view, lines, region)
+        if not lines:
+            return status_message('Pattern found in every line: %s', pattern)
 
-    # Handle `:g!`/`:global!`
-    # The `!` is translated into `kwargs['forceit'] == True` and means we should
-    # pick all lines _not_ matching the pattern.
-    if kwargs.get('forceit', False):
-        inv_pos = region.a
-        new_matches = []
-        for a, b in matches:
-            new_matches.append([inv_pos, a])
-            inv_pos = b
-        new_matches.append([inv_pos, region.b])
-        matches = new_matches
+    # An empty :substitute pattern is the :global pattern, e.g. :g/x/s//y/.
+    if cmd.target == 'substitute' and cmd.params.get('pattern') == '':
+        cmd.params['pattern'] = pattern
 
-    cmd.params['global_lines'] = matches
+    # The lines are worked out once, here, and the command then changes all of
+    # them in one pass, rather than the command being run on each line.
+    cmd.params['global_lines'] = lines
+    if cmd.forced:
+        cmd.params['forceit'] = True
 
     do_ex_command(window, cmd.target, cmd.params)
     set_ex_global_last_pattern(pattern)
 
 
+def _global_lines(view, pattern: str, region: Region) -> list:
+    # Returns the [begin, end] full lines of the region that match. Once a line
+    # matches, the search goes on from the next line, so a line with more than
+    # one match is only searched and included once. A match at the end of a
+    # region, e.g. ^ at the start of the line after a range, isn't in it. The
+    # empty line after a newline at the end of the buffer is left to the
+    # commands, see _global_buffer_lines().
+    lines = []
+    pt = region.a
+    while pt <= region.b:
+        match = view.find(pattern, pt)
+        if match is None or match.b == -1 or match.b > region.b:
+            break
+
+        if match.a >= region.b and not region.empty() and region.b < view.size():
+            break
+
+        line = view.full_line(match.begin())
+        lines.append([line.a, line.b])
+        if line.empty():
+            break
+
+        pt = line.b
+
+    return lines
+
+
+def _global_buffer_lines(view, lines: list) -> list:
+    # Returns the lines without the empty line after a newline at the end of
+    # the buffer. A pattern like ^ matches it, but it isn't a line of the text.
+    if lines and lines[-1][0] == lines[-1][1] == view.size() > 0:
+        return lines[:-1]
+
+    return lines
+
+
+def _global_inverse_lines(view, lines: list, region: Region) -> list:
+    # Returns the [begin, end] full lines of the region that aren't in lines.
+    # The text between the lines is read with one substr() per gap.
+    inverse = []
+    pt = region.a
+    for a, b in lines + [[region.b, region.b]]:
+        if pt < a:
+            text = view.substr(Region(pt, a))
+            i = 0
+            while i < len(text):
+                j = text.find('\n', i) + 1 or len(text)
+                inverse.append([pt + i, pt + j])
+                i = j
+
+        pt = max(pt, b)
+
+    return inverse
+
+
+def _global_delete(view, edit, register: str, lines: list) -> None:
+    # Deletes the lines of :global. Adjacent lines are deleted as one region.
+    spans = []  # type: list
+    for a, b in lines:
+        if spans and spans[-1][1] == a:
+            spans[-1][1] = b
+        else:
+            spans.append([a, b])
+
+    if register:
+        text = ''.join(view.substr(Region(a, b)) for a, b in spans)
+        if not text.endswith('\n'):
+            text = text + '\n'
+
+        registers_set(view, register, [text])
+
+    for a, b in reversed(spans):
+        view.erase(edit, Region(a, b))
+
+    # The cursor goes to where the end of the last line was.
+    pt = lines[-1][1] - 1
+    deleted = 0
+    for a, b in spans:
+        if pt < a:
+            break
+
+        if pt < b:
+            pt = a
+            break
+
+        deleted += b - a
+
+    set_selection(view, max(0, pt - deleted))
+    enter_normal_mode(view)
+
+
+def _global_address_row(tokens: list, current: int, last: int) -> int:
+    # Resolves the address of a :move or :copy run by :global, for each line,
+    # without the view. The current line is the line :global is on.
+    #
+    # Raises:
+    #   ValueError: If the address isn't a line number, ".", "$", or offset.
+    row = current
+    for token in tokens:
+        if isinstance(token, TokenDot):
+            row = current
+        elif isinstance(token, TokenDigits):
+            row = max(int(token.content) - 1, -1)
+        elif isinstance(token, (TokenDollar, TokenPercent)):
+            row = last
+        elif isinstance(token, TokenOffset):
+            row += sum(token.content)
+        else:
+            raise ValueError('E14: Invalid address')
+
+    return row
+
+
+def _global_move_or_copy(view, edit, lines: list, address: str, copy: bool) -> None:
+    # Moves or copies the lines of :global, one at a time, as Vim does, but the
+    # lines are moved or copied in a list of the buffer lines. The buffer is
+    # then changed with one replace.
+    try:
+        tokens = parse_command_line(address).line_range.start
+    except Exception:
+        return status_message('E14: Invalid address')
+
+    text = view.substr(Region(0, view.size()))
+    old_lines = text.split('\n')
+    eol = len(old_lines) > 1 and not old_lines[-1]
+    if eol:
+        old_lines.pop()
+
+    # The lines to move or copy are marked by wrapping them in a list.
+    new_lines = list(old_lines)  # type: list
+    row = 0
+    pt = 0
+    for a, b in lines:
+        row += text.count('\n', pt, a)
+        pt = a
+        if row < len(new_lines):
+            new_lines[row] = [new_lines[row]]
+
+    # The marked lines keep their order, and the line being moved or copied is
+    # the only line that moves, so the next marked line is never before it.
+    current = None
+    i = 0
+    while True:
+        while i < len(new_lines) and not isinstance(new_lines[i], list):
+            i += 1
+
+        if i == len(new_lines):
+            break
+
+        line = new_lines[i] = new_lines[i][0]
+
+        try:
+            destination = _global_address_row(tokens, i, len(new_lines) - 1)
+        except ValueError as e:
+            return status_message(str(e))
+
+        if destination < -1 or destination >= len(new_lines):
+            return status_message('E16: Invalid range')
+
+        if copy:
+            new_lines.insert(destination + 1, line)
+            current = destination + 1
+        elif destination < i - 1:
+            new_lines.insert(destination + 1, new_lines.pop(i))
+            current = destination + 1
+        elif destination > i:
+            new_lines.insert(destination, new_lines.pop(i))
+            current = destination
+        else:
+            current = i
+
+    _replace_lines(view, edit, text, old_lines, new_lines, eol)
+
+    if current is not None:
+        set_selection(view, view.text_point(current, 0))
+
+    enter_normal_mode(view)
+
+
+def _replace_lines(view, edit, text: str, old_lines: list, new_lines: list, eol: bool) -> None:
+    # Replaces the buffer text with the new lines. Only the lines between the
+    # lines at the start and at the end that haven't changed are replaced.
+    n = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < n and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    if prefix == len(old_lines) == len(new_lines):
+        return
+
+    suffix = 0
+    while suffix < n - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    new_text = '\n'.join(new_lines) + ('\n' if eol else '')
+
+    begin = min(sum(len(line) + 1 for line in old_lines[:prefix]), len(text), len(new_text))
+    end = 0
+    if suffix:
+        end = sum(len(line) + 1 for line in old_lines[len(old_lines) - suffix:]) - (0 if eol else 1)
+
+    end = min(end, len(text) - begin, len(new_text) - begin)
+
+    view.replace(edit, Region(begin, len(text) - end), new_text[begin:len(new_text) - end])
+
+
 def ex_help(window, subject: str = None, forceit: bool = False, **kwargs) -> None:
     if not subject and forceit:
         status_message("E478: Don't panic!")
@@ -416,6 +637,10 @@ def ex_help(window, subject: str = None, forceit: bool = False, **kwargs) -> Non
     goto_help_subject(window, subject)
 
 
+def ex_helpgrep(window, pattern: str, **kwargs) -> None:
+    helpgrep(window, pattern)
+
+
 def ex_history(window, name: str = 'all', **kwargs) -> None:
     output = CmdlineOutput(window)
     output.write(history(name))
@@ -433,10 +658,14 @@ def ex_let(name, value, **kwargs) -> None:
     variables.set(name, re.sub('^(?:"|\')(.*)(?:"|\')$', '\\1', value))
 
 
-def ex_move(view, edit, line_range: RangeNode, address: str = None, **kwargs) -> None:
+def ex_move(view, edit, line_range: RangeNode, address: str = None, global_lines=None, **kwargs) -> None:
     if address is None:
         return status_message("E14: Invalid address")
 
+    # If :global called us, ignore the parsed range.
+    if global_lines:
+        return _global_move_or_copy(view, edit, global_lines, address, copy=False)
+
     source = line_range.resolve(view)
     if any(s.contains(source) for s in view.sel()):
         return status_message("E134: Move lines into themselves")
@@ -498,6 +727,78 @@ def ex_noremap(lhs: str = None, rhs: str = None, **kwargs) -> None:
     mappings_add(VISUAL_LINE, lhs, rhs)
 
 
+def ex_normal(window, view, line_range: RangeNode, keys: str = None, forceit: bool = False,
+              global_lines=None, **kwargs) -> None:
+    if not keys:
+        return status_message('E471: Argument required')
+
+    # If :global called us, ignore the parsed range.
+    if global_lines:
+        lines = _global_buffer_lines(view, global_lines)
+    elif line_range.is_empty:
+        return _normal(window, view, keys, not forceit)
+    else:
+        try:
+            region = line_range.resolve(view)
+        except ValueError as e:
+            return status_message(str(e))
+
+        first = row_at(view, region.begin())
+        last = row_at(view, max(region.begin(), region.end() - 1))
+        lines = []
+        for row in range(first, last + 1):
+            line = view.full_line(view.text_point(row, 0))
+            lines.append([line.a, line.b])
+
+    _NormalLines(view, lines).run(window, keys, not forceit)
+
+
+def _normal(window, view, keys: str, check_user_mappings: bool) -> None:
+    window.run_command('nv_process_notation', {'keys': keys, 'check_user_mappings': check_user_mappings})
+
+    # An incomplete command is ended, like typing <Esc>.
+    if get_mode(view) != NORMAL:
+        enter_normal_mode(view)
+
+
+class _NormalLines():
+
+    # Runs :normal on each of the lines.
+    #
+    # The lines are tracked as regions of the view, so that the points of the
+    # lines stay valid as the keys change the lines before them. A line that
+    # has been deleted is skipped.
+
+    # The lines are tracked in batches, so that getting a line doesn't get all
+    # of the lines.
+    _BATCH_SIZE = 64
+
+    def __init__(self, view, lines: list) -> None:
+        self.view = view
+        self.empty = [a == b for a, b in lines]
+
+        for i in range(0, len(lines), self._BATCH_SIZE):
+            regions = [Region(a, b) for a, b in lines[i:i + self._BATCH_SIZE]]
+            view.add_regions(self._key(i), regions, '', '', HIDDEN)
+
+    def _key(self, i: int) -> str:
+        return 'normal_%d' % (i // self._BATCH_SIZE)
+
+    def run(self, window, keys: str, check_user_mappings: bool) -> None:
+        try:
+            with glue_undo_groups(self.view):
+                for i in range(len(self.empty)):
+                    line = self.view.get_regions(self._key(i))[i % self._BATCH_SIZE]
+                    if line.empty() and not self.empty[i]:
+                        continue
+
+                    set_selection(self.view, line.begin())
+                    _normal(window, self.view, keys, check_user_mappings)
+        finally:
+            for i in range(0, len(self.empty), self._BATCH_SIZE):
+                self.view.erase_regions(self._key(i))
+
+
 def ex_nunmap(lhs: str, **kwargs) -> None:
     try:
         mappings_remove(NORMAL, lhs)
@@ -594,11 +895,7 @@ def ex_quit(**kwargs) -> None:
 @current_working_directory
 def ex_read(view, edit, line_range: RangeNode, cmd: str = None, file_name: str = None, **kwargs) -> None:
     if cmd:
-        content = shell.read(view, cmd).strip()
-        if content:
-            insertion_pt = line_range.resolve(view).end()
-            view.insert(edit, insertion_pt, content + '\n')
-            set_selection(view, view.line(insertion_pt + len(content)).a)
+        shell.run(view, edit, shell.start_read(view, cmd), [line_range.resolve(view)], _read_shell_output)
 
     # TODO :read [name] According to Vim's help :read should read the current
     # file's content *if no file is given* but Vim doesn't seem to do that.
@@ -606,6 +903,14 @@ def ex_read(view, edit, line_range: RangeNode, cmd: str = None, file_name: str =
         ui_bell(':read [file] is not yet implemented; please open an issue')
 
 
+def _read_shell_output(view, edit, job, regions: list) -> None:
+    content = job.output().strip()
+    if content:
+        insertion_pt = regions[0].end()
+        view.insert(edit, insertion_pt, content + '\n')
+        set_selection(view, view.line(insertion_pt + len(content)).a)
+
+
 def ex_marks(view, **kwargs) -> None:
     output = CmdlineOutput(view.window())
     output.disable_highlight_line()
@@ -763,10 +1068,7 @@ def ex_shell_out(view, edit, cmd: str, line_range: RangeNode, **kwargs) -> None:
                 cmd=cmd
             )
         else:
-            cmdline_output = CmdlineOutput(view.window())
-            cmdline_output.write(shell.read(view, cmd))
-            if not get_setting(view, 'shell_silent'):
-                cmdline_output.show()
+            _shell_out(view, edit, cmd)
 
         # TODO: store only successful commands.
         set_ex_shell_last_command(cmd)
@@ -774,6 +1076,29 @@ def ex_shell_out(view, edit, cmd: str, line_range: RangeNode, **kwargs) -> None:
         traceback.print_exc()
 
 
+def _shell_out(view, edit, cmd: str) -> None:
+    cmdline_output = CmdlineOutput(view.window())
+    silent = get_setting(view, 'shell_silent')
+    streamed = False
+
+    def _stream(job) -> None:
+        # The command is slow, so write its output as it's written.
+        nonlocal streamed
+        streamed = True
+        job.follow(cmdline_output.write)
+        if not silent:
+            cmdline_output.show(prompt=False)
+
+    def _show(view, edit, job, regions: list) -> None:
+        if not streamed:
+            cmdline_output.write(job.output())
+
+        if not silent:
+            cmdline_output.show()
+
+    shell.run(view, edit, shell.start_read(view, cmd), [], _show, on_background=_stream)
+
+
 def ex_snoremap(lhs: str = None, rhs: str = None, **kwargs) -> None:
     if not (lhs and rhs):
         return status_message('Listing key mappings is not implemented')
@@ -815,7 +1140,7 @@ def ex_spellundo(word: str, **kwargs) -> None:
 
 def ex_substitute(view, edit, line_range: RangeNode,
                   pattern: str = None, replacement: str = '', flags: list = None,
-                  count: int = 1, **kwargs) -> None:
+                  count: int = 1, global_lines=None, **kwargs) -> None:
     if flags is None:
         flags = []
 
@@ -848,73 +1173,65 @@ def ex_substitute(view, edit, line_range: RangeNode,
     except Exception as e:
         return status_message('[regex error]: {} ... in pattern {}'.format(str(e), pattern))
 
-    target_region = line_range.resolve(view)
-    if target_region.empty():
-        return status_message('E486: Pattern not found: {}'.format(pattern))
-
     replace_count = 0 if (flags and 'g' in flags) else 1
 
-    if 'c' in flags:
+    # If :global called us, ignore the parsed range, and only substitute the
+    # lines of :global.
+    if global_lines:
+        global_lines = _global_buffer_lines(view, global_lines)
+        if not global_lines:
+            return status_message('E486: Pattern not found: {}'.format(pattern))
 
-        def _replace_confirming(view, edit, pattern: str, compiled_pattern,
-                                replacement: str, replace_count: int, target_region: Region) -> None:
+        begin = global_lines[0][0]
+        end = view.line(global_lines[-1][0]).end()
+        only = set(a for a, b in global_lines)  # type: set
+    else:
+        target_region = line_range.resolve(view)
+        if target_region.empty():
+            return status_message('E486: Pattern not found: {}'.format(pattern))
 
-            last_row = row_at(view, target_region.b - 1)
-            start = target_region.begin()
+        begin = view.line(target_region.begin()).begin()
+        end = view.line(target_region.end() - 1).end()
+        only = None
 
-            while True:
-                if start >= view.size():
-                    break
+    if 'n' in flags:
+        # Count the matches, don't substitute. The c flag is ignored.
+        matches, lines = _substitute_lines(view, compiled_pattern, None, replace_count, begin, end, only)[1:]
+        if not matches:
+            return status_message('E486: Pattern not found: {}'.format(pattern))
 
-                match = view.find(pattern, start)
+        enter_normal_mode(view)
 
-                # no match or match out of range -- stop
-                if (match == Region(-1)) or (row_at(view, match.a) > last_row):
-                    view.show(view.sel()[0].begin())
-                    return
+        return status_message(_substitute_report(matches, lines, 'match', 'matches'))
 
-                size_before = view.size()
+    if 'c' in flags:
+        regions, replacements, lines = _substitute_confirm_matches(
+            view, compiled_pattern, replacement, replace_count, begin, end, only)
 
-                with adding_regions(view, 's_confirm', [match], 'comment'):
-                    view.show(match.a, True)
-                    response = yes_no_cancel_dialog('Replace with "%s"?' % replacement)
-                    if response == DIALOG_CANCEL:
-                        break
+        if not regions:
+            return status_message('E486: Pattern not found: {}'.format(pattern))
 
-                    if response == DIALOG_YES:
-                        text = view.substr(match)
-                        substituted = re.sub(compiled_pattern, replacement, text, count=replace_count)
-                        view.replace(edit, match, substituted)
+        confirm = _SubstituteConfirm(view, regions, replacements, lines)
+        set_session_view_value(view, 'substitute_confirm', confirm)
+        confirm.prompt()
 
-                start = match.b + (view.size() - size_before) + 1
+        return
 
-        return _replace_confirming(view, edit, pattern, compiled_pattern, replacement, replace_count, target_region)
+    spans, matches, lines = _substitute_lines(
+        view, compiled_pattern, replacement, replace_count, begin, end, only)
 
-    lines = view.lines(target_region)
-    if not lines:
+    if not spans:
         return status_message('E486: Pattern not found: {}'.format(pattern))
 
-    new_lines = []
-    dirty = False
-    for line in lines:
-        line_str = view.substr(line)
-        new_line_str = re.sub(compiled_pattern, replacement, line_str, count=replace_count)
-        new_lines.append(new_line_str)
-        if new_line_str != line_str:
-            dirty = True
+    last_line_begin = view.line(end).begin()
 
-    new_region_text = '\n'.join(new_lines)
-    if view.size() > line.end():
-        new_region_text += '\n'
+    # The changes are applied from the end of the buffer so that the points of
+    # the spans before each one are still valid.
+    for a, b, new_lines in reversed(spans):
+        view.replace(edit, Region(a, b), '\n'.join(new_lines))
 
-    if not dirty:
-        return status_message('E486: Pattern not found: {}'.format(pattern))
-
-    # Reposition cursor before replacing target region so that the cursor
-    # will auto adjust in sync with the replacement.
-    set_selection(view, line.begin())
-
-    view.replace(edit, target_region, new_region_text)
+    # Put the cursor on the last line of the range.
+    set_selection(view, _substitute_line_begin(spans, last_line_begin))
 
     # TODO Refactor set position cursor after operation into reusable api.
     # Put cursor on first non-whitespace char of current line.
@@ -924,6 +1241,229 @@ def ex_substitute(view, edit, line_range: RangeNode,
 
     enter_normal_mode(view)
 
+    if matches > 2:
+        status_message(_substitute_report(matches, lines, 'substitution', 'substitutions'))
+
+
+def _substitute_lines(view, pattern, replacement: str, replace_count: int, begin: int, end: int,
+                      only: set = None) -> tuple:
+    # Substitutes the lines from begin to end. The lines are read in chunks
+    # and the pattern is applied to each line, as if by re.sub().
+    #
+    # Args:
+    #   :pattern (Pattern):
+    #   :replacement (str): If None, then the matches are only counted.
+    #   :replace_count (int): The maximum number of substitutions per line.
+    #       Zero means all of the matches.
+    #   :begin (int): The start of the first line.
+    #   :end (int): The end of the last line.
+    #   :only (set): If not None, then only the lines that start at these
+    #       points are substituted.
+    #
+    # Returns:
+    #   tuple[list, int, int]: The changed spans, the number of matches, and
+    #       the number of lines with matches. Each span is a list of a start
+    #       point, an end point, and the new lines of the span. Adjacent
+    #       changed lines are joined into one span.
+    spans = []  # type: list
+    span = None
+    matches = 0
+    lines = 0
+    subn = pattern.subn
+
+    for pt, text in BufferReader(view, _SUBSTITUTE_CHUNK_SIZE).line_chunks(begin, end):
+        for line in text.split('\n'):
+            line_end = pt + len(line)
+            if only is None or pt in only:
+                new_line, n = subn(replacement or '', line, count=replace_count)
+                if n:
+                    matches += n
+                    lines += 1
+                    if replacement is not None and new_line != line:
+                        if span and span[1] + 1 == pt:
+                            span[1] = line_end
+                            span[2].append(new_line)
+                        else:
+                            span = [pt, line_end, [new_line]]
+                            spans.append(span)
+
+            pt = line_end + 1
+
+    return spans, matches, lines
+
+
+def _substitute_line_begin(spans: list, line_begin: int) -> int:
+    # Returns the start of a line after the spans are substituted. If the line
+    # is in a span, then it must be the last line of the span.
+    pt = line_begin
+    for a, b, new_lines in spans:
+        if b < line_begin:
+            pt += sum(map(len, new_lines)) + len(new_lines) - 1 - (b - a)
+        elif a <= line_begin:
+            pt += sum(map(len, new_lines[:-1])) + len(new_lines) - 1 - (line_begin - a)
+
+    return pt
+
+
+def _substitute_confirm_matches(view, pattern, replacement: str, replace_count: int, begin: int, end: int,
+                                only: set = None) -> tuple:
+    # Finds the matches of the lines from begin to end, see _substitute_lines().
+    #
+    # Returns:
+    #   tuple[list, list, list]: The regions of the matches, their
+    #       replacements, and the numbers of their lines in the range.
+    regions = []
+    replacements = []
+    lines = []
+    line_number = 0
+
+    for pt, text in BufferReader(view, _SUBSTITUTE_CHUNK_SIZE).line_chunks(begin, end):
+        for line in text.split('\n'):
+            for i, match in enumerate(pattern.finditer(line) if only is None or pt in only else ()):
+                if replace_count and i == replace_count:
+                    break
+
+                regions.append(Region(pt + match.start(), pt + match.end()))
+                replacements.append(match.expand(replacement))
+                lines.append(line_number)
+
+            pt += len(line) + 1
+            line_number += 1
+
+    return regions, replacements, lines
+
+
+class _SubstituteConfirm():
+
+    # Confirms each substitution of a :substitute with the c flag.
+    #
+    # The matches are found up front and tracked as regions of the view, so the
+    # buffer isn't searched again after each answer, and the points of the
+    # matches stay valid as the matches before them are replaced. The prompt is
+    # an input panel, so the UI isn't blocked while it waits for an answer.
+    # Each answer is its own edit, and the edits are glued into one undo group
+    # when the prompt is done, so one undo reverts the whole :substitute.
+
+    # The matches are tracked in batches, so that getting a match doesn't get
+    # all of the matches.
+    _BATCH_SIZE = 64
+
+    def __init__(self, view, regions: list, replacements: list, lines: list) -> None:
+        self.view = view
+        self.replacements = replacements
+        self.lines = lines
+        self.index = 0
+        self.substitutions = 0
+        self.substituted_lines = set()  # type: set
+        self.generation = 0
+        self.finished = False
+
+        for i in range(0, len(regions), self._BATCH_SIZE):
+            view.add_regions(self._key(i), regions[i:i + self._BATCH_SIZE], '', '', HIDDEN)
+
+        view.run_command('mark_undo_groups_for_gluing')
+
+    def _key(self, i: int) -> str:
+        return 's_confirm_%d' % (i // self._BATCH_SIZE)
+
+    def _region(self, i: int) -> Region:
+        return self.view.get_regions(self._key(i))[i % self._BATCH_SIZE]
+
+    def prompt(self) -> None:
+        # Answers to a previous prompt are ignored.
+        self.generation += 1
+        generation = self.generation
+
+        # The undo groups are glued here, rather than by finish(), so that the
+        # edit of the answer that finished the prompt is glued too.
+        def _on_answer(answer: str) -> None:
+            if generation == self.generation:
+                self.view.run_command('nv_view', {'action': 'substitute_confirm', 'answer': answer[-1:]})
+                if self.finished:
+                    self.view.run_command('glue_marked_undo_groups')
+
+        def _on_cancel() -> None:
+            if generation == self.generation:
+                self.finish()
+                self.view.run_command('glue_marked_undo_groups')
+
+        match = self._region(self.index)
+        self.view.add_regions('s_confirm', [match], 'comment')
+        self.view.show(match.a, True)
+
+        Cmdline(self.view, Cmdline.CONFIRM, _on_answer, _on_answer, _on_cancel).prompt(
+            '', caption='replace with {} (y/n/a/q/l)?'.format(self.replacements[self.index]))
+
+    def answer(self, edit, answer: str) -> None:
+        # Args:
+        #   :answer (str): y to substitute the match, l to substitute the match
+        #       and quit, n to skip the match, a to substitute the match and all
+        #       of the remaining matches, and q to quit. Anything else asks
+        #       again for the same match, as Vim does. An empty answer, e.g.
+        #       the input panel's initial text, is ignored.
+        if not answer:
+            return
+
+        if answer in 'ylna':
+            if answer != 'n':
+                self._replace(edit, self.index)
+
+            self.index += 1
+
+            if answer == 'a':
+                while self.index < len(self.replacements):
+                    self._replace(edit, self.index)
+                    self.index += 1
+
+        if answer in 'lq' or self.index == len(self.replacements):
+            self.finish()
+        else:
+            # The prompt is shown again after the input panel callback that
+            # answered it returns.
+            set_timeout(self.prompt, 0)
+
+    def _replace(self, edit, i: int) -> None:
+        self.view.replace(edit, self._region(i), self.replacements[i])
+        self.substitutions += 1
+        self.substituted_lines.add(self.lines[i])
+
+    def finish(self) -> None:
+        self.generation += 1
+        self.finished = True
+
+        for i in range(0, len(self.replacements), self._BATCH_SIZE):
+            self.view.erase_regions(self._key(i))
+
+        self.view.erase_regions('s_confirm')
+        set_session_view_value(self.view, 'substitute_confirm', None)
+
+        window = self.view.window()
+        if window:
+            hide_panel(window)
+            window.focus_view(self.view)
+
+        self.view.show(self.view.sel()[0].begin())
+
+        if self.substitutions > 2:
+            status_message(_substitute_report(
+                self.substitutions, len(self.substituted_lines), 'substitution', 'substitutions'))
+
+
+def do_substitute_confirm(view, edit, answer: str) -> None:
+    # Answer the prompt of a :substitute with the c flag.
+    confirm = get_session_view_value(view, 'substitute_confirm')
+    if confirm:
+        confirm.answer(edit, answer)
+
+
+def _substitute_report(matches: int, lines: int, singular: str, plural: str) -> str:
+    return '{} {} on {} {}'.format(
+        matches,
+        singular if matches == 1 else plural,
+        lines,
+        'line' if lines == 1 else 'lines'
+    )
+
 
 def ex_sunmap(lhs: str, **kwargs) -> None:
     try:
@@ -125,7 +125,7 @@ def _ex_route_close(state) -> TokenCommand:
 
 
 def _ex_route_copy(state) -> TokenCommand:
-    command = _create_route(state, 'copy', addressable=True)
+    command = _create_route(state, 'copy', addressable=True, cooperates_with_global=True)
 
     state.skip(' ')
     state.ignore()
@@ -230,8 +230,10 @@ def _ex_route_file(state) -> TokenCommand:
     return _create_route(state, 'file')
 
 
-def _ex_route_global(state) -> TokenCommand:
+def _ex_route_global(state, inverse: bool = False) -> TokenCommand:
     command = _create_route(state, 'global', forcable=True, addressable=True)
+    if inverse:
+        command.forced = True
 
     sep = state.consume()
     if sep in tuple('\\"|' + ascii_letters):
@@ -277,6 +279,10 @@ def _ex_route_help(state) -> TokenCommand:
     return command
 
 
+def _ex_route_helpgrep(state) -> TokenCommand:
+    return _create_word_route(state, 'helpgrep', 'pattern')
+
+
 def _ex_route_inoremap(state) -> TokenCommand:
     return _create_map_route(state, 'inoremap')
 
@@ -314,7 +320,7 @@ def _ex_route_delmarks(state) -> TokenCommand:
 
 
 def _ex_route_move(state) -> TokenCommand:
-    command = _create_route(state, 'move', addressable=True)
+    command = _create_route(state, 'move', addressable=True, cooperates_with_global=True)
 
     state.skip(' ')
     state.ignore()
@@ -342,6 +348,12 @@ def _ex_route_noremap(state) -> TokenCommand:
     return _create_map_route(state, 'noremap')
 
 
+def _ex_route_normal(state) -> TokenCommand:
+    command = _create_route(state, 'normal', forcable=True, addressable=True, cooperates_with_global=True)
+
+    return _resolve(state, command, r'\s*(?P<keys>.+)$')
+
+
 def _ex_route_nunmap(state) -> TokenCommand:
     return _create_word_route(state, 'nunmap', 'lhs')
 
@@ -498,6 +510,7 @@ def _ex_route_split(state) -> TokenCommand:
 def _ex_route_substitute(state) -> TokenCommand:
     command = TokenCommand('substitute')
     command.addressable = True
+    command.cooperates_with_global = True
 
     delim = state.consume()
 
@@ -595,6 +608,10 @@ def _ex_route_unmap(state) -> TokenCommand:
     return _create_word_route(state, 'unmap', 'lhs')
 
 
+def _ex_route_vglobal(state) -> TokenCommand:
+    return _ex_route_global(state, inverse=True)
+
+
 def _ex_route_vnew(state) -> TokenCommand:
     return _create_file_route(state, 'vnew')
 
@@ -776,6 +793,7 @@ _add_ex_route(r'e(?:dit)?(?= |$)?', _ex_route_edit, 'edit')
 _add_ex_route(r'f(?:ile)?', _ex_route_file, 'file')
 _add_ex_route(r'g(?:lobal)?', _ex_route_global, 'global')
 _add_ex_route(r'his(?:tory)?', _ex_route_history, 'history')
+_add_ex_route(r'helpg(?:rep)?', _ex_route_helpgrep, 'helpgrep')
 _add_ex_route(r'h(?:elp)?', _ex_route_help, 'help')
 _add_ex_route(r'ino(?:remap)?', _ex_route_inoremap, 'inoremap')
 _add_ex_route(r'let\s', _ex_route_let, 'let')
@@ -784,6 +802,7 @@ _add_ex_route(r'm(?:ove)?(?=[^a]|$)', _ex_route_move, 'move')
 _add_ex_route(r'new', _ex_route_new, 'new')
 _add_ex_route(r'nn(?:oremap)?', _ex_route_nnoremap, 'nnoremap')
 _add_ex_route(r'noh(?:lsearch)?', _ex_route_nohlsearch, 'nohlsearch')
+_add_ex_route(r'norm(?:al)?', _ex_route_normal, 'normal')
 _add_ex_route(r'no(?:remap)?', _ex_route_noremap, 'noremap')
 _add_ex_route(r'nun(?:map)?', _ex_route_nunmap, 'nunmap')
 _add_ex_route(r'ono(?:remap)?', _ex_route_onoremap, 'onoremap')
@@ -816,11 +835,13 @@ _add_ex_route(r'tabN(?:ext)?', _ex_route_tabprevious, 'tabNext')
 _add_ex_route(r'tabo(?:nly)?', _ex_route_tabonly, 'tabonly')
 _add_ex_route(r'tabp(?:revious)?', _ex_route_tabprevious, 'tabprevious')
 _add_ex_route(r'tabr(?:ewind)?', _ex_route_tabfirst, 'tabrewind')
+_add_ex_route(r't(?![a-zA-Z])', _ex_route_copy)  # alias of :copy
 _add_ex_route(r'unm(?:ap)?', _ex_route_unmap, 'unmap')
 _add_ex_route(r'vne(?:w)?', _ex_route_vnew, 'vnew')
 _add_ex_route(r'vn(?:oremap)?', _ex_route_vnoremap, 'vnoremap')
 _add_ex_route(r'vs(?:plit)?', _ex_route_vsplit, 'vsplit')
 _add_ex_route(r'vu(?:nmap)?', _ex_route_vunmap, 'vunmap')
+_add_ex_route(r'v(?:global)?(?![a-zA-Z])', _ex_route_vglobal, 'vglobal')
 _add_ex_route(r'w(?:rite)?(?=(?:!?(?:\+\+|>>| |$)))', _ex_route_write, 'write')
 _add_ex_route(r'wa(?:ll)?', _ex_route_wall, 'wall')
 _add_ex_route(r'wqa(?:ll)?', _ex_route_wqall, 'wqall')
@@ -17,6 +17,7 @@
 
 import logging
 
+from NeoVintageous.nv import trace
 from NeoVintageous.nv.mappings import IncompleteMapping
 from NeoVintageous.nv.mappings import Mapping
 from NeoVintageous.nv.mappings import mappings_can_resolve
@@ -81,13 +82,18 @@ class FeedKeyHandler():
         self.do_eval = do_eval
         self.check_user_mappings = check_user_mappings
         self.mode = get_mode(self.view)
-        _log.info(
-            'key evt: %s,%s,%s eval=%s mappings=%s',
-            key,
-            self.mode,
-            repeat_count,
-            do_eval,
-            check_user_mappings)
+
+        if trace.log_info:
+            _log.info(
+                'key evt: %s,%s,%s eval=%s mappings=%s',
+                key,
+                self.mode,
+                repeat_count,
+                do_eval,
+                check_user_mappings)
+
+        if trace.enabled:
+            trace.record('key', key, self.mode, repeat_count)
 
     def handle(self) -> None:
         self._handle_bad_selection()
@@ -148,10 +154,8 @@ class FeedKeyHandler():
         if must_collect_input(self.view, motion, action):
             if motion and motion.accept_input:
                 motion.accept(self.key)
-                set_motion(self.view, motion)  # Processed motion needs to reserialised and stored.
             else:
                 action.accept(self.key)
-                set_action(self.view, action)  # Processed action needs to reserialised and stored.
 
             if self.do_eval and is_runnable(self.view):
                 evaluate_state(self.view)
@@ -0,0 +1,599 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_right
+from itertools import accumulate
+import json
+import os
+import re
+import sre_parse
+import threading
+import traceback
+
+from sublime import LITERAL
+from sublime import MONOSPACE_FONT
+from sublime import Region
+from sublime import find_resources
+from sublime import installed_packages_path
+from sublime import load_resource
+from sublime import set_timeout
+
+from NeoVintageous.nv.polyfill import set_selection
+from NeoVintageous.nv.polyfill import view_find
+from NeoVintageous.nv.session import get_packages_path
+from NeoVintageous.nv.vim import status_message
+
+
+# The help index maps each help tag to its help file and the search pattern of
+# the tag in the file, e.g. {"copy": ["change.txt", "/*copy*"]}. Building it
+# means parsing the "tags" file, so it's cached in a file next to the session
+# file, and it's only rebuilt when the "tags" file changes.
+#
+# The "keys" index maps the lowercase of a tag, without one of the _PREFIXES,
+# to [prefix index, tag] pairs, so that a subject like "ctrl-k" can be found
+# as "CTRL-K", "c_CTRL-K", "i_CTRL-K", etc., with a single lookup.
+#
+# The "offsets" index maps a help file to the offsets of its tags in the file.
+# It's filled in when the file is first opened.
+_VERSION = 1
+
+_DOC_PATH = 'Packages/NeoVintageous/res/doc/'
+
+_PREFIXES = ('', ':', 'c_', 'i_', 'v_', '-', '/')
+
+# Recognize a few exceptions e.g. some strings that contain '*'
+# with "star", "|" with "bar" and '"' with "quote".
+_SUBJECT_REPLACEMENTS = {
+    "*": "star",
+    "g*": "gstar",
+    "[*": "[star",
+    "]*": "]star",
+    "/*": "/star",
+    "/\\*": "/\\star",
+    "\"*": "quotestar",
+    "**": "starstar",
+    "/|": "/bar",
+    "/\\|": "/\\bar",
+    '|': 'bar',
+    '"': 'quote'
+}
+
+_index = {}  # type: dict
+_doc_files = set()  # type: set
+
+
+def _get_cache_file() -> str:
+    return os.path.join(
+        os.path.dirname(get_packages_path()),
+        'Local',
+        'neovintageous.help'
+    )
+
+
+def _get_tags_stamp():
+    # Returns:
+    #   list|None: The modified time and size of the "tags" file, or of the
+    #       package it's in, or None if it's not a file on disk.
+    for path in (os.path.join(get_packages_path(), 'NeoVintageous', 'res', 'doc', 'tags'),
+                 os.path.join(installed_packages_path(), 'NeoVintageous.sublime-package')):
+        try:
+            stat = os.stat(path)
+
+            return [int(stat.st_mtime), stat.st_size]
+        except OSError:
+            pass
+
+    return None
+
+
+def build_index(tags: str) -> dict:
+    index = {
+        'version': _VERSION,
+        'stamp': None,
+        'tags': {},
+        'keys': {},
+        'offsets': {},
+    }  # type: dict
+
+    for line in tags.split('\n'):
+        fields = line.split('\t', 2)
+        if len(fields) == 3:
+            index['tags'][fields[0]] = fields[1:]
+
+    keys = index['keys']
+    for tag in index['tags']:
+        for i, prefix in enumerate(_PREFIXES):
+            if tag.startswith(prefix) and len(tag) > len(prefix):
+                keys.setdefault(tag[len(prefix):].lower(), []).append([i, tag])
+
+    return index
+
+
+def _load_index() -> dict:
+    stamp = _get_tags_stamp()
+    if stamp:
+        try:
+            with open(_get_cache_file(), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            if index.get('version') == _VERSION and index.get('stamp') == stamp:
+                return index
+        except (OSError, ValueError):
+            pass
+
+    index = build_index(load_resource(_DOC_PATH + 'tags'))
+    index['stamp'] = stamp
+    _save_index(index)
+
+    return index
+
+
+def _save_index(index: dict) -> None:
+    if not index['stamp']:
+        return
+
+    # Write to a temporary file that then replaces the cache, so that a crash
+    # can't leave a partially written cache.
+    cache_file = _get_cache_file()
+    tmp_file = cache_file + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+
+        os.replace(tmp_file, cache_file)
+    except OSError:  # pragma: no cover
+        traceback.print_exc()
+
+
+def _get_index() -> dict:
+    if not _index:
+        _index.update(_load_index())
+
+    return _index
+
+
+def find_help_tag(subject: str, index: dict = None):
+    # Find the help tag for a subject.
+    #
+    # A basic hueristic finds the nearest relevant help e.g. `help ctrl-k` will
+    # look for "ctrl-k", "c_ctrl-k", "i_ctrl-k", etc. Another example is `:help
+    # copy` will look for "copy" then ":copy". Also checks lowercase variants
+    # e.g. ctrl-k", "c_ctrl-k, etc., and uppercase variants e.g. CTRL-K",
+    # "C_CTRL-K, etc.
+    #
+    # Args:
+    #   subject (str):
+    #   index (dict): Defaults to the help index.
+    #
+    # Returns:
+    #   str|None: The tag, or None if no tag is found.
+    if index is None:
+        index = _get_index()
+
+    subject = _SUBJECT_REPLACEMENTS.get(subject, subject)
+    if subject in index['tags']:
+        return subject
+
+    candidates = [subject]
+
+    if subject.lower() not in candidates:
+        candidates.append(subject.lower())
+
+    if subject.upper() not in candidates:
+        candidates.append(subject.upper())
+
+    ctrl_key = re.sub('ctrl-([a-zA-Z])', lambda m: 'CTRL-' + m.group(1).upper(), subject)
+    if ctrl_key not in candidates:
+        candidates.append(ctrl_key)
+
+    # The candidates only differ by case, so they all have the same key. The
+    # nearest tag has the first prefix, then the first candidate.
+    found = None
+    for i, tag in index['keys'].get(subject.lower(), ()):
+        name = tag[len(_PREFIXES[i]):]
+        if name in candidates:
+            rank = (i, candidates.index(name))
+            if not found or rank < found[0]:
+                found = (rank, tag)
+
+    return found[1] if found else None
+
+
+def goto_help_tag(window, tag: str) -> None:
+    index = _get_index()
+    help_file, help_tag = index['tags'][tag]
+
+    if not _is_doc_file(help_file):
+        # This should only happen if the help "tags" file is out of date.
+        status_message('Sorry, help file "%s" not found' % help_file)
+        return
+
+    view = open_help_view(window, help_file)
+
+    # Format the tag so that we can
+    # do a literal search rather
+    # than regular expression.
+    literal = _tag_literal(help_tag)
+
+    offsets = index['offsets'].get(help_file)
+    if offsets is None:
+        offsets = _find_tag_offsets(index, help_file, view.substr(Region(0, view.size())))
+
+    tag_region = None
+    offset = offsets.get(tag)
+    if offset is not None:
+        tag_region = Region(offset, offset + len(literal))
+        if view.substr(tag_region) != literal:
+            tag_region = None
+
+    if not tag_region:
+        tag_region = view_find(view, literal, 0, LITERAL)
+        if not tag_region:
+            # This should only happen if the help "tags" file is out of date.
+            tag_region = Region(0)
+
+    # Add one point so that the cursor is
+    # on the tag rather than the tag
+    # punctuation star character.
+    _show_help_point(view, tag_region.begin() + 1)
+
+
+def _show_help_point(view, c_pt: int) -> None:
+    set_selection(view, c_pt)
+    view.show(c_pt, False)
+
+    # Fixes #420 show() doesn't work properly when the Sublime Text
+    # animation_enabled is true, which the default in Sublime.
+    xy = view.text_to_layout(view.text_point(view.rowcol(c_pt)[0], 0))
+    view.set_viewport_position(xy)
+
+
+def _tag_literal(help_tag: str) -> str:
+    return help_tag.lstrip('/').replace('\\/', '/').replace('\\\\', '\\')
+
+
+def _find_tag_offsets(index: dict, help_file: str, text: str) -> dict:
+    # Find the offsets of all the tags in a help file at once, and cache them,
+    # so that jumping to any tag in the file doesn't need a search.
+    offsets = {}
+    for tag, (tag_file, help_tag) in index['tags'].items():
+        if tag_file == help_file:
+            offset = text.find(_tag_literal(help_tag))
+            if offset > -1:
+                offsets[tag] = offset
+
+    index['offsets'][help_file] = offsets
+    _save_index(index)
+
+    return offsets
+
+
+def _is_doc_file(help_file: str) -> bool:
+    return help_file in _get_doc_files()
+
+
+def _get_doc_files() -> set:
+    if not _doc_files:
+        _doc_files.update(r[len(_DOC_PATH):] for r in find_resources('*.txt') if r.startswith(_DOC_PATH))
+
+    return _doc_files
+
+
+def open_help_view(window, help_file: str):
+    # Open a help file in the window's help view.
+    #
+    # The window's help view is reused, like Vim's help window, and its content
+    # is only replaced if it's showing another help file.
+    #
+    # Returns:
+    #   View
+    help_view_name = '%s [vim help]' % (help_file)
+
+    view = None
+    for v in window.views():
+        if v.name().endswith(' [vim help]'):
+            view = v
+            if v.name() == help_view_name:
+                break
+
+    if view:
+        window.focus_view(view)
+        if view.name() == help_view_name:
+            return view
+    else:
+        view = window.new_file()
+        view.set_scratch(True)
+        settings = view.settings()
+        settings.set('auto_complete', False)
+        settings.set('auto_indent', False)
+        settings.set('auto_match_enabled', False)
+        settings.set('draw_centered', False)
+        settings.set('draw_indent_guides', False)
+        settings.set('draw_white_space', 'none')
+        settings.set('line_numbers', False)
+        settings.set('match_selection', False)
+        settings.set('rulers', [])
+        settings.set('scroll_past_end', False)
+        settings.set('smart_indent', False)
+        settings.set('tab_size', 8)
+        settings.set('translate_tabs_to_spaces', False)
+        settings.set('trim_automatic_white_space', False)
+        settings.set('word_wrap', False)
+        view.assign_syntax('Packages/NeoVintageous/res/Help.sublime-syntax')
+
+    view.set_name(help_view_name)
+    view.set_read_only(False)
+    view.run_command('nv_view', {'action': 'replace_content', 'text': load_resource(_DOC_PATH + help_file)})
+    view.set_read_only(True)
+
+    return view
+
+
+# The helpgrep index is an inverted index of the words in the help files. It
+# maps the lowercase of each word to the numbers of the lines it's in, where
+# the lines of all the help files are numbered in order, e.g. {"copy": [3, 9,
+# 12]}. The line numbers are stored as deltas to keep the cache small, e.g.
+# {"copy": [3, 6, 3]}, and decoded as they're looked up. Building the index
+# means reading all the help files, so it's built on a worker thread and it's
+# cached in a file next to the session file.
+_GREP_VERSION = 1
+
+# Literal words shorter than this that may be part of a longer word match too
+# many words in the index to narrow the search.
+_GREP_MIN_PARTIAL_WORD = 3
+
+_grep = {
+    'index': None,
+    'waiting': [],
+}  # type: dict
+
+_grep_lock = threading.Lock()
+
+_doc_lines = {}  # type: dict
+
+
+def _get_grep_cache_file() -> str:
+    return _get_cache_file() + 'grep'
+
+
+def build_grep_index(docs: list) -> dict:
+    # Args:
+    #   docs (list[tuple[str, str]]): The name and text of each help file.
+    index = {
+        'version': _GREP_VERSION,
+        'stamp': None,
+        'files': [],
+        'words': {},
+    }  # type: dict
+
+    words = {}  # type: dict
+    line_number = 0
+    for help_file, text in docs:
+        index['files'].append([help_file, line_number])
+        for line in text.split('\n'):
+            for word in set(re.findall('\\w+', line.lower())):
+                words.setdefault(word, []).append(line_number)
+
+            line_number += 1
+
+    for word, lines in words.items():
+        index['words'][word] = [lines[0]] + [b - a for a, b in zip(lines, lines[1:])]
+
+    return index
+
+
+def _load_grep_index() -> dict:
+    stamp = _get_tags_stamp()
+    if stamp:
+        try:
+            with open(_get_grep_cache_file(), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            if index.get('version') == _GREP_VERSION and index.get('stamp') == stamp:
+                return index
+        except (OSError, ValueError):
+            pass
+
+    index = build_grep_index([(help_file, _get_doc_text(help_file)) for help_file in sorted(_get_doc_files())])
+    index['stamp'] = stamp
+
+    if stamp:
+        cache_file = _get_grep_cache_file()
+        tmp_file = cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, separators=(',', ':'))
+
+            os.replace(tmp_file, cache_file)
+        except OSError:  # pragma: no cover
+            traceback.print_exc()
+
+    return index
+
+
+def _with_grep_index(callback) -> None:
+    # Calls callback with the helpgrep index on the main thread, loading or
+    # building the index on a worker thread the first time.
+    with _grep_lock:
+        if _grep['index']:
+            callback(_grep['index'])
+            return
+
+        _grep['waiting'].append(callback)
+        if len(_grep['waiting']) > 1:
+            return
+
+    def _load() -> None:
+        try:
+            index = _load_grep_index()
+        except Exception:  # pragma: no cover
+            traceback.print_exc()
+            index = None
+
+        with _grep_lock:
+            _grep['index'] = index
+            waiting = _grep['waiting']
+            _grep['waiting'] = []
+
+        if index:
+            for callback in waiting:
+                set_timeout(lambda callback=callback: callback(index), 0)
+
+    thread = threading.Thread(target=_load)
+    thread.daemon = True
+    thread.start()
+
+
+def _get_doc_text(help_file: str) -> str:
+    return load_resource(_DOC_PATH + help_file)
+
+
+def _get_doc_lines(help_file: str) -> list:
+    try:
+        return _doc_lines[help_file]
+    except KeyError:
+        lines = _doc_lines[help_file] = _get_doc_text(help_file).split('\n')
+
+        return lines
+
+
+def _literal_words(pattern: str, flags: int) -> list:
+    # Find the words that every match of the pattern must contain.
+    #
+    # Returns:
+    #   list[tuple[str, bool, bool]]: The lowercase words, and whether each is
+    #       a whole word at the start and at the end.
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return []
+
+    # Only the literals at the top level are required: anything else could be
+    # repeated zero times, or be one of alternatives.
+    runs = ['']
+    for op, av in parsed:
+        if op == sre_parse.LITERAL:
+            runs[-1] += chr(av)
+        elif runs[-1]:
+            runs.append('')
+
+    words = []
+    for run in runs:
+        run = run.lower()
+        for match in re.finditer('\\w+', run):
+            words.append((match.group(0), match.start() > 0, match.end() < len(run)))
+
+    return words
+
+
+def _candidate_lines(index: dict, pattern: str, flags: int):
+    # Returns:
+    #   set|None: The numbers of the lines that may match the pattern, or None
+    #       if the index can't narrow the lines down.
+    candidates = None
+    for word, start, end in _literal_words(pattern, flags):
+        if start and end:
+            keys = [word] if word in index['words'] else []
+        elif len(word) < _GREP_MIN_PARTIAL_WORD:
+            continue
+        elif start:
+            keys = [k for k in index['words'] if k.startswith(word)]
+        elif end:
+            keys = [k for k in index['words'] if k.endswith(word)]
+        else:
+            keys = [k for k in index['words'] if word in k]
+
+        lines = set()  # type: set
+        for key in keys:
+            lines.update(accumulate(index['words'][key]))
+
+        candidates = lines if candidates is None else candidates & lines
+        if not candidates:
+            break
+
+    return candidates
+
+
+def grep_help(index: dict, pattern) -> list:
+    # Search the help files.
+    #
+    # Args:
+    #   index (dict): The helpgrep index.
+    #   pattern (Pattern): A compiled regular expression.
+    #
+    # Returns:
+    #   list[tuple[str, int, str]]: The help file, line number, and line of
+    #       each matching line.
+    matches = []
+    candidates = _candidate_lines(index, pattern.pattern, pattern.flags)
+    if candidates is None:
+        for help_file, first in index['files']:
+            for n, line in enumerate(_get_doc_lines(help_file)):
+                if pattern.search(line):
+                    matches.append((help_file, n, line))
+
+        return matches
+
+    starts = [first for help_file, first in index['files']]
+    for number in sorted(candidates):
+        help_file, first = index['files'][bisect_right(starts, number) - 1]
+        line = _get_doc_lines(help_file)[number - first]
+        if pattern.search(line):
+            matches.append((help_file, number - first, line))
+
+    return matches
+
+
+def helpgrep(window, pattern: str) -> None:
+    # Search the help files, and show the matching lines in a quick panel. The
+    # pattern is a regular expression, and like Vim's :helpgrep, case matters
+    # unless the pattern contains \c.
+    flags = 0
+    if '\\c' in pattern:
+        flags |= re.IGNORECASE
+
+    pattern = pattern.replace('\\c', '').replace('\\C', '')
+
+    try:
+        compiled_pattern = re.compile(pattern, flags)
+    except Exception as e:
+        status_message('[regex error]: {} ... in pattern {}'.format(str(e), pattern))
+        return
+
+    def _show(index: dict) -> None:
+        matches = grep_help(index, compiled_pattern)
+        if not matches:
+            status_message('E480: No match: %s' % pattern)
+            return
+
+        def on_done(i: int) -> None:
+            if i >= 0:
+                help_file, n = matches[i][:2]
+                view = open_help_view(window, help_file)
+                _show_help_point(view, view.text_point(n, 0))
+
+        status_message('%d matches' % len(matches))
+        window.show_quick_panel(
+            [[line.strip() or help_file, '%s:%d' % (help_file, n + 1)] for help_file, n, line in matches],
+            on_done,
+            MONOSPACE_FONT
+        )
+
+    if not _grep['index']:
+        status_message('Building the help index...')
+
+    _with_grep_index(_show)
@@ -15,12 +15,18 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from bisect import bisect_left
+from bisect import insort
+from collections import OrderedDict
+
 from sublime import Region
 
+from NeoVintageous.nv.options import get_option
+from NeoVintageous.nv.session import maybe_do_runtime_save_session_changes
 from NeoVintageous.nv.session import set_session_value
 
-# TODO Implement 'history' option so that the number of history entries
-# remembered can be configured.
+# The maximum number of history entries remembered. The 'history' option can
+# lower the number of entries, but it can't exceed this.
 _MAX_ITEMS = 10000
 
 
@@ -76,6 +82,76 @@ _storage = {
 }  # type: dict
 
 
+class _HistoryItems(OrderedDict):
+
+    # The history items of a history type, ordered from oldest to newest, with
+    # a reverse index of the items so that finding an existing item doesn't
+    # need to scan all the entries, and a sorted list of the keys so that an
+    # entry can be looked up by its index. The keys are the entry numbers, so
+    # the newest entry has the largest key. It compares equal to, and is
+    # serialized as, the plain dict of items that is stored in the session.
+
+    def __init__(self, *args, **kwargs):
+        self._keys = {}  # type: dict
+        self._order = []  # type: list
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value) -> None:
+        if key in self:
+            self.__forget(key)
+        elif not self._order or key > self._order[-1]:
+            self._order.append(key)
+        else:
+            insort(self._order, key)
+
+        super().__setitem__(key, value)
+        self._keys[value] = key
+
+    def __delitem__(self, key) -> None:
+        self.__forget(key)
+        super().__delitem__(key)
+        del self._order[bisect_left(self._order, key)]
+
+    def __forget(self, key) -> None:
+        value = self[key]
+        if self._keys.get(value) == key:
+            del self._keys[value]
+
+    def key_of(self, value):
+        # Returns:
+        #   The key of value, or None if value isn't in the history.
+        key = self._keys.get(value)
+        if key is not None and key in self:
+            return key
+
+        return None
+
+    def key_at(self, index: int):
+        # Resolve a negative index, where -1 is the newest entry.
+        #
+        # Raises:
+        #   IndexError: If there is no entry at index.
+        if index < 0:
+            return self._order[index]
+
+        raise IndexError('history index out of range')
+
+
+def _get_items(history_type: int) -> _HistoryItems:
+    # The items of a history type are plain dicts when they are loaded from the
+    # session or reset, so they are converted the first time they are needed.
+    items = _storage[history_type]['items']
+    if not isinstance(items, _HistoryItems):
+        items = _HistoryItems((k, items[k]) for k in sorted(items))
+        _storage[history_type]['items'] = items
+
+    return items
+
+
+def _get_max_items() -> int:
+    return min(get_option(None, 'history'), _MAX_ITEMS)
+
+
 def _char2type(char: str) -> int:
     try:
         return _CHAR2TYPE[char]
@@ -134,23 +210,34 @@ def history_add(history: str, item: str) -> int:
     #
     # Returns:
     #   int: 1 for a successful operation, otherwise 0
-    if _MAX_ITEMS == 0:
+    max_items = _get_max_items()
+    if max_items == 0:
         return 0
 
     history_type = history_get_type(history)
+    items = _get_items(history_type)
+    changes = []
 
-    pending_deletes = [k for k, v in _storage[history_type]['items'].items() if v == item]
-    for pending_delete in pending_deletes:
-        del _storage[history_type]['items'][pending_delete]
+    pending_delete = items.key_of(item)
+    if pending_delete is not None:
+        del items[pending_delete]
+        changes.append([['history', history_type, 'items', pending_delete]])
 
     _storage[history_type]['num'] += 1
-    _storage[history_type]['items'][_storage[history_type]['num']] = item
+    num = _storage[history_type]['num']
+    items[num] = item
+
+    changes.append([['history', history_type, 'num'], num])
+    changes.append([['history', history_type, 'items', num], item])
 
-    if len(_storage[history_type]['items']) > _MAX_ITEMS:
-        del _storage[history_type]['items'][min(_storage[history_type]['items'].keys())]
+    while len(items) > max_items:
+        evict = next(iter(items))
+        del items[evict]
+        changes.append([['history', history_type, 'items', evict]])
 
     # TODO Refactor history _storage to use session store directly i.e. remove the need for the _storage variable.
-    set_session_value('history', _storage, persist=True)
+    set_session_value('history', _storage)
+    maybe_do_runtime_save_session_changes(*changes)
 
     return 1
 
@@ -187,13 +274,12 @@ def history_del(history: str, item=None) -> int:
     else:
         if isinstance(item, int):
             try:
+                items = _get_items(history_type)
                 if item >= 0:
-                    del _storage[history_type]['items'][item]
+                    del items[item]
                     ret = 1
                 else:
-                    keys = sorted(_storage[history_type]['items'].keys())
-                    key_index = keys[item]
-                    del _storage[history_type]['items'][key_index]
+                    del items[items.key_at(item)]
                     ret = 1
             except (KeyError, IndexError):
                 ret = 0
@@ -222,13 +308,13 @@ def history_get(history: str, index: int = -1) -> str:
         return ''
 
     try:
+        items = _get_items(history_type)
+
         # A positive int represents the absolute index of an entry.
         if index >= 0:
-            ret = _storage[history_type]['items'][index]
+            ret = items[index]
         else:
-            keys = sorted(_storage[history_type]['items'].keys())
-            key_index = keys[index]
-            ret = _storage[history_type]['items'][key_index]
+            ret = items[items.key_at(index)]
 
     except Exception:
         ret = ''
@@ -253,9 +339,9 @@ def history_nr(history: str) -> int:
     if history_type == _HIST_INVALID:
         return -1
 
-    items = _storage[history_type]['items'].keys()
+    items = _get_items(history_type)
     if len(items) > 0:
-        num = max(items)
+        num = next(reversed(items))
     else:
         num = -1
 
@@ -268,9 +354,8 @@ def history(name: str) -> str:
     #
     # Returns:
     #   str:
-
-    # TODO use 'history' option (default=50)
-    # TODO if 'history' option is 0 then print message "'history' option is zero"
+    if _get_max_items() == 0:
+        return "'history' option is zero"
 
     if name == 'all':
         history_types = sorted([_HIST_CMD, _HIST_EXPR, _HIST_INPUT, _HIST_DEBUG, _HIST_SEARCH])
@@ -293,12 +378,12 @@ def history(name: str) -> str:
 
     for history_type in history_types:
         name = type2name[history_type]
-        contents = _storage[history_type]['items']
+        contents = _get_items(history_type)
         count = len(contents)
 
         # TODO initial padding should be size of max history width
         buf.append('%6s  %s history' % ('#', name))
-        for i, number in enumerate(sorted(contents, reverse=False), start=1):
+        for i, number in enumerate(contents, start=1):
             if i == count:
                 buf.append('>%5d  %s' % (number, contents[number]))
             else:
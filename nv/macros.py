@@ -21,7 +21,7 @@ from string import digits
 from NeoVintageous.nv.polyfill import erase_status
 from NeoVintageous.nv.polyfill import set_status
 from NeoVintageous.nv.session import get_session_value
-from NeoVintageous.nv.session import maybe_do_runtime_save_session
+from NeoVintageous.nv.session import maybe_do_runtime_save_session_changes
 from NeoVintageous.nv.session import set_session_value
 from NeoVintageous.nv.settings import get_glue_until_normal_mode
 
@@ -55,14 +55,14 @@ def stop_recording() -> None:
         steps = _get_steps()
         if steps:
             macros[name] = steps
+            maybe_do_runtime_save_session_changes([['macros', name], steps])
         else:
             try:
                 del macros[name]
+                maybe_do_runtime_save_session_changes([['macros', name]])
             except KeyError:
                 pass
 
-        maybe_do_runtime_save_session()
-
     _data['recording'] = False
     _data['recording_steps'] = []
     _data['recording_register'] = None
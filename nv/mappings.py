@@ -20,6 +20,7 @@ import re
 import traceback
 
 from NeoVintageous.nv import plugin
+from NeoVintageous.nv import trace
 from NeoVintageous.nv.settings import get_mode
 from NeoVintageous.nv.settings import get_partial_sequence
 from NeoVintageous.nv.settings import is_plugin_enabled
@@ -50,6 +51,90 @@ _mappings = {
 }  # type: dict
 
 
+class _PrefixTrie:
+
+    # A prefix trie of the mapping sequences for a single mode. Each node
+    # counts the mappings reachable through it, keyed by file type, where the
+    # empty string key counts the mappings that apply to all file types. This
+    # makes partial match lookups proportional to the length of the sequence
+    # rather than to the number of mappings.
+
+    __slots__ = ('children', 'counts')
+
+    def __init__(self):
+        self.children = {}  # type: dict
+        self.counts = {}  # type: dict
+
+    def update(self, lhs: str, file_types, delta: int) -> None:
+        node = self
+        for char in lhs:
+            node._update_counts(file_types, delta)
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _PrefixTrie()
+            node = child
+
+        node._update_counts(file_types, delta)
+
+        if delta < 0:
+            self._prune(lhs)
+
+    def _update_counts(self, file_types, delta: int) -> None:
+        for file_type in file_types:
+            count = self.counts.get(file_type, 0) + delta
+            if count > 0:
+                self.counts[file_type] = count
+            else:
+                self.counts.pop(file_type, None)
+
+    def _prune(self, lhs: str) -> None:
+        node = self
+        for char in lhs:
+            child = node.children.get(char)
+            if child is None:
+                return
+
+            if not child.counts:
+                del node.children[char]
+                return
+
+            node = child
+
+    def has_prefix(self, lhs: str, file_type: str) -> bool:
+        node = self
+        for char in lhs:
+            node = node.children.get(char)
+            if node is None:
+                return False
+
+        if '' in node.counts:
+            return True
+
+        return bool(file_type) and file_type in node.counts
+
+
+# The prefix tries are kept in step with the mappings table by mappings_add(),
+# mappings_remove(), and clear_mappings(); the table remains the source of truth
+# for full matches and the trie is only used to resolve partial matches.
+_mappings_index = {mode: _PrefixTrie() for mode in _mappings}  # type: dict
+
+
+def _file_types_of(rhs) -> tuple:
+    if isinstance(rhs, str):
+        return ('',)
+
+    return tuple(rhs)
+
+
+def _index_replace(mode: str, lhs: str, old_rhs, new_rhs) -> None:
+    index = _mappings_index[mode]
+    if old_rhs is not None:
+        index.update(lhs, _file_types_of(old_rhs), -1)
+
+    if new_rhs is not None:
+        index.update(lhs, _file_types_of(new_rhs), 1)
+
+
 class Mapping:
 
     def __init__(self, lhs: str, rhs: str):
@@ -62,20 +147,7 @@ class IncompleteMapping:
 
 
 def _has_partial_matches(view, mode: str, lhs: str) -> bool:
-    for map_lhs, map_rhs in _mappings[mode].items():
-        if isinstance(map_rhs, str):
-            if map_lhs.startswith(lhs):
-                return True
-        else:
-            file_type = get_file_type(view)
-            if file_type and file_type in map_rhs:
-                if map_lhs.startswith(lhs):
-                    return True
-            elif '' in map_rhs:
-                if map_lhs.startswith(lhs):
-                    return True
-
-    return False
+    return _mappings_index[mode].has_prefix(lhs, get_file_type(view))
 
 
 def _find_full_match(view, mode: str, lhs: str):
@@ -114,24 +186,34 @@ def mappings_add(mode: str, lhs: str, rhs: str) -> None:
                 match = _mappings[mode].get(file_type_lhs_norm)
 
                 if not match:
-                    _mappings[mode][file_type_lhs_norm] = {}
+                    new_match = {}  # type: dict
                 elif isinstance(match, str):
-                    _mappings[mode][file_type_lhs_norm] = {'': match}
+                    new_match = {'': match}
+                else:
+                    new_match = dict(match)
 
-                _mappings[mode][file_type_lhs_norm][file_type] = file_type_rhs
+                new_match[file_type] = file_type_rhs
+                _mappings[mode][file_type_lhs_norm] = new_match
+                _index_replace(mode, file_type_lhs_norm, match, new_match)
 
             return
 
-    _mappings[mode][_normalise_lhs(lhs)] = rhs
+    lhs = _normalise_lhs(lhs)
+    match = _mappings[mode].get(lhs)
+    _mappings[mode][lhs] = rhs
+    _index_replace(mode, lhs, match, rhs)
 
 
 def mappings_remove(mode: str, lhs: str) -> None:
-    del _mappings[mode][_normalise_lhs(lhs)]
+    lhs = _normalise_lhs(lhs)
+    match = _mappings[mode].pop(lhs)
+    _index_replace(mode, lhs, match, None)
 
 
 def clear_mappings() -> None:
     for mode in _mappings:
         _mappings[mode] = {}
+        _mappings_index[mode] = _PrefixTrie()
 
 
 def mappings_can_resolve(view, key: str) -> bool:
@@ -165,6 +247,8 @@ def _seq_to_command(view, seq: str, mode: str):
     # Returns:
     #   ViCommandDefBase
     #   CommandNotFound
+    plugin.load_plugins(view)
+
     if mode in plugin.mappings:
         plugin_command = plugin.mappings[mode].get(seq)
         if plugin_command:
@@ -231,6 +315,10 @@ def mappings_resolve(view, sequence: str = None, mode: str = None, check_user_ma
     if not command:
         command = _seq_to_command(view, to_bare_command_name(seq), mode or get_mode(view))
 
-    _log.info('resolved %s mode=%s sequence=%s %s', command, mode, sequence, command.__class__.__mro__)
+    if trace.log_info:
+        _log.info('resolved %s mode=%s sequence=%s %s', command, mode, sequence, command.__class__.__mro__)
+
+    if trace.enabled:
+        trace.record('resolve', seq, mode, command.__class__.__name__)
 
     return command
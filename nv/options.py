@@ -21,7 +21,10 @@ import sys
 from sublime import active_window
 from sublime import load_settings
 
+from NeoVintageous.nv.settings import clear_settings_cache
 from NeoVintageous.nv.settings import get_setting
+from NeoVintageous.nv.settings import get_view_setting
+from NeoVintageous.nv.settings import is_sourcing
 
 
 _session = {}  # type: dict
@@ -49,6 +52,11 @@ class Option():
         try:
             value = _session[self._name]
         except KeyError:
+            # Global options, such as 'history', are also read where there is
+            # no view, in which case there are no view settings to fall back to.
+            if view is None:
+                return self._default
+
             # DEPRECATED This is for backwards compatability only. All options
             # should be set by the .neovintageousrc configuration file.
             # See https://github.com/NeoVintageous/NeoVintageous/issues/404.
@@ -65,8 +73,16 @@ class BooleanOption(Option):
 
 class NumberOption(Option):
 
+    def __init__(self, name: str, default, maximum=None):
+        super().__init__(name, default)
+        self._maximum = maximum
+
     def _filter_validate(self, value):
-        return int(value)
+        value = int(value)
+        if self._maximum is not None and not 0 <= value <= self._maximum:
+            raise ValueError('invalid argument')
+
+        return value
 
 
 class StringOption(Option):
@@ -106,12 +122,14 @@ class BooleanViewOption(BooleanOption):
         if value:
             if current_value not in self._on:
                 settings.set(self._name, self._on[0])
+                _clear_settings_cache(view)
         else:
             if current_value not in self._off:
                 settings.set(self._name, self._off[0])
+                _clear_settings_cache(view)
 
     def _get(self, view):
-        value = _resolve_settings(view).get(self._name)
+        value = _get_view_setting(view, self._name)
 
         if value in self._on:
             value = True
@@ -131,9 +149,10 @@ class NumberViewOption(NumberOption):
         current_value = settings.get(self._name)
         if value != current_value:
             settings.set(self._name, value)
+            _clear_settings_cache(view)
 
     def _get(self, view):
-        return _resolve_settings(view).get(self._name, self._default)
+        return _get_view_setting(view, self._name, self._default)
 
 
 def get_window_ui_element_visible(name: str, window=None) -> None:
@@ -177,6 +196,7 @@ _options = {
     'belloff': StringOption('belloff', '', select=('', 'all')),
     'equalalways': BooleanOption('equalalways', True),
     'expandtab': BooleanViewOption('translate_tabs_to_spaces', on=True, off=False),
+    'history': NumberOption('history', 10000, maximum=10000),
     'hlsearch': BooleanOption('hlsearch', True),
     'ignorecase': BooleanOption('ignorecase', False),
     'incsearch': BooleanOption('incsearch', True),
@@ -190,6 +210,7 @@ _options = {
     'relativenumber': BooleanViewOption('relative_line_numbers'),
     'scrolloff': NumberViewOption('scroll_context_lines', 0),
     'shell': StringOption('shell', _get_default_shell()),
+    'shelltimeout': NumberOption('shelltimeout', 0),  # {not in Vim}
     'sidebar': BooleanIsVisibleOption('sidebar', True),  # {not in Vim}
     'sidescrolloff': NumberOption('sidescrolloff', 5),
     'smartcase': BooleanOption('smartcase', False),
@@ -206,6 +227,7 @@ _OPTION_ALIASES = {
     'ai': 'autoindent',
     'bo': 'belloff',
     'et': 'expandtab',
+    'hi': 'history',
     'hls': 'hlsearch',
     'ic': 'ignorecase',
     'is': 'incsearch',
@@ -288,7 +310,20 @@ def clear_options() -> None:
 
 
 def _resolve_settings(view):
-    if view.window().settings().get('_nv_sourcing'):
+    # The rc files set the preferences, instead of the view settings.
+    if is_sourcing():
         return load_settings('Preferences.sublime-settings')
 
     return view.settings()
+
+
+def _get_view_setting(view, name: str, default=None):
+    if is_sourcing():
+        return load_settings('Preferences.sublime-settings').get(name, default)
+
+    return get_view_setting(view, name, default)
+
+
+def _clear_settings_cache(view) -> None:
+    # Setting the preferences changes the settings of all the views.
+    clear_settings_cache(None if is_sourcing() else view)
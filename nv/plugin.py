@@ -15,6 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from importlib import import_module
+from functools import partial
+
+from sublime_plugin import TextCommand
+
+from NeoVintageous.nv.settings import is_plugin_enabled
+from NeoVintageous.nv.vi.keys import CommandDefs as _CommandDefs
 from NeoVintageous.nv.vim import INSERT as _INSERT
 from NeoVintageous.nv.vim import NORMAL as _NORMAL
 from NeoVintageous.nv.vim import OPERATOR_PENDING as _OPERATOR_PENDING
@@ -24,14 +31,23 @@ from NeoVintageous.nv.vim import VISUAL_BLOCK as _VISUAL_BLOCK
 from NeoVintageous.nv.vim import VISUAL_LINE as _VISUAL_LINE
 
 
+__all__ = [
+    'nv_abolish_command',
+    'nv_commentary_command',
+    'nv_sneak_command',
+    'nv_surround_command',
+    'nv_unimpaired_command',
+]
+
+
 mappings = {
-    _INSERT: {},
-    _NORMAL: {},
-    _OPERATOR_PENDING: {},
-    _SELECT: {},
-    _VISUAL: {},
-    _VISUAL_BLOCK: {},
-    _VISUAL_LINE: {}
+    _INSERT: _CommandDefs(),
+    _NORMAL: _CommandDefs(),
+    _OPERATOR_PENDING: _CommandDefs(),
+    _SELECT: _CommandDefs(),
+    _VISUAL: _CommandDefs(),
+    _VISUAL_BLOCK: _CommandDefs(),
+    _VISUAL_LINE: _CommandDefs()
 }  # type: dict
 
 
@@ -45,7 +61,8 @@ def register(seq: str, modes: tuple, *args, **kwargs):
     The registered key sequence must be known to NeoVintageous. The
     registered command must be a ViMotionDef or ViOperatorDef.
 
-    The decorated class is instantiated with `*args` and `**kwargs`.
+    The decorated class is instantiated with `*args` and `**kwargs` when
+    it's first looked up.
 
     @keys
       A list of (`mode`, `sequence`) pairs to map the decorated
@@ -53,7 +70,76 @@ def register(seq: str, modes: tuple, *args, **kwargs):
     """
     def inner(cls):
         for mode in modes:
-            mappings[mode][seq] = cls(*args, **kwargs)
+            mappings[mode][seq] = partial(cls, *args, **kwargs)
             classes[cls.__name__] = cls
         return cls
     return inner
+
+
+# The plugins are not imported at startup. A plugin is imported the first time
+# a key sequence is resolved in a view in which the plugin is enabled, which
+# registers its key sequences. The plugins' Sublime Text commands are stubs
+# that import the plugin and run the plugin's command.
+_PLUGINS = (
+    'abolish',
+    'commentary',
+    'multiple_cursors',
+    'sneak',
+    'sublime',
+    'surround',
+    'unimpaired',
+)
+
+_loaded = set()  # type: set
+
+
+def load_plugins(view=None) -> None:
+    # Import the plugins that are enabled in the view, or all the plugins if
+    # no view is given.
+    if len(_loaded) == len(_PLUGINS):
+        return
+
+    for name in _PLUGINS:
+        if name not in _loaded and (view is None or is_plugin_enabled(view, name)):
+            _load_plugin(name)
+
+
+def _load_plugin(name: str):
+    module = import_module('NeoVintageous.nv.plugin_' + name)
+    _loaded.add(name)
+
+    return module
+
+
+def _run_plugin_command(command, name: str, edit, kwargs: dict) -> None:
+    getattr(_load_plugin(name), command.__class__.__name__)(command.view).run(edit, **kwargs)
+
+
+class nv_abolish_command(TextCommand):
+
+    def run(self, edit, **kwargs):
+        _run_plugin_command(self, 'abolish', edit, kwargs)
+
+
+class nv_commentary_command(TextCommand):
+
+    def run(self, edit, **kwargs):
+        _run_plugin_command(self, 'commentary', edit, kwargs)
+
+
+class nv_sneak_command(TextCommand):
+
+    def run(self, edit, **kwargs):
+        _run_plugin_command(self, 'sneak', edit, kwargs)
+
+
+class nv_surround_command(TextCommand):
+
+    def run(self, edit, **kwargs):
+        _run_plugin_command(self, 'surround', edit, kwargs)
+
+
+class nv_unimpaired_command(TextCommand):
+
+    def run(self, edit, **kwargs):
+        _run_plugin_command(self, 'unimpaired', edit, kwargs)
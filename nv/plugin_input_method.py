@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+import threading
+
 from NeoVintageous.nv.listener import register
 from NeoVintageous.nv.settings import get_setting
 from NeoVintageous.nv.shell import read
@@ -25,10 +27,72 @@ from NeoVintageous.nv.vim import REPLACE
 __all__ = []  # type: list
 
 
+# The number of seconds to wait for the mode to settle before switching. Rapid
+# mode changes, e.g. i<Esc>i<Esc>, are coalesced into a single switch.
+_DEBOUNCE = 0.05
+
+
 class IMSwitcher():
 
     saved_im = ''
 
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._pending = None
+        self._worker = None
+        # Whether the input method was last switched for an insert mode, or
+        # None if it hasn't been switched yet.
+        self._insert = None
+
+    def schedule(self, view, new_mode: str) -> None:
+        # Switch the input method on a background worker, so that a mode change
+        # doesn't wait for the switch commands.
+        if not _is_enabled(view):
+            return
+
+        with self._cond:
+            self._pending = (view, new_mode)
+            self._idle.clear()
+            if not self._worker:
+                self._worker = threading.Thread(target=self._work)
+                self._worker.daemon = True
+                self._worker.start()
+
+            self._cond.notify()
+
+    def wait(self, timeout: float = None) -> bool:
+        # Wait for the scheduled switches to finish.
+        #
+        # Returns:
+        #   bool: False if the timeout expired, otherwise True.
+        return self._idle.wait(timeout)
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._idle.set()
+                    self._cond.wait()
+
+                # Debounce: wait until no other mode change is scheduled.
+                pending = None
+                while pending is not self._pending:
+                    pending = self._pending
+                    self._cond.wait(_DEBOUNCE)
+
+                self._pending = None
+
+            view, new_mode = pending
+            insert = new_mode in (INSERT, REPLACE)
+
+            # The mode flipped back before it settled, so the input method is
+            # already right for it.
+            if insert != self._insert:
+                self._insert = insert
+                self.run(view, new_mode)
+
     def run(self, view, new_mode: str) -> None:
         if not _is_enabled(view):
             return
@@ -88,10 +152,10 @@ class Listener():
         self.switcher = switcher
 
     def on_insert_enter(self, view, prev_mode: str) -> None:
-        self.switcher.run(view, INSERT)
+        self.switcher.schedule(view, INSERT)
 
     def on_insert_leave(self, view, new_mode: str) -> None:
-        self.switcher.run(view, new_mode)
+        self.switcher.schedule(view, new_mode)
 
 
 register(
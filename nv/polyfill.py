@@ -185,15 +185,48 @@ def view_find(view, pattern: str, start_pt: int, flags: int = 0):
     return match
 
 
+# The size, in characters, of the first chunk of a reverse search. Each chunk
+# after that is twice the size of the previous one, so that nearby matches are
+# found without searching the whole buffer and far away matches are found in a
+# small number of chunks.
+_RFIND_CHUNK_SIZE = 4096
+
+
+def _rfind_chunks(view, start_pt: int, stop_pt: int = 0):
+    # Yields the (begin, end) line-aligned chunks from start_pt back to stop_pt.
+    end = start_pt
+    size = _RFIND_CHUNK_SIZE
+    while True:
+        begin = max(stop_pt, view.line(max(stop_pt, end - size)).a)
+        yield begin, end
+        if begin <= stop_pt:
+            break
+
+        end = begin
+        size *= 2
+
+
 # There's no Sublime API to find patterns in reverse direction.
 # @see https://github.com/SublimeTextIssues/Core/issues/245
-def view_rfind_all(view, pattern: str, start_pt: int, flags: int = 0):
-    matches = view.find_all(pattern, flags)
-    for region in matches:
-        if region.b > start_pt:
-            return reversed(matches[:matches.index(region)])
+#
+# Lazily yields the matches that end at or before start_pt, and begin at or
+# after stop_pt, nearest first. The buffer is searched backward in chunks, so
+# the search stops as soon as the caller has the match it was looking for.
+def view_rfind_all(view, pattern: str, start_pt: int, flags: int = 0, stop_pt: int = 0):
+    for begin, end in _rfind_chunks(view, start_pt, stop_pt):
+        matches = []
+        for match in view_find_iter(view, pattern, begin, flags):
+            # Matches belong to the chunk they begin in, except that the first
+            # chunk ends at the first match that ends after start_pt.
+            if end == start_pt:
+                if match.b > start_pt:
+                    break
+            elif match.a >= end:
+                break
 
-    return reversed(matches)
+            matches.append(match)
+
+        yield from reversed(matches)
 
 
 # There's no Sublime API to find a pattern in reverse direction.
@@ -253,6 +286,23 @@ def view_find_all_in_range(view, pattern: str, pos: int, endpos: int, flags: int
     return matches
 
 
+# Lazily find all matching pattern from pos to the end of the buffer, so that
+# the caller can stop, or pause, the search at any point. Like
+# view_find_all_in_range() this yields zero-length matches.
+def view_find_iter(view, pattern: str, pos: int, flags: int = 0):
+    size = view.size()
+    while pos <= size:
+        match = view.find(pattern, pos, flags)
+        if match is None or match.b == -1:
+            break
+
+        pos = match.b
+        if match.size() == 0:
+            pos += 1
+
+        yield match
+
+
 # Polyfill to work around bug in internal APIs.
 # @see https://github.com/SublimeTextIssues/Core/issues/2879
 def view_indentation_level(view, pt: int):
@@ -17,6 +17,7 @@
 
 import logging
 
+from NeoVintageous.nv import trace
 from NeoVintageous.nv.settings import get_mode
 from NeoVintageous.nv.settings import get_sequence
 from NeoVintageous.nv.settings import set_interactive
@@ -59,11 +60,15 @@ class ProcessNotationHandler():
         check_user_mappings = self.check_user_mappings
         initial_mode = get_mode(self.view)
 
-        _log.info(
-            'processing notation %s count=%s mappings=%s',
-            keys,
-            repeat_count,
-            check_user_mappings)
+        if trace.log_info:
+            _log.info(
+                'processing notation %s count=%s mappings=%s',
+                keys,
+                repeat_count,
+                check_user_mappings)
+
+        if trace.enabled:
+            trace.record('notation', keys, repeat_count)
 
         # Disable interactive prompts. For example, supress interactive input
         # collecting for the command-line and search: :ls<CR> and /foo<CR>.
@@ -74,8 +79,9 @@ class ProcessNotationHandler():
         # This ensures that undoing will leave the caret where the  first
         # editing action started. For example, 'lldl' would skip 'll' in the
         # undo history, but store the full sequence for '.' to use.
+        tokens = tokenize_keys(keys)
         leading_motions = ''
-        for key in tokenize_keys(keys):
+        for key in tokens:
             self.window.run_command('nv_feed_key', {
                 'key': key,
                 'do_eval': False,
@@ -113,13 +119,13 @@ class ProcessNotationHandler():
                 set_interactive(self.view, True)
                 return
 
-            leading_motions_len = len(list(tokenize_keys(leading_motions)))
-            keys = ''.join(list(tokenize_keys(keys))[leading_motions_len:])
+            tokens = tokens[len(tokenize_keys(leading_motions)):]
+            keys = ''.join(tokens)
 
         if not (get_motion(self.view) and not get_action(self.view)):
             with gluing_undo_groups(self.view):
                 try:
-                    for key in tokenize_keys(keys):
+                    for key in tokens:
                         if key.lower() == ESC:
                             # XXX: We should pass a mode here?
                             enter_normal_mode(self.window)
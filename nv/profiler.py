@@ -0,0 +1,149 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# The startup profiler records where the startup time goes: the time spent
+# importing each module, the time of each startup phase, e.g. sourcing the rc
+# file, and the time of each ex command sourced from the rc files.
+#
+# To enable the profiler set the following environment variable to a non-blank
+# value. The report is printed to the console when the plugin has loaded, and
+# is shown by the :NeoVintageousStartupReport command.
+#
+#   SUBLIME_NEOVINTAGEOUS_PROFILE=1
+
+from contextlib import contextmanager
+from timeit import default_timer
+import builtins
+import os
+import sys
+
+_enabled = bool(os.getenv('SUBLIME_NEOVINTAGEOUS_PROFILE'))
+
+# A list of (name, cumulative seconds, self seconds) tuples.
+_imports = []  # type: list
+
+# A list of (name, seconds) tuples.
+_phases = []  # type: list
+
+# A list of (source, line, seconds) tuples.
+_rc_lines = []  # type: list
+
+_import = None
+_stack = []  # type: list
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start() -> None:
+    # Start recording the time of the imports of NeoVintageous modules.
+    global _import
+
+    if not _enabled or _import:
+        return
+
+    _import = builtins.__import__
+    builtins.__import__ = _timed_import
+    _stack.append([[], 0.0, default_timer()])
+
+
+def stop_imports() -> None:
+    global _import
+
+    if not _import:
+        return
+
+    builtins.__import__ = _import
+    _import = None
+    _, _, start_time = _stack.pop()
+    _phases.append(('import', default_timer() - start_time))
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Only the first import of a module is timed, later imports are lookups.
+    if level or not name.startswith('NeoVintageous'):
+        return _import(name, globals, locals, fromlist, level)
+
+    # A submodule imported by name e.g. "from NeoVintageous.nv import shell".
+    if name in sys.modules:
+        names = [name + '.' + item for item in fromlist or () if name + '.' + item not in sys.modules]
+    else:
+        names = [name]
+
+    if not names:
+        return _import(name, globals, locals, fromlist, level)
+
+    frame = [names, 0.0, default_timer()]
+    _stack.append(frame)
+    try:
+        return _import(name, globals, locals, fromlist, level)
+    finally:
+        _stack.pop()
+        elapsed = default_timer() - frame[2]
+        _stack[-1][1] += elapsed
+        imported = ', '.join(name for name in names if name in sys.modules)
+        if imported:
+            _imports.append((imported, elapsed, elapsed - frame[1]))
+
+
+@contextmanager
+def phase(name: str):
+    # Record the time of a startup phase e.g. sourcing the rc file.
+    if not _enabled:
+        yield
+        return
+
+    start_time = default_timer()
+    try:
+        yield
+    finally:
+        _phases.append((name, default_timer() - start_time))
+
+
+def record_rc_line(source: str, line: str, seconds: float) -> None:
+    _rc_lines.append((source, line, seconds))
+
+
+def report() -> str:
+    if not _enabled:
+        return 'The startup profiler is disabled, set SUBLIME_NEOVINTAGEOUS_PROFILE=1 to enable it.\n'
+
+    lines = ['NeoVintageous startup report', '']
+
+    lines.append('Phases:')
+    for name, seconds in _phases:
+        lines.append('  {:<56} {:>9.2f} ms'.format(name, seconds * 1000))
+    lines.append('  {:<56} {:>9.2f} ms'.format('total', sum(seconds for _, seconds in _phases) * 1000))
+    lines.append('')
+
+    lines.append('Imports ({:d} modules, cumulative and self time):'.format(len(_imports)))
+    for name, cumulative, self_time in sorted(_imports, key=lambda i: i[2], reverse=True):
+        lines.append('  {:<56} {:>9.2f} ms {:>9.2f} ms'.format(name, cumulative * 1000, self_time * 1000))
+    lines.append('')
+
+    lines.append('Sourced rc lines ({:d} lines, {:.2f} ms):'.format(
+        len(_rc_lines), sum(seconds for _, _, seconds in _rc_lines) * 1000))
+    for source, line, seconds in sorted(_rc_lines, key=lambda i: i[2], reverse=True):
+        lines.append('  {:<56} {:>9.2f} ms  {}'.format(line, seconds * 1000, source))
+
+    return '\n'.join(lines) + '\n'
+
+
+def print_report() -> None:
+    if _enabled:
+        print(report())
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from timeit import default_timer
 import builtins
 import logging
 import os
@@ -22,6 +23,8 @@ import re
 
 import sublime
 
+from NeoVintageous.nv import profiler
+from NeoVintageous.nv.settings import set_sourcing
 from NeoVintageous.nv.vim import message
 
 
@@ -75,32 +78,39 @@ def _load() -> None:
     source = settings.get('vintageous_source')
     if source and isinstance(source, str):
         try:
-            _source(window, iter(sublime.load_resource(source).splitlines()))
+            _source(window, iter(sublime.load_resource(source).splitlines()), source)
             _log.info('sourced %s', source)
         except FileNotFoundError as e:
             print('NeoVintageous:', e)
 
     try:
         with builtins.open(_file_path(), 'r', encoding='utf-8', errors='replace') as f:
-            _source(window, f)
+            _source(window, f, _file_path())
             _log.info('sourced %s', _file_path())
 
     except FileNotFoundError:
         _log.info('%s file not found', _file_path())
 
 
-def _source(window, source) -> None:
+def _source(window, source, file_name: str = '') -> None:
     # The import is inline to avoid circular dependency errors.
     from NeoVintageous.nv.ex_cmds import do_ex_cmdline
 
+    profile = profiler.is_enabled()
+
     try:
-        window.settings().set('_nv_sourcing', True)
+        set_sourcing(True)
         for line in source:
             ex_cmdline = _parse_line(line)
             if ex_cmdline:
-                do_ex_cmdline(window, ex_cmdline)
+                if profile:
+                    start_time = default_timer()
+                    do_ex_cmdline(window, ex_cmdline)
+                    profiler.record_rc_line(file_name, ex_cmdline, default_timer() - start_time)
+                else:
+                    do_ex_cmdline(window, ex_cmdline)
     finally:
-        window.settings().erase('_nv_sourcing')
+        set_sourcing(False)
 
 
 # Recursive mappings (:map, :nmap, :omap, :smap, :vmap) are not supported. They
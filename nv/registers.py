@@ -38,7 +38,7 @@ except Exception:  # pragma: no cover
         print('NeoVintageous: update_clipboard_history() noop; could not import default pakage history updater')
 
 from NeoVintageous.nv.session import get_session_value
-from NeoVintageous.nv.session import maybe_do_runtime_save_session
+from NeoVintageous.nv.session import maybe_do_runtime_save_session_changes
 from NeoVintageous.nv.settings import get_setting
 from NeoVintageous.nv.vim import VISUAL
 from NeoVintageous.nv.vim import VISUAL_LINE
@@ -125,6 +125,18 @@ _SPECIAL = (
 _ALL = _SPECIAL + _NUMBERED + _NAMED
 
 
+# The names of the registers changed since the last save. Only these registers
+# are written to the session when changes are saved.
+_changed = set()  # type: set
+
+
+def _save_changes() -> None:
+    registers = _get_data()
+    changes = [[['registers', name], registers[name]] for name in _changed if name in registers]
+    _changed.clear()
+    maybe_do_runtime_save_session_changes(*changes)
+
+
 def _reset() -> None:
     registers = _get_data()
     registers.clear()
@@ -134,6 +146,7 @@ def _reset() -> None:
 def _init_registers(registers: dict) -> None:
     registers['0'] = (None, False)
     registers['1-9'] = deque([(None, False)] * 9, maxlen=9)
+    _changed.update(('0', '1-9'))
 
 
 def _get_data() -> dict:
@@ -146,6 +159,7 @@ def _get_data() -> dict:
 
 def _set_data(name: str, values: list, linewise: bool) -> None:
     _get_data()[name] = (values, linewise)
+    _changed.add(name)
 
 
 def _get_data_values(name: str, default=None):
@@ -157,10 +171,12 @@ def _get_data_values(name: str, default=None):
 
 def _shift_numbered_register(content: list, linewise: bool) -> None:
     _get_data()['1-9'].appendleft((content, linewise))
+    _changed.add('1-9')
 
 
 def _set_numbered_register(number: str, values: list, linewise: bool) -> None:
     _get_data()['1-9'][int(number) - 1] = (values, linewise)
+    _changed.add('1-9')
 
 
 def _get_numbered_register(number: str) -> list:
@@ -311,7 +327,7 @@ def get_alternate_file_register():
 
 def set_alternate_file_register(value: str) -> None:
     _set_data(_ALTERNATE_FILE, [value], False)
-    maybe_do_runtime_save_session()
+    _save_changes()
 
 
 def is_alternate_file_register(value) -> bool:
@@ -320,7 +336,7 @@ def is_alternate_file_register(value) -> bool:
 
 def set_expression_register(values: list) -> None:
     _set_data(_EXPRESSION, _list_values_to_str(values), False)
-    maybe_do_runtime_save_session()
+    _save_changes()
 
 
 def _set_unnamed_register(values: list, linewise: bool = False) -> None:
@@ -341,7 +357,7 @@ def registers_set(view, key: str, value: list, linewise: bool = False) -> None:
         # TODO [review] Looks like a bug: If set() above raises AttributeError so will this.
         _set(view, key, value, linewise)
 
-    maybe_do_runtime_save_session()
+    _save_changes()
 
 
 def _maybe_set_sys_clipboard(view, name: str, values: list) -> None:
@@ -410,7 +426,7 @@ def _op(view, operation: str, register: str = None, linewise=False) -> None:
             if linewise or multiline:
                 _shift_numbered_register(selected_text, linewise)
 
-        maybe_do_runtime_save_session()
+        _save_changes()
 
     # The small delete register.
     if register == _UNNAMED and operation in ('change', 'delete') and not multiline:
@@ -418,7 +434,7 @@ def _op(view, operation: str, register: str = None, linewise=False) -> None:
         is_same_line = (lambda r: view.line(r.begin()) == view.line(r.end() - 1))
         if all(is_same_line(x) for x in list(view.sel())):
             _set(view, _SMALL_DELETE, selected_text, linewise)
-            maybe_do_runtime_save_session()
+            _save_changes()
 
 
 def registers_op_change(view, register: str = None, linewise=False) -> None:
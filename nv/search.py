@@ -19,6 +19,7 @@ import re
 
 from sublime import IGNORECASE
 from sublime import LITERAL
+from sublime import Region
 
 from NeoVintageous.nv.options import get_option
 from NeoVintageous.nv.settings import get_setting_neo
@@ -56,17 +57,18 @@ def add_search_highlighting(view, occurrences: list, incremental: list = None) -
             flags=ui_region_flags(get_setting_neo(view, 'search_occ_style'))
         )
 
-        sels = []
+        # Occurrences are sorted and don't overlap, so the only occurrence that
+        # can contain a selection is the last one that begins before it.
+        current_indexes = set()
         for sel in view.sel():
             if sel.empty():
                 sel.b += 1
-            sels.append(sel)
 
-        current = []
-        for region in occurrences:
-            for sel in sels:
-                if region.contains(sel):
-                    current.append(region)
+            index = _bisect_occurrences(occurrences, sel.begin()) - 1
+            if index >= 0 and occurrences[index].contains(sel):
+                current_indexes.add(index)
+
+        current = [occurrences[i] for i in sorted(current_indexes)]
 
         if current:
             view.add_regions(
@@ -77,6 +79,21 @@ def add_search_highlighting(view, occurrences: list, incremental: list = None) -
             )
 
 
+def _bisect_occurrences(occurrences: list, pt: int) -> int:
+    # Returns:
+    #   int: The index after the last occurrence that begins at or before pt.
+    lo = 0
+    hi = len(occurrences)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if pt < occurrences[mid].begin():
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
 def is_smartcase_pattern(view, pattern: str) -> bool:
     return get_option(view, 'smartcase') and any(p.isupper() for p in pattern)
 
@@ -177,3 +194,43 @@ def find_search_occurrences(view, pattern: str, flags: int) -> list:
 
 def find_word_search_occurrences(view, pattern: str, flags: int) -> list:
     return view.find_all(pattern, flags)
+
+
+def is_self_overlapping_pattern(pattern: str) -> bool:
+    # A pattern overlaps itself when a proper prefix of it is also a suffix of
+    # it e.g. "abca" and "aa". Non-overlapping searches for such a pattern can
+    # skip positions where the pattern also matches.
+    for i in range(1, len(pattern)):
+        if pattern.startswith(pattern[-i:]):
+            return True
+
+    return False
+
+
+def filter_literal_search_occurrences(view, candidates: list, pattern: str, flags: int):
+    # Lazily filter the occurrences of a literal pattern from the occurrences
+    # of a literal prefix of it. The prefix must not overlap itself, otherwise
+    # the candidates may not include all the positions where pattern matches.
+    #
+    # Args:
+    #   :candidates (list): The sorted occurrences of a prefix of pattern.
+    #
+    # Yields:
+    #   Region: The same non-overlapping occurrences as find_all().
+    size = len(pattern)
+    ignorecase = flags & IGNORECASE
+    if ignorecase:
+        pattern = pattern.lower()
+
+    end = -1
+    for region in candidates:
+        if region.a < end:
+            continue
+
+        text = view.substr(Region(region.a, region.a + size))
+        if ignorecase:
+            text = text.lower()
+
+        if text == pattern:
+            end = region.a + size
+            yield Region(region.a, end)
@@ -48,7 +48,7 @@ if _VERSION >= 4081:
         save_session()
 
     # In newer builds the session is saved when exiting Sublime.
-    def maybe_do_runtime_save_session() -> None:
+    def maybe_do_runtime_save_session_changes(*changes) -> None:
         pass
 else:
     def get_packages_path() -> str:
@@ -57,8 +57,8 @@ else:
     def session_on_exit() -> None:
         pass
 
-    def maybe_do_runtime_save_session() -> None:
-        save_session()
+    def maybe_do_runtime_save_session_changes(*changes) -> None:
+        _append_journal(changes)
 
 
 def _get_session_file() -> str:
@@ -69,6 +69,68 @@ def _get_session_file() -> str:
     )
 
 
+# Changes saved at runtime are appended to a journal next to the session file,
+# one compact JSON record per line, rather than rewriting the whole session. A
+# record is a [path, value] pair to set a value, or a [path] to delete one,
+# where path is the list of keys to the value e.g. ['registers', 'a']. The
+# journal is replayed on top of the session file when the session is loaded,
+# and it's compacted into the session file when it gets too long.
+_JOURNAL_MAX_RECORDS = 1000
+
+_journal = {
+    'records': 0
+}
+
+
+def _get_journal_file() -> str:
+    return _get_session_file() + '.journal'
+
+
+def _append_journal(changes) -> None:
+    if not changes:
+        return
+
+    records = ''.join(json.dumps(change, cls=_JsonSessionEncoder, separators=(',', ':')) + '\n' for change in changes)
+    with open(_get_journal_file(), 'a', encoding='utf-8') as f:
+        f.write(records)
+
+    _journal['records'] += len(changes)
+    if _journal['records'] >= _JOURNAL_MAX_RECORDS:
+        save_session()
+
+
+def _replay_journal(session: dict) -> None:
+    # Values are keyed by strings, as they would be in the decoded session file.
+    try:
+        with open(_get_journal_file(), 'r', encoding='utf-8', errors='replace') as f:
+            records = 0
+            for line in f:
+                try:
+                    change = json.loads(line)
+                except ValueError:
+                    # An incomplete record can be left by a crash while the
+                    # journal was being written. Anything after it is ignored.
+                    break
+
+                *keys, name = [str(key) for key in change[0]]
+                target = session
+                for key in keys:
+                    if not isinstance(target.get(key), dict):
+                        target[key] = {}
+                    target = target[key]
+
+                if len(change) > 1:
+                    target[name] = change[1]
+                else:
+                    target.pop(name, None)
+
+                records += 1
+
+            _journal['records'] = records
+    except FileNotFoundError:
+        pass
+
+
 def session_on_close(view) -> None:
     try:
         del _views[view.id()]
@@ -98,54 +160,80 @@ _ACCEPT_KEYS = (
 )
 
 
-def load_session() -> None:
+def _read_session() -> dict:
+    session = {}  # type: dict
     try:
         with open(_get_session_file(), 'r', encoding='utf-8', errors='replace') as f:
             content = f.read()
             if content.strip():
-                session = json.loads(content)
-                if session:
-                    for k, v in session.items():
-                        if k not in _ACCEPT_KEYS:
-                            continue
-
-                        # history is a special case.
-                        # TODO Refactor history module to be session friendly.
-                        if k == 'history':
-                            # Import inline to avoid circular reference.
-                            from NeoVintageous.nv.history import _storage
-                            _storage.clear()
-                            for _k, _v in v.items():
-                                # The session is stored in JSON format and json
-                                # dump serialized dict int keys as strings. So
-                                # the keys need to be deserialized to ints.
-                                _storage[int(_k)] = _recursively_convert_dict_digit_keys_to_int(_v)
-
-                            set_session_value('history', _storage)
-                            continue
-
-                        # registers is a special case.
-                        # TODO Refactor registers module to be session friendly.
-                        if k == 'registers':
-                            _session['registers'] = {}
-                            for _k, _v in v.items():
-                                if _k == '1-9':
-                                    _v = deque(_v, maxlen=9)
-
-                                _session['registers'][_k] = _v
-                            continue
-
-                        _session[k] = v
-
+                session = json.loads(content) or {}
     except FileNotFoundError:
         pass
+
+    _replay_journal(session)
+
+    return session
+
+
+def load_session() -> None:
+    try:
+        session = _read_session()
+        if session:
+            for k, v in session.items():
+                if k not in _ACCEPT_KEYS:
+                    continue
+
+                # history is a special case.
+                # TODO Refactor history module to be session friendly.
+                if k == 'history':
+                    # Import inline to avoid circular reference.
+                    from NeoVintageous.nv.history import _storage
+                    _storage.clear()
+                    for _k, _v in v.items():
+                        # The session is stored in JSON format and json
+                        # dump serialized dict int keys as strings. So
+                        # the keys need to be deserialized to ints.
+                        _storage[int(_k)] = _recursively_convert_dict_digit_keys_to_int(_v)
+
+                    set_session_value('history', _storage)
+                    continue
+
+                # registers is a special case.
+                # TODO Refactor registers module to be session friendly.
+                if k == 'registers':
+                    _session['registers'] = {}
+                    for _k, _v in v.items():
+                        if _k == '1-9':
+                            _v = deque(_v, maxlen=9)
+
+                        _session['registers'][_k] = _v
+                    continue
+
+                _session[k] = v
+
     except Exception:  # pragma: no cover
         traceback.print_exc()
 
 
 def save_session() -> None:
-    with open(_get_session_file(), 'w', encoding='utf-8') as f:
+    # The session is written to a temporary file that then replaces the session
+    # file, so that a crash can't leave a partially written session. The journal
+    # is only removed once its changes are safely in the session file.
+    session_file = _get_session_file()
+    tmp_file = session_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         f.write(json.dumps(_session, cls=_JsonSessionEncoder))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_file, session_file)
+
+    try:
+        os.remove(_get_journal_file())
+    except FileNotFoundError:
+        pass
+
+    _journal['records'] = 0
 
 
 # Some sessions contain types that are not JSON serializable e.g. registers use
@@ -173,7 +261,7 @@ def set_session_value(name: str, value, persist: bool = False) -> None:
     _session[name] = value
 
     if persist:
-        maybe_do_runtime_save_session()
+        maybe_do_runtime_save_session_changes([[name], value])
 
 
 def get_session_view_value(view, name: str, default=None):
@@ -18,6 +18,7 @@
 import os
 
 from sublime import active_window
+from sublime import load_settings
 
 from NeoVintageous.nv.polyfill import toggle_preference
 from NeoVintageous.nv.session import get_session_value
@@ -28,16 +29,88 @@ from NeoVintageous.nv.vim import DIRECTION_DOWN
 from NeoVintageous.nv.vim import UNKNOWN
 
 
+# The view settings are read many times per keystroke, so the values read are
+# cached per view. A view's cache is cleared when any of its settings change,
+# and all the caches are cleared when the preferences change, because the view
+# settings inherit the preferences.
+_views_settings = {}  # type: dict
+
+# True while a rc file is being sourced. See options.py.
+_sourcing = False
+
+
+def _clear_views_settings() -> None:
+    for cache in _views_settings.values():
+        cache.clear()
+
+
+def _get_view_settings_cache(view) -> dict:
+    try:
+        return _views_settings[view.id()]
+    except KeyError:
+        if not _views_settings:
+            preferences = load_settings('Preferences.sublime-settings')
+            preferences.clear_on_change('_nv_settings_cache')
+            preferences.add_on_change('_nv_settings_cache', _clear_views_settings)
+
+        cache = _views_settings[view.id()] = {}
+        settings = view.settings()
+        settings.clear_on_change('_nv_settings_cache')
+        settings.add_on_change('_nv_settings_cache', cache.clear)
+
+        return cache
+
+
+def get_view_setting(view, key: str, default=None):
+    # Return the view setting, or default if the setting is not set. Settings
+    # with a null value are not set.
+    cache = _get_view_settings_cache(view)
+    try:
+        value = cache[key]
+    except KeyError:
+        value = cache[key] = view.settings().get(key)
+
+    return default if value is None else value
+
+
+def clear_settings_cache(view=None) -> None:
+    # Clear the cache of a view, or of all the views if no view is given. The
+    # caches are cleared when settings change, but Sublime Text may notify the
+    # change later, so settings changed by the plugin are cleared right away.
+    if view is None:
+        _clear_views_settings()
+    else:
+        _views_settings.get(view.id(), {}).clear()
+
+
+def settings_on_close(view) -> None:
+    try:
+        del _views_settings[view.id()]
+    except KeyError:
+        pass
+
+
+def is_sourcing() -> bool:
+    return _sourcing
+
+
+def set_sourcing(sourcing: bool) -> None:
+    global _sourcing
+    _sourcing = sourcing
+
+
 def get_setting(view, name: str, default=None):
-    return view.settings().get('vintageous_%s' % name, default)
+    return get_view_setting(view, 'vintageous_%s' % name, default)
 
 
 def set_setting(view, name: str, value) -> None:
     view.settings().set('vintageous_%s' % name, value)
+    clear_settings_cache(view)
 
 
 def reset_setting(view, name: str) -> None:
     view.settings().erase('vintageous_%s' % name)
+    clear_settings_cache(view)
 
 
 def _get_private(obj, name: str, default=None):
@@ -60,8 +133,9 @@ def set_internal_setting(obj, name: str, value) -> None:
 def get_setting_neo(view, name: str):
     # @deprecated since v1.32 neovintageous_* settings.
     # The following is for backward compatibility.
-    if view.settings().has('neovintageous_%s' % name):
-        return view.settings().get('neovintageous_%s' % name)
+    value = get_view_setting(view, 'neovintageous_%s' % name)
+    if value is not None:
+        return value
 
     return get_setting(view, name)
 
@@ -71,8 +145,9 @@ def get_setting_hly(view, name: str):
     # @deprecated since v1.32 highlightedyank* settings.
     # The following is for backward compatibility.
     old_name = name.replace('highlighted_yank', 'highlightedyank')
-    if view.settings().has(old_name):
-        return view.settings().get(old_name)
+    value = get_view_setting(view, old_name)
+    if value is not None:
+        return value
 
     return get_setting(view, name)
 
@@ -412,5 +487,14 @@ def toggle_super_keys() -> None:
     toggle_preference('vintageous_use_super_keys')
 
 
-def is_plugin_enabled(view, plugin: object) -> bool:
-    return get_setting(view, 'enable_%s' % plugin.__class__.__module__[24:])
+def is_plugin_enabled(view, plugin) -> bool:
+    # Args:
+    #   plugin (str|object): The name of the plugin e.g. "surround", or an
+    #       object of the plugin's module e.g. a command definition.
+    #
+    # Returns:
+    #   bool: True if the plugin is enabled, or if it has no enable setting.
+    if not isinstance(plugin, str):
+        plugin = plugin.__class__.__module__[24:]
+
+    return get_setting(view, 'enable_%s' % plugin, True)
@@ -16,12 +16,19 @@
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
+import threading
 import traceback
 
-from sublime import platform
+from sublime import HIDDEN
 from sublime import Region
+from sublime import platform
+from sublime import set_timeout
 
+from NeoVintageous.nv.options import get_option
 from NeoVintageous.nv.polyfill import set_selection
+from NeoVintageous.nv.polyfill import status_message
+from NeoVintageous.nv.session import get_session_view_value
+from NeoVintageous.nv.session import set_session_view_value
 
 if sys.platform.startswith('win') and platform() == 'windows':
     from NeoVintageous.nv import shell_windows as _shell
@@ -33,6 +40,142 @@ else:
     raise ImportError('no os specific module found')
 
 
+# The maximum number of filter processes run at the same time.
+_MAX_PROCESSES = 4
+
+# The number of seconds to block waiting for a command before finishing it in
+# the background. Most commands finish well within this, and then the result
+# is applied synchronously, as part of the edit that ran the command.
+_WAIT = 0.5
+
+
+class ShellJob():
+
+    def __init__(self, view, targets: list):
+        # Args:
+        #   view (View)
+        #   targets (list[callable]): Each target is called with the job on a
+        #       worker thread and returns its result as a str.
+        self.view = view
+        self.results = []  # type: list
+        self.interrupted = False
+        self._targets = targets
+        self._processes = []  # type: list
+        self._output = []  # type: list
+        self._on_output = None
+        self._on_done = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._timer = None
+
+    def start(self) -> 'ShellJob':
+        # Ms, where zero means no timeout.
+        timeout = get_option(self.view, 'shelltimeout')
+        if timeout:
+            self._timer = threading.Timer(timeout / 1000, self.cancel)
+            self._timer.daemon = True
+            self._timer.start()
+
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+        return self
+
+    def _run(self) -> None:
+        try:
+            if len(self._targets) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=min(_MAX_PROCESSES, len(self._targets))) as executor:
+                    self.results = list(executor.map(lambda target: target(self), self._targets))
+            else:
+                self.results = [target(self) for target in self._targets]
+        except Exception:  # pragma: no cover
+            traceback.print_exc()
+            self.interrupted = True
+        finally:
+            if self._timer:
+                self._timer.cancel()
+
+            with self._lock:
+                self._done.set()
+                on_done = self._on_done
+
+            if on_done:
+                on_done(self)
+
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._done.wait(timeout)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.interrupted = True
+            processes = list(self._processes)
+
+        for p in processes:
+            _shell.kill(p)
+
+    def then(self, callback) -> None:
+        # Calls callback with the job when it finishes, on the worker thread.
+        with self._lock:
+            if not self._done.is_set():
+                self._on_done = callback
+                return
+
+        callback(self)
+
+    def follow(self, callback) -> None:
+        # Calls callback on the main thread with the output written so far and
+        # again with each line written after.
+        with self._lock:
+            self._on_output = callback
+            if self._output:
+                output = ''.join(self._output)
+                set_timeout(lambda: callback(output))
+
+    def output(self) -> str:
+        with self._lock:
+            return ''.join(self._output)
+
+    def communicate(self, p, data: bytes, cleanup) -> str:
+        try:
+            self._spawned(p)
+            out, _ = p.communicate(data)
+
+            return _shell.decode(out)
+        finally:
+            if cleanup:
+                cleanup()
+
+    def stream(self, p) -> str:
+        self._spawned(p)
+        for line in iter(p.stdout.readline, b''):
+            text = _shell.decode(line)
+            with self._lock:
+                self._output.append(text)
+                on_output = self._on_output
+
+            if on_output:
+                set_timeout(lambda on_output=on_output, text=text: on_output(text))
+
+        p.stdout.close()
+        p.wait()
+
+        return self.output()
+
+    def _spawned(self, p) -> None:
+        with self._lock:
+            self._processes.append(p)
+            interrupted = self.interrupted
+
+        if interrupted:
+            _shell.kill(p)
+
+
 def open(view) -> None:
     try:
         _shell.open(view)
@@ -49,14 +192,103 @@ def read(view, cmd: str) -> str:
     return ''
 
 
+def start_read(view, cmd: str) -> ShellJob:
+    # Runs cmd on a worker thread, streaming its output.
+    #
+    # Returns:
+    #   ShellJob: The job's only result is the output of cmd.
+    return ShellJob(view, [lambda job: job.stream(_shell.start_read(view, cmd))]).start()
+
+
+def start_filter(view, regions: list, cmd: str) -> ShellJob:
+    # Filters the text of each region through cmd on a worker thread, running
+    # up to _MAX_PROCESSES commands in parallel.
+    #
+    # Returns:
+    #   ShellJob: The job's results are the output for each region.
+    def _target(text: str):
+        return lambda job: job.communicate(*_shell.start_filter(view, text, cmd))
+
+    return ShellJob(view, [_target(view.substr(r)) for r in regions]).start()
+
+
+def run(view, edit, job: ShellJob, regions: list, apply, on_background=None) -> None:
+    # Applies the job's result with apply(view, edit, job, regions).
+    #
+    # If the job is done within _WAIT then it's applied as part of the current
+    # edit. Otherwise the regions are tracked, on_background(job) is called if
+    # given, and the result is applied as a single edit when the job is done.
+    # Pressing <Esc> in the view interrupts it.
+    if job.wait(_WAIT):
+        _apply(view, edit, job, regions, apply)
+        return
+
+    cancel(view)
+
+    view.add_regions('shell_job', regions, '', '', HIDDEN)
+    set_session_view_value(view, 'shell_job', (job, apply))
+    status_message('running shell command; press <Esc> to interrupt')
+
+    if on_background:
+        on_background(job)
+
+    job.then(lambda job: set_timeout(lambda: view.run_command('nv_view', {'action': 'shell_job'})))
+
+
+def do_shell_job(view, edit) -> None:
+    # Apply a shell job that finished in the background.
+    shell_job = get_session_view_value(view, 'shell_job')
+    if not shell_job:
+        return
+
+    job, apply = shell_job
+    if not job.is_done():
+        return
+
+    regions = view.get_regions('shell_job')
+    view.erase_regions('shell_job')
+    set_session_view_value(view, 'shell_job', None)
+
+    _apply(view, edit, job, regions, apply)
+
+
+def cancel(view) -> bool:
+    # Interrupt the view's background shell job, if any.
+    #
+    # Returns:
+    #   bool: True if a job was interrupted, otherwise False.
+    shell_job = get_session_view_value(view, 'shell_job')
+    if not shell_job:
+        return False
+
+    view.erase_regions('shell_job')
+    set_session_view_value(view, 'shell_job', None)
+    shell_job[0].cancel()
+    status_message('Interrupted')
+
+    return True
+
+
+def _apply(view, edit, job: ShellJob, regions: list, apply) -> None:
+    if job.interrupted:
+        status_message('Interrupted')
+        return
+
+    apply(view, edit, job, regions)
+
+
 def filter_thru_shell(view, edit, regions, cmd: str) -> None:
+    run(view, edit, start_filter(view, regions, cmd), regions, _replace_regions)
+
+
+def _replace_regions(view, edit, job: ShellJob, regions: list) -> None:
     # Maintain text size delta as we replace each selection going forward. We
     # can't simply go in reverse because cursor positions will be incorrect.
     accumulated_delta = 0
     new_points = []
-    for r in regions:
+    for r, out in zip(regions, job.results):
         r_shifted = Region(r.begin() + accumulated_delta, r.end() + accumulated_delta)
-        rv = _shell.filter_region(view, view.substr(r_shifted), cmd).rstrip() + '\n'
+        rv = out.rstrip() + '\n'
         view.replace(edit, r_shifted, rv)
         new_points.append(r_shifted.a)
         accumulated_delta += len(rv) - r_shifted.size()
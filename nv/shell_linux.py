@@ -28,3 +28,19 @@ def read(view, cmd: str) -> str:
 
 def filter_region(view, text: str, cmd: str) -> str:
     return shell_unixlike.filter_region(view, text, cmd)
+
+
+def start_read(view, cmd: str):
+    return shell_unixlike.start_read(view, cmd)
+
+
+def start_filter(view, text: str, cmd: str) -> tuple:
+    return shell_unixlike.start_filter(view, text, cmd)
+
+
+def decode(data: bytes) -> str:
+    return shell_unixlike.decode(data)
+
+
+def kill(p) -> None:
+    shell_unixlike.kill(p)
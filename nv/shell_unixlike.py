@@ -16,6 +16,7 @@
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import signal
 import subprocess
 
 from NeoVintageous.nv.options import get_option
@@ -45,14 +46,46 @@ def read(view, cmd: str) -> str:
 
 
 def filter_region(view, text: str, cmd: str) -> str:
+    p, data, cleanup = start_filter(view, text, cmd)
+
+    # Pass in text as input: saves having to deal with quoting stuff.
+    out, _ = p.communicate(data)
+
+    return decode(out)
+
+
+def start_read(view, cmd: str):
+    # Redirect STDERR to STDOUT, so that the output can be read as it's written.
+    return subprocess.Popen([get_option(view, 'shell'), '-c', cmd],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT,
+                            start_new_session=True)
+
+
+def start_filter(view, text: str, cmd: str) -> tuple:
+    # Returns:
+    #   tuple[Popen, bytes, callable]: The process, the input to write to it,
+    #       and a function to call when it's finished, or None.
+
     # Redirect STDERR to STDOUT to capture both.
     # This seems to be the behavior of vim as well.
     p = subprocess.Popen([get_option(view, 'shell'), '-c', cmd],
                          stdin=subprocess.PIPE,
                          stdout=subprocess.PIPE,
-                         stderr=subprocess.STDOUT)
+                         stderr=subprocess.STDOUT,
+                         start_new_session=True)
+
+    return p, text.encode('utf-8'), None
+
+
+def decode(data: bytes) -> str:
+    return data.decode('utf-8', errors='backslashreplace')
 
-    # Pass in text as input: saves having to deal with quoting stuff.
-    out, _ = p.communicate(text.encode('utf-8'))
 
-    return out.decode('utf-8', errors='backslashreplace')
+def kill(p) -> None:
+    # The command runs in its own session, so kill its process group to stop
+    # any children it started, which otherwise keep the output pipe open.
+    try:
+        os.killpg(p.pid, signal.SIGKILL)
+    except OSError:
+        pass
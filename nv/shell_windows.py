@@ -62,32 +62,64 @@ def read(view, cmd: str) -> str:
 
 
 def filter_region(view, txt: str, cmd: str) -> str:
+    p, data, cleanup = start_filter(view, txt, cmd)
     try:
-        contents = tempfile.NamedTemporaryFile(suffix='.txt', delete=False)
-        contents.write(txt.encode('utf-8'))
-        contents.close()
+        out, _ = p.communicate(data)
+
+        return decode(out)
+    finally:
+        cleanup()
+
+
+def start_read(view, cmd: str):
+    # Redirect STDERR to STDOUT, so that the output can be read as it's written.
+    return subprocess.Popen([get_option(view, 'shell'), '/c', cmd],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT,
+                            startupinfo=_get_startup_info())
 
-        script = tempfile.NamedTemporaryFile(suffix='.bat', delete=False)
-        script.write(('@echo off\ntype %s | %s' % (contents.name, cmd)).encode('utf-8'))
-        script.close()
 
+def start_filter(view, txt: str, cmd: str) -> tuple:
+    # Returns:
+    #   tuple[Popen, bytes, callable]: The process, the input to write to it,
+    #       and a function to call when it's finished, or None.
+    contents = tempfile.NamedTemporaryFile(suffix='.txt', delete=False)
+    contents.write(txt.encode('utf-8'))
+    contents.close()
+
+    script = tempfile.NamedTemporaryFile(suffix='.bat', delete=False)
+    script.write(('@echo off\ntype %s | %s' % (contents.name, cmd)).encode('utf-8'))
+    script.close()
+
+    def _cleanup() -> None:
+        os.remove(script.name)
+        os.remove(contents.name)
+
+    try:
         p = subprocess.Popen([script.name],
                              stdout=subprocess.PIPE,
-                             stderr=subprocess.PIPE,
+                             stderr=subprocess.STDOUT,
                              startupinfo=_get_startup_info())
+    except Exception:
+        _cleanup()
+        raise
 
-        out, err = p.communicate()
+    return p, None, _cleanup
 
-        if out:
-            return _translate_newlines(out.decode(_get_encoding()))
 
-        if err:
-            return _translate_newlines(err.decode(_get_encoding()))
+def decode(data: bytes) -> str:
+    return _translate_newlines(data.decode(_get_encoding(), errors='backslashreplace'))
 
-        return ''
-    finally:
-        os.remove(script.name)
-        os.remove(contents.name)
+
+def kill(p) -> None:
+    # Kill the process tree, including the commands run by the shell.
+    try:
+        subprocess.call(['taskkill', '/F', '/T', '/PID', str(p.pid)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        startupinfo=_get_startup_info())
+    except OSError:
+        p.kill()
 
 
 def _get_startup_info():
@@ -15,12 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from copy import copy
 import logging
 
 from sublime import active_window
 
 from NeoVintageous.nv import macros
-from NeoVintageous.nv import plugin
+from NeoVintageous.nv import trace
 from NeoVintageous.nv.macros import add_macro_step
 from NeoVintageous.nv.polyfill import run_window_command
 from NeoVintageous.nv.session import get_session_view_value
@@ -46,7 +47,6 @@ from NeoVintageous.nv.utils import get_visual_repeat_data
 from NeoVintageous.nv.utils import is_view
 from NeoVintageous.nv.utils import save_previous_selection
 from NeoVintageous.nv.utils import update_xpos
-from NeoVintageous.nv.vi import cmd_defs
 from NeoVintageous.nv.vi.cmd_base import ViMotionDef
 from NeoVintageous.nv.vi.cmd_base import ViOperatorDef
 from NeoVintageous.nv.vi.cmd_defs import ViToggleMacroRecorder
@@ -159,36 +159,54 @@ def _scroll_into_active_view() -> None:
             _scroll_into_view(view, get_mode(view))
 
 
-def _create_definition(view, name: str):
-    cmd = get_session_view_value(view, name)
-    if cmd:
-        cls = getattr(cmd_defs, cmd['name'], None)
+class _CommandState:
 
-        if cls is None:
-            cls = plugin.classes.get(cmd['name'], None)
+    # The command being built for a view. The action and motion are kept as
+    # live instances so that accepting input on the hot path doesn't need to
+    # serialize and deserialize them after every key.
 
-            if cls is None:
-                raise ValueError('unknown %s: %s' % (name, cmd))
+    __slots__ = ('action', 'motion')
 
-        return cls.from_json(cmd['data'])
+    def __init__(self):
+        self.action = None
+        self.motion = None
+
+
+def _get_command_state(view) -> _CommandState:
+    command_state = get_session_view_value(view, 'command_state')
+    if command_state is None:
+        command_state = _CommandState()
+        set_session_view_value(view, 'command_state', command_state)
+
+    return command_state
+
+
+def _to_live_definition(value, current):
+    # Command definitions resolved from the mappings are shared instances, so
+    # they are copied before being stored because they are about to accept
+    # input. The current live instance is stored as is.
+    if value is None or value is current:
+        return value
+
+    return copy(value)
 
 
 def get_action(view):
-    return _create_definition(view, 'action')
+    return _get_command_state(view).action
 
 
 def set_action(view, value) -> None:
-    serialized = value.serialize() if value else None
-    set_session_view_value(view, 'action', serialized)
+    command_state = _get_command_state(view)
+    command_state.action = _to_live_definition(value, command_state.action)
 
 
 def get_motion(view):
-    return _create_definition(view, 'motion')
+    return _get_command_state(view).motion
 
 
 def set_motion(view, value) -> None:
-    serialized = value.serialize() if value else None
-    set_session_view_value(view, 'motion', serialized)
+    command_state = _get_command_state(view)
+    command_state.motion = _to_live_definition(value, command_state.motion)
 
 
 def reset_command_data(view) -> None:
@@ -252,9 +270,13 @@ def is_runnable(view) -> bool:
 
 
 def evaluate_state(view) -> None:
-    _log.debug('evaluating...')
+    if trace.log_debug:
+        _log.debug('evaluating...')
+
     if not is_runnable(view):
-        _log.debug('not runnable!')
+        if trace.log_debug:
+            _log.debug('not runnable!')
+
         return
 
     action = get_action(view)
@@ -271,8 +293,12 @@ def evaluate_state(view) -> None:
         action_cmd = action.translate(view)
         motion_cmd = motion.translate(view)
 
-        _log.debug('action: %s', action_cmd)
-        _log.debug('motion: %s', motion_cmd)
+        if trace.log_debug:
+            _log.debug('action: %s', action_cmd)
+            _log.debug('motion: %s', motion_cmd)
+
+        if trace.enabled:
+            trace.record('evaluate', action_cmd['action'], motion_cmd['motion'])
 
         set_mode(view, INTERNAL_NORMAL)
 
@@ -310,7 +336,11 @@ def evaluate_state(view) -> None:
 
         motion_cmd = motion.translate(view)
 
-        _log.debug('motion: %s', motion_cmd)
+        if trace.log_debug:
+            _log.debug('motion: %s', motion_cmd)
+
+        if trace.enabled:
+            trace.record('evaluate', motion_cmd['motion'])
 
         add_macro_step(view, motion_cmd['motion'], motion_cmd['motion_args'])
 
@@ -319,7 +349,11 @@ def evaluate_state(view) -> None:
     if action:
         action_cmd = action.translate(view)
 
-        _log.debug('action: %s', action_cmd)
+        if trace.log_debug:
+            _log.debug('action: %s', action_cmd)
+
+        if trace.enabled:
+            trace.record('evaluate', action_cmd['action'])
 
         if get_mode(view) == NORMAL:
             set_mode(view, INTERNAL_NORMAL)
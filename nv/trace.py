@@ -0,0 +1,131 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# Tracing for the key dispatch hot path, e.g. feeding keys, resolving mappings,
+# and processing notations. Every key goes through it, so nothing on the hot
+# path is formatted or logged unless it has been enabled.
+#
+# The log level guards are resolved when the module is loaded, the logger is
+# configured before any modules are loaded, and whenever configure() is called
+# e.g. after changing the log level in the console:
+#
+#   >>> import logging
+#   >>> logging.getLogger('NeoVintageous').setLevel(logging.INFO)
+#   >>> from NeoVintageous.nv import trace
+#   >>> trace.configure()
+#
+# The tracer records the most recent key events and their timings in a ring
+# buffer. To enable the tracer set the following environment variable to a
+# non-blank value, which keeps the last 1000 events, or to a number of events
+# greater than one to keep. The events are shown by the
+# :NeoVintageousTraceReport command.
+#
+#   SUBLIME_NEOVINTAGEOUS_TRACE=1
+#   SUBLIME_NEOVINTAGEOUS_TRACE=5000
+
+from collections import deque
+from timeit import default_timer
+import logging
+import os
+
+_logger = logging.getLogger('NeoVintageous')
+
+# Log level guards for the hot path e.g. "if trace.log_info: _log.info(...)".
+log_debug = False
+log_info = False
+
+# A ring buffer of (timestamp, event, fields) tuples, or None when disabled.
+_events = None  # type: deque
+
+enabled = False
+
+
+def configure() -> None:
+    # Resolve the log level guards.
+    global log_debug, log_info
+
+    log_debug = _logger.isEnabledFor(logging.DEBUG)
+    log_info = _logger.isEnabledFor(logging.INFO)
+
+
+def enable(size: int = 1000) -> None:
+    global _events, enabled
+
+    _events = deque(maxlen=size)
+    enabled = True
+
+
+def disable() -> None:
+    global _events, enabled
+
+    _events = None
+    enabled = False
+
+
+def clear() -> None:
+    if _events is not None:
+        _events.clear()
+
+
+def record(event: str, *fields) -> None:
+    # Only call record() on the hot path when the tracer is enabled e.g.
+    # "if trace.enabled: trace.record('key', key, mode)".
+    if _events is not None:
+        _events.append((default_timer(), event, fields))
+
+
+def events() -> list:
+    return list(_events) if _events is not None else []
+
+
+def report() -> str:
+    if not enabled:
+        return 'The tracer is disabled, set SUBLIME_NEOVINTAGEOUS_TRACE=1 to enable it.\n'
+
+    recorded = events()
+    lines = ['NeoVintageous trace report', '']
+    lines.append('Events ({:d} of the last {:d}, oldest first):'.format(len(recorded), _events.maxlen))
+
+    if recorded:
+        start_time = recorded[0][0]
+        for timestamp, event, fields in recorded:
+            lines.append('  {:>12.3f} ms  {:<10} {}'.format(
+                (timestamp - start_time) * 1000,
+                event,
+                ' '.join(str(field) for field in fields)))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _size(value: str) -> int:
+    # A value of 1, like any other non-blank value that isn't a number, means
+    # enabled rather than a ring buffer of one event.
+    if value.isdigit() and int(value) > 1:
+        return int(value)
+
+    return 1000
+
+
+def _init() -> None:
+    configure()
+
+    value = os.getenv('SUBLIME_NEOVINTAGEOUS_TRACE')
+    if value:
+        enable(_size(value))
+
+
+_init()
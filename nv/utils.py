@@ -42,6 +42,8 @@ from sublime import Region
 from sublime import View
 from sublime import Window
 
+from NeoVintageous.nv.buffer import BufferReader
+from NeoVintageous.nv.buffer import BufferSnapshot
 from NeoVintageous.nv.options import get_option
 from NeoVintageous.nv.polyfill import make_all_groups_same_size
 from NeoVintageous.nv.polyfill import set_selection
@@ -126,6 +128,30 @@ def regions_transformer_reversed(view, f) -> None:
     _regions_transformer(reversed(list(view.sel())), view, f, False)
 
 
+# The number of selections from which regions_transformer_batched() reads the
+# buffer up front. Reading it costs a few API calls, which is more than a
+# motion of a few cursors makes.
+_BATCH_MIN_SELECTIONS = 8
+
+
+def regions_transformer_batched(view, f, before: int = 0, after: int = 0) -> None:
+    # Like regions_transformer(), but for many selections f is passed a
+    # BufferSnapshot of the lines of the selections instead of the view, so
+    # that its line, row, and text lookups don't each make an API call. f must
+    # not modify the buffer, e.g. it's a motion.
+    #
+    # Args:
+    #   view (View):
+    #   f (callable): The transformer, called with (view, selection).
+    #   before (int): The number of lines before the selections f reads.
+    #   after (int): The number of lines after the selections f reads.
+    sels = list(view.sel())
+    if len(sels) >= _BATCH_MIN_SELECTIONS:
+        _regions_transformer(sels, BufferSnapshot(view, sels, before, after), f, False)
+    else:
+        _regions_transformer(sels, view, f, False)
+
+
 def _transform_first_non_blank(view, s) -> Region:
     return Region(next_non_blank(view, view.line(s.begin()).a))
 
@@ -213,62 +239,31 @@ def row_at(view, pt: int) -> int:
 
 
 def next_non_blank(view, pt: int) -> int:
-    limit = view.size()
-    substr = view.substr
-    while substr(pt) in ' \t' and pt <= limit:
-        pt += 1
-
-    return pt
+    return BufferReader(view).skip_forward(pt, ' \t')
 
 
 def prev_non_blank(view, pt: int) -> int:
-    substr = view.substr
-    while substr(pt) in ' \t' and pt > 0:
-        pt -= 1
-
-    return pt
+    return BufferReader(view).skip_backward(pt, ' \t')
 
 
 def prev_blank(view, pt: int) -> int:
-    substr = view.substr
-    while pt >= 0 and substr(pt) not in '\t ':
-        pt -= 1
-
-    return pt
+    return BufferReader(view).find_backward(pt, '\t ')
 
 
 def next_blank(view, pt: int) -> int:
-    limit = view.size()
-    substr = view.substr
-    while substr(pt) not in ' \t' and pt <= limit:
-        pt += 1
-
-    return pt
+    return BufferReader(view).find_forward(pt, ' \t')
 
 
 def prev_non_nl(view, pt: int) -> int:
-    substr = view.substr
-    while substr(pt) in '\n' and pt > 0:
-        pt -= 1
-
-    return pt
+    return BufferReader(view).skip_backward(pt, '\n')
 
 
 def prev_non_ws(view, pt: int) -> int:
-    substr = view.substr
-    while substr(pt) in ' \t\n' and pt > 0:
-        pt -= 1
-
-    return pt
+    return BufferReader(view).skip_backward(pt, ' \t\n')
 
 
 def next_non_ws(view, pt: int) -> int:
-    limit = view.size()
-    substr = view.substr
-    while substr(pt) in ' \t\n' and pt <= limit:
-        pt += 1
-
-    return pt
+    return BufferReader(view).skip_forward(pt, ' \t\n')
 
 
 def last_row(view) -> int:
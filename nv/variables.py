@@ -63,9 +63,17 @@ def get(name: str) -> str:
     return _variables.get(name, _defaults.get(name))
 
 
+def _clear_tokenize_cache() -> None:
+    # Import inline to avoid circular reference.
+    from NeoVintageous.nv.vi.keys import clear_tokenize_cache
+    clear_tokenize_cache()
+
+
 def set(name: str, value: str) -> None:
     _variables[name] = value
+    _clear_tokenize_cache()
 
 
 def clear_variables() -> None:
     _variables.clear()
+    _clear_tokenize_cache()
@@ -0,0 +1,173 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+import re
+
+from sublime import Region
+
+from NeoVintageous.nv.vi.structure import get_structure_index
+
+# The size, in characters, of the first chunk of buffer text scanned for
+# brackets. Each chunk after that is twice the size of the previous one, so
+# that nearby brackets are found with small reads and far away brackets are
+# found in a small number of reads.
+_CHUNK_SIZE = 4096
+
+
+def _iter_chunks(view, pt: int, forward: bool):
+    # Yields (offset, text) chunks of the buffer text from pt to the end of the
+    # buffer, or from pt back to the start of the buffer.
+    size = _CHUNK_SIZE
+    if forward:
+        end = view.size()
+        while pt < end:
+            b = min(end, pt + size)
+            yield pt, view.substr(Region(pt, b))
+            pt = b
+            size *= 2
+    else:
+        while pt > 0:
+            a = max(0, pt - size)
+            yield a, view.substr(Region(a, pt))
+            pt = a
+            size *= 2
+
+
+def _is_escaped(view, text: str, offset: int, index: int) -> bool:
+    if index > 0:
+        return text[index - 1] == '\\'
+
+    return offset > 0 and view.substr(offset - 1) == '\\'
+
+
+def _iter_brackets(view, pt: int, brackets: tuple, forward: bool, selector: str):
+    # Yields the (pt, char) brackets, in order, that aren't escaped and that
+    # match the selector, if a selector is given. When a bracket doesn't match
+    # the selector, then the rest of the scope it's in is skipped too, so that
+    # e.g. a string full of brackets is skipped with a single scope lookup.
+    pattern = re.compile('[%s]' % re.escape(brackets[0] + brackets[1]))
+    skip = None
+
+    for offset, text in _iter_chunks(view, pt, forward):
+        matches = pattern.finditer(text)
+        if not forward:
+            matches = reversed(list(matches))
+
+        for match in matches:
+            index = match.start()
+            bracket_pt = offset + index
+
+            if skip and skip.begin() <= bracket_pt < skip.end():
+                continue
+
+            if _is_escaped(view, text, offset, index):
+                continue
+
+            if selector and not view.match_selector(bracket_pt, selector):
+                skip = view.extract_scope(bracket_pt)
+                continue
+
+            yield bracket_pt, text[index]
+
+
+class _BracketIndex():
+
+    # The brackets of a buffer, in order, and the index of their matching
+    # bracket, or -1 if they're unbalanced.
+
+    def __init__(self, view, brackets: tuple, selector: str):
+        self.positions = []  # type: list
+        self.partners = []  # type: list
+        self.opening = []  # type: list
+
+        stack = []  # type: list
+        for i, (pt, char) in enumerate(_iter_brackets(view, 0, brackets, True, selector)):
+            self.positions.append(pt)
+            self.partners.append(-1)
+            if char == brackets[0]:
+                self.opening.append(True)
+                stack.append(i)
+            else:
+                self.opening.append(False)
+                if stack:
+                    partner = stack.pop()
+                    self.partners[partner] = i
+                    self.partners[i] = partner
+
+    def find(self, pt: int, forward: bool, count: int):
+        # Balanced pairs are skipped over in one step. Searching forward, any
+        # closing bracket that isn't skipped over has its opening bracket
+        # before pt, and so it's unbalanced from pt. An unbalanced opening
+        # bracket means that all the closing brackets after it are balanced.
+        # The same applies, in reverse, searching backward.
+        if forward:
+            i = bisect_left(self.positions, pt)
+            step = 1
+        else:
+            i = bisect_left(self.positions, pt) - 1
+            step = -1
+
+        while 0 <= i < len(self.positions):
+            if self.opening[i] == forward:
+                if self.partners[i] == -1:
+                    return None
+
+                i = self.partners[i] + step
+            else:
+                count -= 1
+                if count == 0:
+                    return self.positions[i]
+
+                i += step
+
+        return None
+
+
+def find_unbalanced_bracket(view, pt: int, brackets: tuple, forward: bool = True, count: int = 1, selector: str = None):
+    # Find the count'th bracket that isn't balanced by a matching bracket.
+    #
+    # The buffer text is scanned in a single pass, in chunks, keeping count of
+    # the nesting depth. Searching forward finds a closing bracket at or after
+    # pt and searching backward finds an opening bracket before pt. Repeated
+    # searches of an unchanged buffer use an index of the bracket pairs.
+    #
+    # Brackets preceded by a backslash are ignored, and when a selector is
+    # given, so are brackets that don't match the selector.
+    #
+    # Args:
+    #   :brackets (tuple): The opening and closing bracket characters e.g.
+    #       ('(', ')').
+    #
+    # Returns:
+    #   int|None: The position of the bracket, or None if there isn't one.
+    key = ('brackets', brackets, selector, view.settings().get('syntax') if selector else None)
+    index = get_structure_index(view, key, lambda: _BracketIndex(view, brackets, selector))
+    if index is not None:
+        return index.find(pt, forward, count)
+
+    target = brackets[1] if forward else brackets[0]
+    depth = count
+    for bracket_pt, char in _iter_brackets(view, pt, brackets, forward, selector):
+        if char == target:
+            depth -= 1
+            if depth == 0:
+                return bracket_pt
+        else:
+            depth += 1
+
+    return None
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
+from functools import partial
 import re
 
 from NeoVintageous.nv import variables
@@ -28,14 +30,35 @@ from NeoVintageous.nv.vim import VISUAL_BLOCK
 from NeoVintageous.nv.vim import VISUAL_LINE
 
 
+class CommandDefs(dict):
+    # The command definitions of a mode, by sequence.
+    #
+    # Assigning a definition stores a partial of its class, and the definition
+    # is instantiated when it's first looked up, so that the hundreds of
+    # definitions don't all need to be instantiated at startup.
+
+    def __getitem__(self, seq: str):
+        command = dict.__getitem__(self, seq)
+        if isinstance(command, partial):
+            command = self[seq] = command()
+
+        return command
+
+    def get(self, seq: str, default=None):
+        try:
+            return self[seq]
+        except KeyError:
+            return default
+
+
 mappings = {
-    INSERT: {},
-    NORMAL: {},
-    OPERATOR_PENDING: {},
-    SELECT: {},
-    VISUAL: {},
-    VISUAL_BLOCK: {},
-    VISUAL_LINE: {}
+    INSERT: CommandDefs(),
+    NORMAL: CommandDefs(),
+    OPERATOR_PENDING: CommandDefs(),
+    SELECT: CommandDefs(),
+    VISUAL: CommandDefs(),
+    VISUAL_BLOCK: CommandDefs(),
+    VISUAL_LINE: CommandDefs()
 }  # type: dict
 
 
@@ -125,106 +148,104 @@ def resolve_keypad_count(key: str) -> str:
     return key
 
 
-class KeySequenceTokenizer():
-    """Takes in a sequence of key names and tokenizes it."""
-
-    _EOF = -2
-
-    def __init__(self, source: str):
-        """Sequence of key names in Vim notation."""
-        self.idx = -1
-        self.source = source
+_MODIFIERS = ('c', 's', 'm', 'd', 'a')
 
-    def _consume(self):
-        self.idx += 1
-        if self.idx >= len(self.source):
-            self.idx -= -1
-            return self._EOF
-        return self.source[self.idx]
 
-    def _peek_one(self):
-        if (self.idx + 1) >= len(self.source):
-            return self._EOF
-        return self.source[self.idx + 1]
+def _sort_modifiers(modifiers: str) -> str:
+    """Ensure consistency in the order of modifier letters according to c > m > s."""
+    if len(modifiers) == 6:
+        modifiers = 'c-m-s-'
+    elif len(modifiers) > 2:
+        if modifiers.startswith('s-') and modifiers.endswith('c-'):
+            modifiers = 'c-s-'
+        elif modifiers.startswith('s-') and modifiers.endswith('m-'):
+            modifiers = 'm-s-'
+        elif modifiers.startswith('m-') and modifiers.endswith('c-'):
+            modifiers = 'c-m-'
+    return modifiers
 
-    def _is_named_key(self, key: str) -> bool:
-        return key.lower() in _NAMED_KEYS
 
-    def _sort_modifiers(self, modifiers: str) -> str:
-        """Ensure consistency in the order of modifier letters according to c > m > s."""
-        if len(modifiers) == 6:
-            modifiers = 'c-m-s-'
-        elif len(modifiers) > 2:
-            if modifiers.startswith('s-') and modifiers.endswith('c-'):
-                modifiers = 'c-s-'
-            elif modifiers.startswith('s-') and modifiers.endswith('m-'):
-                modifiers = 'm-s-'
-            elif modifiers.startswith('m-') and modifiers.endswith('c-'):
-                modifiers = 'c-m-'
-        return modifiers
-
-    def _long_key_name(self) -> str:
-        key_name = ''
-        modifiers = ''
+def _long_key_name(name: str, source: str) -> str:
+    # Args:
+    #   name (str): The text between the angle brackets of a key notation.
+    #   source (str): The sequence being tokenized (used in error messages).
+    key_name = ''
+    modifiers = ''
+
+    i = 0
+    end = len(name)
+    while i < end:
+        c = name[i]
+        if c.lower() in _MODIFIERS and (i + 1) < end and name[i + 1] == '-':
+            # <A-...> is aliased to <M-...>
+            if c.lower() == 'a':
+                c = 'm'
+
+            if c.lower() in modifiers.lower():
+                raise ValueError('invalid modifier sequence: {0}'.format(source))
+
+            modifiers += c + '-'
+            i += 2
+        else:
+            key_name += c
+            i += 1
 
-        while True:
-            c = self._consume()
+    modifiers = _sort_modifiers(modifiers.lower())
 
-            if c == self._EOF:
-                raise ValueError("expected '>' at index {0}".format(self.idx))
+    if len(key_name) == 1:
+        if not modifiers:
+            raise ValueError('wrong sequence {0}'.format(source))
 
-            elif (c.lower() in ('c', 's', 'm', 'd', 'a')) and (self._peek_one() == '-'):
-                # <A-...> is aliased to <M-...>
-                if c.lower() == 'a':
-                    c = 'm'
+        return '<' + modifiers.upper() + key_name + '>'
 
-                if c.lower() in modifiers.lower():
-                    raise ValueError('invalid modifier sequence: {0}'.format(self.source))
+    named_key = _resolve_named_key_alias(key_name.lower())
+    if ('<' + named_key + '>') in _NAMED_KEYS:
+        return '<' + modifiers.upper() + named_key + '>'
 
-                modifiers += c + self._consume()
+    raise ValueError("'<{0}>' is not a known key".format(key_name))
 
-            elif c == '>':
-                modifiers = self._sort_modifiers(modifiers.lower())
 
-                if len(key_name) == 1:
-                    if not modifiers:
-                        raise ValueError('wrong sequence {0}'.format(self.source))
+# A key is either a single character or a key notation like <C-w> or <Esc>. An
+# opening angle bracket that is never closed is matched on its own so that it
+# can be reported as an error.
+_TOKEN_PATTERN = re.compile('<[^>]*>?|.', re.DOTALL)
 
-                    return '<' + modifiers.upper() + key_name + '>'
 
-                elif self._is_named_key('<' + _resolve_named_key_alias(key_name.lower()) + '>'):
-                    return '<' + modifiers.upper() + _resolve_named_key_alias(key_name.lower()) + '>'
+@lru_cache(maxsize=512)
+def _tokenize(source: str, leader: str) -> tuple:
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(source):
+        token = match.group(0)
+        if token[0] == '<':
+            if token[-1] != '>' or len(token) == 1:
+                raise ValueError("expected '>' at index {0}".format(len(source)))
 
-                else:
-                    raise ValueError("'<{0}>' is not a known key".format(key_name))
+            token = _long_key_name(token[1:-1], source)
+            if token == seqs.LEADER:
+                token = leader
 
-            else:
-                key_name += c
+        tokens.append(token)
 
-    def _tokenize_one(self):
-        c = self._consume()
+    return tuple(tokens)
 
-        if c == '<':
-            return self._expand_vars(self._long_key_name())
-        else:
-            return c
 
-    def _iter_tokenize(self):
-        while True:
-            token = self._tokenize_one()
-            if token == self._EOF:
-                break
-            yield token
+def tokenize_keys(keys: str) -> tuple:
+    # Tokens are memoized per sequence, so the same tuple is shared by dot
+    # repeat, macros, and mapping expansion. The leader is part of the key
+    # because it's expanded during tokenization.
+    return _tokenize(keys, variables.get(seqs.LEADER))
 
-    def _expand_vars(self, c: str) -> str:
-        return variables.get(c) if variables.is_key_name(c) else c
 
+_BARE_COMMAND_NAME_PATTERN = re.compile(r'^(?:".)?(?:[1-9]+)?')
 
-def tokenize_keys(keys: str) -> list:
-    return KeySequenceTokenizer(keys)._iter_tokenize()
 
+@lru_cache(maxsize=512)
+def _to_bare_command_name(seq: str, leader: str) -> str:
+    if seq == '0':
+        return seq
 
-_BARE_COMMAND_NAME_PATTERN = re.compile(r'^(?:".)?(?:[1-9]+)?')
+    # Account for d2d and similar sequences.
+    return ''.join(k for k in _tokenize(_BARE_COMMAND_NAME_PATTERN.sub('', seq), leader) if not k.isdigit())
 
 
 def to_bare_command_name(seq: str) -> str:
@@ -235,13 +256,12 @@ def to_bare_command_name(seq: str) -> str:
     #   str: The command sequence with register and counts strips e.g. 2daw ->
     #       daw, "a2d2aw -> daw, etc. The special case '0' is returned
     #       unmodified.
-    if seq == '0':
-        return seq
+    return _to_bare_command_name(seq, variables.get(seqs.LEADER))
 
-    # Account for d2d and similar sequences.
-    new_seq = list(tokenize_keys(_BARE_COMMAND_NAME_PATTERN.sub('', seq)))
 
-    return ''.join(k for k in new_seq if not k.isdigit())
+def clear_tokenize_cache() -> None:
+    _tokenize.cache_clear()
+    _to_bare_command_name.cache_clear()
 
 
 def assign(seq: str, modes, *args, **kwargs):
@@ -251,7 +271,8 @@ def assign(seq: str, modes, *args, **kwargs):
     The registered key sequence must be known to NeoVintageous. The
     registered command must be a ViMotionDef or ViOperatorDef.
 
-    The decorated class is instantiated with `*args` and `**kwargs`.
+    The decorated class is instantiated with `*args` and `**kwargs` when
+    it's first looked up.
 
     @keys
       A list of (`mode:tuple`, `sequence:string`) pairs to map the decorated
@@ -259,6 +280,6 @@ def assign(seq: str, modes, *args, **kwargs):
     """
     def inner(cls):
         for mode in modes:
-            mappings[mode][seq] = cls(*args, **kwargs)
+            mappings[mode][seq] = partial(cls, *args, **kwargs)
         return cls
     return inner
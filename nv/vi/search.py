@@ -18,6 +18,7 @@
 from sublime import Region
 
 from NeoVintageous.nv.options import get_option
+from NeoVintageous.nv.polyfill import view_rfind_all
 
 
 # DEPRECATED Use view_find_in_range()
@@ -140,56 +141,27 @@ def find_last_in_range(view, term: str, start: int, end: int, flags: int = 0):
 #
 # TODO should word the same as view.find() and return Region(-1, -1), rather than None, when not found
 def reverse_search(view, term: str, start: int, end: int, flags: int = 0):
-    if start < 0 or end > view.size():
-        return None
-
-    lo_line = view.full_line(start)
-    hi_line = view.full_line(end)
-
-    while True:
-        low_row, hi_row = view.rowcol(lo_line.a)[0], view.rowcol(hi_line.a)[0]
-        middle_row = (low_row + hi_row) // 2
-
-        middle_line = view.full_line(view.text_point(middle_row, 0))
+    return _reverse_search(view, term, start, end, flags, linewise=True)
 
-        lo_region = Region(lo_line.a, middle_line.b)
-        hi_region = Region(middle_line.b, min(hi_line.b, end))
 
-        if find_in_range(view, term, hi_region.a, hi_region.b, flags):
-            lo_line = view.full_line(middle_line.b)
-        elif find_in_range(view, term, lo_region.a, lo_region.b, flags):
-            hi_line = view.full_line(middle_line.a)
-        else:
-            return None
-
-        if lo_line == hi_line:
-            # we found the line we were looking for, now extract the match.
-            return find_last_in_range(view, term, hi_line.a, min(hi_line.b, end), flags)
+def reverse_search_by_pt(view, term: str, start: int, end: int, flags: int = 0):
+    return _reverse_search(view, term, start, end, flags, linewise=False)
 
 
-def reverse_search_by_pt(view, term: str, start: int, end: int, flags: int = 0):
+def _reverse_search(view, term: str, start: int, end: int, flags: int, linewise: bool):
+    # Find the last line with a match and then the last match in that line. The
+    # buffer is searched backward from @end in chunks, see view_rfind_all(), so
+    # nearby matches are found without searching the whole buffer.
     if start < 0 or end > view.size():
         return None
 
-    lo_line = view.full_line(start)
-    hi_line = view.full_line(end)
-
-    while True:
-        low_row, hi_row = view.rowcol(lo_line.a)[0], view.rowcol(hi_line.a)[0]
-        middle_row = (low_row + hi_row) // 2
-
-        middle_line = view.full_line(view.text_point(middle_row, 0))
+    for match in view_rfind_all(view, term, end, flags, stop_pt=view.full_line(start).a):
+        # Zero-length matches are not found by find_in_range().
+        if match.empty():
+            continue
 
-        lo_region = Region(lo_line.a, middle_line.b)
-        hi_region = Region(middle_line.b, min(hi_line.b, end))
+        line = view.full_line(match.a)
 
-        if find_in_range(view, term, hi_region.a, hi_region.b, flags):
-            lo_line = view.full_line(middle_line.b)
-        elif find_in_range(view, term, lo_region.a, lo_region.b, flags):
-            hi_line = view.full_line(middle_line.a)
-        else:
-            return None
+        return find_last_in_range(view, term, line.a if linewise else max(line.a, start), min(line.b, end), flags)
 
-        if lo_line == hi_line:
-            # we found the line we were looking for, now extract the match.
-            return find_last_in_range(view, term, max(hi_line.a, start), min(hi_line.b, end), flags)
+    return None
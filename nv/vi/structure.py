@@ -0,0 +1,56 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.nv.session import get_session_view_value
+from NeoVintageous.nv.session import set_session_view_value
+
+
+def get_structure_index(view, key, build):
+    # Get a structural index of the buffer e.g. of the matching bracket pairs.
+    #
+    # Indexes are built lazily: the first request for an index at the current
+    # change count returns None, and the caller searches the buffer directly,
+    # because a single search near the cursor is cheaper than indexing the
+    # whole buffer. The index is built on the second request and then reused
+    # until the buffer changes. Indexes are stored in the view session, so
+    # they're evicted when the view is closed.
+    #
+    # Args:
+    #   :key (hashable): Identifies the index.
+    #   :build (callable): Builds the index.
+    #
+    # Returns:
+    #   The index, or None if it hasn't been requested before.
+    change_count = view.change_count()
+    cache = get_session_view_value(view, 'structure_index')
+    if cache is None or cache['change_count'] != change_count:
+        cache = {'change_count': change_count, 'indexes': {}, 'requested': set()}
+        set_session_view_value(view, 'structure_index', cache)
+
+    try:
+        return cache['indexes'][key]
+    except KeyError:
+        pass
+
+    if key not in cache['requested']:
+        cache['requested'].add(key)
+
+        return None
+
+    index = cache['indexes'][key] = build()
+
+    return index
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from bisect import bisect_left
+from bisect import bisect_right
 import re
 
 from sublime import CLASS_EMPTY_LINE
@@ -32,15 +34,16 @@ from NeoVintageous.nv.polyfill import view_find
 from NeoVintageous.nv.polyfill import view_find_in_range
 from NeoVintageous.nv.polyfill import view_indentation_level
 from NeoVintageous.nv.polyfill import view_indented_region
-from NeoVintageous.nv.polyfill import view_rfind_all
 from NeoVintageous.nv.settings import get_setting
 from NeoVintageous.nv.utils import get_insertion_point_at_b
 from NeoVintageous.nv.utils import next_non_blank
 from NeoVintageous.nv.utils import next_non_ws
 from NeoVintageous.nv.utils import prev_non_blank
 from NeoVintageous.nv.utils import prev_non_ws
+from NeoVintageous.nv.vi.brackets import find_unbalanced_bracket
 from NeoVintageous.nv.vi.search import find_in_range
 from NeoVintageous.nv.vi.search import reverse_search_by_pt
+from NeoVintageous.nv.vi.structure import get_structure_index
 from NeoVintageous.nv.vi.units import word_starts
 
 
@@ -452,109 +455,36 @@ def get_text_object_region(view, s: Region, text_object: str, inclusive: bool =
 
 
 def find_next_lone_bracket(view, start: int, items, unbalanced: int = 0):
-    # TODO: Extract common functionality from here and the % motion instead of
-    # duplicating code.
-    new_start = start
-    for i in range(unbalanced or 1):
-        next_closing_bracket = find_in_range(
-            view,
-            items[1],
-            start=new_start,
-            end=view.size(),
-            flags=IGNORECASE
-        )
-
-        if next_closing_bracket is None:
-            # Unbalanced items; nothing we can do.
-            return
-
-        while view.substr(next_closing_bracket.begin() - 1) == '\\':
-            next_closing_bracket = find_in_range(view, items[1],
-                                                 start=next_closing_bracket.end(),
-                                                 end=view.size(),
-                                                 flags=IGNORECASE)
-            if next_closing_bracket is None:
-                return
-
-        new_start = next_closing_bracket.end()
-
-    if view.substr(start) == items[0][-1]:
+    # Find the closing bracket, at or after start, of the bracket pair that
+    # start is in. A bracket under the cursor is part of the pair.
+    #
+    # Args:
+    #   :items (tuple): The regex escaped opening and closing brackets.
+    #   :unbalanced (int): The number of unbalanced closing brackets to skip.
+    brackets = (items[0][-1], items[1][-1])
+    if view.substr(start) == brackets[0]:
         start += 1
 
-    nested = 0
-    while True:
-        next_opening_bracket = find_in_range(view, items[0],
-                                             start=start,
-                                             end=next_closing_bracket.b,
-                                             flags=IGNORECASE)
-        if not next_opening_bracket:
-            break
-
-        nested += 1
-        start = next_opening_bracket.end()
-
-    if nested > 0:
-        return find_next_lone_bracket(view, next_closing_bracket.end(),
-                                      items,
-                                      nested)
-    else:
-        return next_closing_bracket
+    pt = find_unbalanced_bracket(view, start, brackets, forward=True, count=unbalanced or 1)
+    if pt is not None:
+        return Region(pt, pt + 1)
 
 
 def find_prev_lone_bracket(view, start: int, tags, unbalanced: int = 0):
-    # TODO: Extract common functionality from here and the % motion instead of
-    # duplicating code.
-
-    # XXX: refactor this
-    if view.substr(start) == (tags[0][1] if len(tags[0]) > 1 else tags[0]):
+    # Find the opening bracket, at or before start, of the bracket pair that
+    # start is in. A bracket under the cursor is part of the pair.
+    #
+    # Args:
+    #   :tags (tuple): The regex escaped opening and closing brackets.
+    #   :unbalanced (int): The number of unbalanced opening brackets to skip.
+    brackets = (tags[0][-1], tags[1][-1])
+    if view.substr(start) == brackets[0]:
         if not unbalanced and view.substr(start - 1) != '\\':
             return Region(start, start + 1)
 
-    new_start = start
-    for i in range(unbalanced or 1):
-        prev_opening_bracket = reverse_search_by_pt(view, tags[0],
-                                                    start=0,
-                                                    end=new_start,
-                                                    flags=IGNORECASE)
-
-        if prev_opening_bracket is None:
-            # Unbalanced tags; nothing we can do.
-            return
-
-        while view.substr(prev_opening_bracket.begin() - 1) == '\\':
-            prev_opening_bracket = reverse_search_by_pt(
-                view,
-                tags[0],
-                start=0,
-                end=prev_opening_bracket.begin(),
-                flags=IGNORECASE
-            )
-
-            if prev_opening_bracket is None:
-                return
-
-        new_start = prev_opening_bracket.begin()
-
-    nested = 0
-    while True:
-        next_closing_bracket = reverse_search_by_pt(view,
-                                                    tags[1],
-                                                    start=prev_opening_bracket.a,
-                                                    end=start,
-                                                    flags=IGNORECASE)
-        if not next_closing_bracket:
-            break
-
-        nested += 1
-        start = next_closing_bracket.begin()
-
-    if nested > 0:
-        return find_prev_lone_bracket(view,
-                                      prev_opening_bracket.begin(),
-                                      tags,
-                                      nested)
-    else:
-        return prev_opening_bracket
+    pt = find_unbalanced_bracket(view, start, brackets, forward=False, count=unbalanced or 1)
+    if pt is not None:
+        return Region(pt, pt + 1)
 
 
 def find_paragraph_text_object(view, s: Region, inclusive: bool = True, count: int = 1) -> Region:
@@ -825,7 +755,7 @@ def next_end_tag(view, pattern: str = RX_ANY_TAG, start: int = 0, end: int = -1)
     if region.a == -1:
         return None, None, None
 
-    match = re.search(pattern, view.substr(region))
+    match = re.search(pattern, view.substr(region), re.IGNORECASE)
     if match:
         return (region, match.group(1), match.group(0).startswith('</'))
 
@@ -838,7 +768,7 @@ def previous_begin_tag(view, pattern: str, start: int = 0, end: int = 0) -> tupl
     if not region:
         return None, None, None
 
-    match = re.search(pattern, view.substr(region))
+    match = re.search(pattern, view.substr(region), re.IGNORECASE)
     if match:
         return (region, match.group(1), match.group(0)[1] != '/')
 
@@ -873,6 +803,58 @@ def get_closest_tag(view, pt: int):
     return next_tag
 
 
+class _TagIndex():
+
+    # The tags of a buffer, in order, so that searching for the next or the
+    # previous tag doesn't need to search the buffer.
+
+    def __init__(self, view):
+        self.tags = []  # type: list
+        self.begins = []  # type: list
+        self._named = {}  # type: dict
+
+        # Tags can overlap, e.g. "<x<b>", so try a match at every "<".
+        text = view.substr(Region(0, view.size()))
+        match_tag = re.compile(RX_ANY_TAG, re.IGNORECASE).match
+        pt = text.find('<')
+        while pt != -1:
+            match = match_tag(text, pt)
+            if match:
+                self.tags.append((match.start(), match.end(), match.group(1), match.group(0).startswith('</')))
+                self.begins.append(match.start())
+
+            pt = text.find('<', pt + 1)
+
+    def next_end_tag(self, view, pattern: str = RX_ANY_TAG, start: int = 0, end: int = -1) -> tuple:
+        # Same as next_end_tag().
+        i = bisect_left(self.begins, start)
+        if i == len(self.tags):
+            return None, None, None
+
+        a, b, name, is_end_tag = self.tags[i]
+
+        return Region(a, b), name, is_end_tag
+
+    def previous_begin_tag(self, view, name: str, start: int = 0, end: int = 0) -> tuple:
+        # Same as previous_begin_tag() with the RX_ANY_TAG_NAMED_TPL pattern,
+        # which matches the tags with names that start with name.
+        key = name.lower()
+        try:
+            tags, ends = self._named[key]
+        except KeyError:
+            tags = [tag for tag in self.tags if tag[2].lower().startswith(key)]
+            ends = [tag[1] for tag in tags]
+            self._named[key] = (tags, ends)
+
+        i = bisect_right(ends, end) - 1
+        if i < 0:
+            return None, None, None
+
+        a, b, tag_name, is_end_tag = tags[i]
+
+        return Region(a, b), tag_name[:len(name)], not is_end_tag
+
+
 def find_containing_tag(view, start: int) -> tuple:
     # Args:
     #   view (sublime.View)
@@ -888,25 +870,33 @@ def find_containing_tag(view, start: int) -> tuple:
     if closest_tag.contains(start) and view.substr(closest_tag)[1] == '/':
         start = closest_tag.a
 
+    # Repeated searches of an unchanged buffer use an index of the tags.
+    index = get_structure_index(view, 'tags', lambda: _TagIndex(view))
+
     end_region, tag_name = next_unbalanced_tag(
         view,
-        search=next_end_tag,
+        search=index.next_end_tag if index else next_end_tag,
         search_args={'pattern': RX_ANY_TAG, 'start': start},
-        restart_at=get_region_end
+        restart_at=get_region_end,
+        tags=[]
     )
 
     if not end_region:
         return None, None, None
 
+    if index:
+        search = index.previous_begin_tag
+        search_args = {'name': tag_name, 'start': 0, 'end': end_region.a}
+    else:
+        search = previous_begin_tag
+        search_args = {'pattern': RX_ANY_TAG_NAMED_TPL.format(tag_name), 'start': 0, 'end': end_region.a}
+
     begin_region, _ = next_unbalanced_tag(
         view,
-        search=previous_begin_tag,
-        search_args={
-            'pattern': RX_ANY_TAG_NAMED_TPL.format(tag_name),
-            'start': 0,
-            'end': end_region.a
-        },
-        restart_at=get_region_begin
+        search=search,
+        search_args=search_args,
+        restart_at=get_region_begin,
+        tags=[]
     )
 
     if not begin_region:
@@ -973,16 +963,16 @@ def find_next_item_match_pt(view, s: Region):
                     if begin_tag:
                         return begin_tag.a + 1 if end_tag.contains(pt) else end_tag.a + 1
 
-    # Find the next item after or under the cursor.
-    bracket = view_find(view, '|'.join(map(re_escape, targets)), pt)
-    if not bracket:
-        return
-
-    # Only accept items found within the current cursor line.
-    if bracket.b > view.line(pt).b:
+    # Find the next item after or under the cursor, but only within the
+    # current cursor line.
+    line_text = view.substr(Region(pt, view.line(pt).b))
+    for i, target in enumerate(line_text):
+        if target in targets:
+            bracket_pt = pt + i
+            break
+    else:
         return
 
-    target = view.substr(bracket)
     target_index = targets.index(target)
     targets_open = targets[::2]
     forward = True if target in targets_open else False
@@ -995,37 +985,6 @@ def find_next_item_match_pt(view, s: Region):
     accepted_selector = 'punctuation|text.plain|comment'
 
     if forward:
-        counter = 0
-        start = bracket.b
-        while True:
-            bracket = view_find(view, '|'.join(map(re_escape, target_pair)), start)
-            if not bracket:
-                return
-
-            if view.match_selector(bracket.a, accepted_selector):
-                if view.substr(bracket) == target:
-                    counter += 1
-                else:
-                    if counter == 0:
-                        return bracket.a
-
-                    counter -= 1
-
-            start = bracket.b
-    else:
-        # Note the use of view_rfind_all(), because Sublime doesn't have any
-        # APIs to do reverse searches and finding *all* matches before a point
-        # is easier and more effiecient, at least in a userland implemention.
-        counter = 0
-        start = bracket.a
-        for bracket in view_rfind_all(view, '|'.join(map(re_escape, target_pair)), start):
-            if view.match_selector(bracket.a, accepted_selector):
-                if view.substr(bracket) == target:
-                    counter += 1
-                else:
-                    if counter == 0:
-                        return bracket.a
-
-                    counter -= 1
-
-            start = bracket.a
+        return find_unbalanced_bracket(view, bracket_pt + 1, target_pair, forward=True, selector=accepted_selector)
+
+    return find_unbalanced_bracket(view, bracket_pt, target_pair, forward=False, selector=accepted_selector)
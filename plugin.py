@@ -41,6 +41,12 @@ if not logger.hasHandlers():
 
 import sublime  # noqa: E402
 
+# To profile the startup set the SUBLIME_NEOVINTAGEOUS_PROFILE environment
+# variable to a non-blank value. The profiler needs to be started before any
+# other modules are loaded, so that it can time their imports.
+from NeoVintageous.nv import profiler  # noqa: E402
+profiler.start()
+
 # The plugin loading is designed to handle errors gracefully.
 #
 # When upgrading the plugin, changes to the plugin structure can cause import
@@ -61,15 +67,9 @@ try:
     # Commands.
     from NeoVintageous.nv.commands import *  # noqa: F401,F403
 
-    # Plugins.
-    from NeoVintageous.nv.plugin_abolish import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_commentary import *  # noqa: F401,F403
+    # Plugins. The plugins are imported on first use, see nv/plugin.py.
+    from NeoVintageous.nv.plugin import *  # noqa: F401,F403
     from NeoVintageous.nv.plugin_input_method import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_multiple_cursors import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_sneak import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_sublime import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_surround import *  # noqa: F401,F403
-    from NeoVintageous.nv.plugin_unimpaired import *  # noqa: F401,F403
 
     # Events.
     from NeoVintageous.nv.events import *  # noqa: F401,F403
@@ -78,6 +78,8 @@ except Exception as e:  # pragma: no cover
     traceback.print_exc()
     _startup_exception = e
 
+profiler.stop_imports()
+
 
 def _update_ignored_packages():
 
@@ -166,7 +168,8 @@ def _init_backwards_compat_patches():
 
 def plugin_loaded():
 
-    _init_backwards_compat_patches()
+    with profiler.phase('backwards compat patches'):
+        _init_backwards_compat_patches()
 
     loading_exeption = None
     package_control_event = None
@@ -184,21 +187,25 @@ def plugin_loaded():
         loading_exeption = e
 
     try:
-        _update_ignored_packages()
+        with profiler.phase('update ignored packages'):
+            _update_ignored_packages()
     except Exception as e:  # pragma: no cover
         traceback.print_exc()
         loading_exeption = e
 
     try:
-        load_session()
-        load_rc()
+        with profiler.phase('load session'):
+            load_session()
+        with profiler.phase('load rc'):
+            load_rc()
     except Exception as e:  # pragma: no cover
         traceback.print_exc()
         loading_exeption = e
 
     if _startup_exception or loading_exeption:  # pragma: no cover
 
-        clean_views()
+        with profiler.phase('clean views'):
+            clean_views()
 
         if isinstance(_startup_exception, ImportError) or isinstance(loading_exeption, ImportError):
             if package_control_event == 'post_upgrade':
@@ -218,6 +225,8 @@ def plugin_loaded():
         print('NeoVintageous: ERROR', message)
         sublime.message_dialog(message)
 
+    profiler.print_report()
+
 
 def plugin_unloaded():
     clean_views()
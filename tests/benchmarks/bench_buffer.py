@@ -0,0 +1,72 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from sublime import active_window
+
+from NeoVintageous.nv.utils import next_non_ws
+from NeoVintageous.nv.utils import prev_non_ws
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+class _CountingView:
+
+    # Counts the calls to the view API.
+
+    def __init__(self, view):
+        self._view = view
+        self.calls = 0
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._view, name)
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+def _next_non_ws_per_char(view, pt: int) -> int:
+    # The scan one character at a time, for comparison.
+    limit = view.size()
+    substr = view.substr
+    while substr(pt) in ' \t\n' and pt <= limit:
+        pt += 1
+
+    return pt
+
+
+def run(sizes: tuple = (10, 1000, 100000)) -> None:
+    # Scans runs of whitespace of increasing sizes, e.g. a large blank region.
+    for size in sizes:
+        view = active_window().new_file()
+        try:
+            view.run_command('append', {'characters': 'fizz' + ' \n\t' * size + 'buzz'})
+            end = view.size() - 5
+
+            for name, func, pt in (('per char next_non_ws', _next_non_ws_per_char, 4),
+                                   ('next_non_ws', next_non_ws, 4),
+                                   ('prev_non_ws', prev_non_ws, end)):
+                counting_view = _CountingView(view)
+                func(counting_view, pt)
+                print('{:<60} {:>12d} calls'.format('%s (%d chars)' % (name, size * 3), counting_view.calls))
+                report('%s (%d chars)' % (name, size * 3), measure(lambda: func(view, pt), number=10))
+        finally:
+            view.set_scratch(True)
+            view.close()
@@ -0,0 +1,53 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.nv.ex.parser import parse_command_line
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+# Command lines like those found in a .neovintageousrc file, in modelines, and
+# in :global commands. The time to route a command should not depend on its
+# position in the route table, e.g. "xnoremap" is near the end.
+_CORPUS = (
+    'set hlsearch',
+    'set noignorecase',
+    'let mapleader=,',
+    'nnoremap <leader>w :w<CR>',
+    'noremap j gj',
+    'vnoremap < <gv',
+    'xnoremap > >gv',
+    'onoremap ip :<C-u>normal! vip<CR>',
+    'unmap Q',
+    '%s/foo/bar/g',
+    '1,$d',
+    '.,+3yank',
+    'g/fizz/d',
+    'write',
+    'wq',
+    'xit',
+    'tabnext',
+    'vsplit',
+)
+
+
+def run(number: int = 1000) -> None:
+    for source in _CORPUS:
+        report('parse %r' % source, measure(lambda: parse_command_line(source), number=number))
+
+    report('parse corpus (%d lines)' % len(_CORPUS), measure(
+        lambda: [parse_command_line(source) for source in _CORPUS], number=number))
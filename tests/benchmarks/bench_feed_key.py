@@ -0,0 +1,58 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from timeit import default_timer
+import tracemalloc
+
+from sublime import active_window
+
+from NeoVintageous.nv.feed_key import FeedKeyHandler
+from NeoVintageous.nv.settings import set_mode
+from NeoVintageous.nv.vim import NORMAL
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def _feed(view, keys: str) -> None:
+    for key in keys:
+        FeedKeyHandler(view, key, 0, True, False).handle()
+
+
+def run(count: int = 10000) -> None:
+    # Feeds count keys through the key handler. Pairs of keys like "fx" and
+    # "rx" exercise the input collection path of the command state.
+    view = active_window().new_file()
+    try:
+        view.run_command('insert', {'characters': 'x' * 80 + '\n'})
+        view.sel().clear()
+        view.sel().add(0)
+        set_mode(view, NORMAL)
+
+        keys = ('fx0' * (count // 3 + 1))[:count]
+
+        tracemalloc.start()
+        start = default_timer()
+        _feed(view, keys)
+        elapsed = default_timer() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report('feed key (%d keys) total' % count, elapsed)
+        report('feed key (%d keys) per key' % count, elapsed / count)
+        print('{:<60} {:>12} KiB'.format('feed key (%d keys) peak traced memory' % count, peak // 1024))
+    finally:
+        view.set_scratch(True)
+        view.close()
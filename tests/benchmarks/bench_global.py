@@ -0,0 +1,47 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from sublime import active_window
+
+from NeoVintageous.nv.ex_cmds import do_ex_cmdline
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def run(sizes: tuple = (1000, 10000, 100000)) -> None:
+    # Runs :global with each of the commands that change the lines, on every
+    # 10th line of buffers of increasing sizes.
+    for size in sizes:
+        window = active_window()
+        view = window.new_file()
+        try:
+            view.run_command('append', {'characters': ''.join(
+                'fizz %d\n' % i if i % 10 else 'buzz %d\n' % i for i in range(size))})
+
+            for name, command in (('delete', ':g/buzz/d'),
+                                  ('inverse', ':v/fizz/d'),
+                                  ('substitute', ':g/buzz/s//BUZZ/'),
+                                  ('move', ':g/buzz/m0'),
+                                  ('copy', ':g/buzz/t$')):
+                def global_() -> None:
+                    do_ex_cmdline(window, command)
+                    view.run_command('undo')
+
+                report(':g %s (%d lines)' % (name, size), measure(global_, number=1, repeat=3))
+        finally:
+            view.set_scratch(True)
+            view.close()
@@ -0,0 +1,37 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from timeit import default_timer
+from unittest import mock
+
+from NeoVintageous.nv.history import _storage
+from NeoVintageous.nv.history import history_add
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def run(total: int = 100000, step: int = 10000) -> None:
+    # The time per add should stay flat as the history fills up to, and then
+    # evicts at, its capacity. Every 7th item is a duplicate of a recent one.
+    with mock.patch.dict('NeoVintageous.nv.history._storage', {k: {'num': 0, 'items': {}} for k in _storage}), \
+            mock.patch.dict('NeoVintageous.nv.session._session', {}), \
+            mock.patch('NeoVintageous.nv.history.maybe_do_runtime_save_session_changes', lambda *changes: None):
+        for block in range(0, total, step):
+            start = default_timer()
+            for i in range(block, block + step):
+                history_add(':', 'cmd%d' % (i - 3 if i % 7 == 0 else i))
+
+            report('history add (%d to %d adds)' % (block, block + step), (default_timer() - start) / step)
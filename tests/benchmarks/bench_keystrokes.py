@@ -0,0 +1,237 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# Keystroke latency: replays key notation through the ProcessNotationHandler,
+# i.e. the path from a key press through FeedKeyHandler.handle(),
+# mappings_resolve(), and evaluate_state() to the commands run, against
+# buffers from 1 KB to 100 MB. Reports the p50 and p99 latency per key and,
+# when run against the headless API stand-in (tests/headless), the API calls
+# per key. Ex commands, e.g. ":%s/a/b/g<CR>", are reported per command
+# instead, because the command-line isn't replayed key by key. The results
+# can be written as JSON, and two results compared, to catch regressions
+# between releases:
+#
+#   from NeoVintageous.tests.benchmarks import bench_keystrokes
+#   bench_keystrokes.run(output='/tmp/keys-1.35.3.json', label='1.35.3')
+#   bench_keystrokes.compare('/tmp/keys-1.35.2.json', '/tmp/keys-1.35.3.json')
+
+from timeit import default_timer
+import json
+
+import sublime
+
+from NeoVintageous.nv.ex_cmds import do_ex_cmdline
+from NeoVintageous.nv.process_notation import ProcessNotationHandler
+from NeoVintageous.nv.settings import set_mode
+from NeoVintageous.nv.utils import hide_panel
+from NeoVintageous.nv.vi.keys import tokenize_keys
+from NeoVintageous.nv.vim import NORMAL
+from NeoVintageous.tests.benchmarks.benchmark import percentile
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+_KB = 1024
+_MB = 1024 * _KB
+
+# The buffer sizes, in bytes, and the number of samples taken at each.
+_SIZES = (
+    (_KB, 50),
+    (100 * _KB, 20),
+    (10 * _MB, 5),
+    (100 * _MB, 3),
+)
+
+_NOTATIONS = (
+    'j',
+    'w',
+    '$',
+    'gg',
+    'G',
+    'x',
+    'dd',
+    'yyp',
+    '3dw',
+    'ci"',
+    'daw',
+    '>>',
+    '*',
+    '/foo<CR>nnn',
+    ':%s/a/b/g<CR>',
+)
+
+_LINE = 'def foo(bar, baz="a quoted string"):  # the quick brown fox\n'
+
+
+def _size_name(size: int) -> str:
+    if size >= _MB:
+        return '%d MB' % (size // _MB)
+
+    return '%d KB' % (size // _KB)
+
+
+def _api_calls() -> int:
+    # The number of API calls made, or -1 if they are not counted, i.e. the
+    # benchmark is running in Sublime Text.
+    try:
+        return sum(sublime.api_calls.values())  # type: ignore[attr-defined]
+    except AttributeError:
+        return -1
+
+
+def _new_view(text: str):
+    view = sublime.active_window().new_file()
+    view.set_scratch(True)
+    view.run_command('append', {'characters': text})
+
+    return view
+
+
+def _close(view) -> None:
+    view.set_scratch(True)
+    view.close()
+
+
+def _is_ex_command(notation: str) -> bool:
+    return notation.startswith(':') and notation.endswith('<CR>')
+
+
+def _unit(notation: str) -> str:
+    return 'command' if _is_ex_command(notation) else 'key'
+
+
+def _keys(notation: str) -> int:
+    # The number of keys replayed, or 1 for an ex command, which is replayed
+    # as one command.
+    return 1 if _is_ex_command(notation) else len(tokenize_keys(notation))
+
+
+def _replay(view, notation: str) -> None:
+    if _is_ex_command(notation):
+        # The command-line is interactive, so only the ":" that opens it is
+        # replayed. The command-line is then entered as <CR> enters it.
+        ProcessNotationHandler(view, ':', None, True).handle()
+        hide_panel(view.window())
+        do_ex_cmdline(view.window(), notation[:-4])
+    else:
+        ProcessNotationHandler(view, notation, None, True).handle()
+
+
+def _sample(view, notation: str, keys: int) -> tuple:
+    # Returns the seconds and the number of API calls per key, or per command
+    # for an ex command, of replaying notation from the middle of the buffer in normal mode.
+    view.sel().clear()
+    view.sel().add(view.text_point(view.rowcol(view.size())[0] // 2, 0))
+    set_mode(view, NORMAL)
+
+    calls = _api_calls()
+    start = default_timer()
+    _replay(view, notation)
+    elapsed = default_timer() - start
+    if calls >= 0:
+        calls = _api_calls() - calls
+
+    return elapsed / keys, calls / keys if calls >= 0 else None
+
+
+def run(sizes: tuple = _SIZES, notations: tuple = _NOTATIONS, output: str = None, label: str = '') -> list:
+    # Runs each notation the number of samples for each size, on a fresh
+    # buffer whenever a sample has changed it. Returns the results, and
+    # writes them to output, if given, as JSON.
+    results = []
+    for size, samples in sizes:
+        text = _LINE * max(1, size // len(_LINE))
+        for notation in notations:
+            keys = _keys(notation)
+            unit = _unit(notation)
+            latencies = []
+            calls = []
+            view = _new_view(text)
+            change_count = view.change_count()
+            try:
+                for _ in range(samples):
+                    if view.change_count() != change_count:
+                        _close(view)
+                        view = _new_view(text)
+                        change_count = view.change_count()
+
+                    latency, api_calls = _sample(view, notation, keys)
+                    latencies.append(latency)
+                    calls.append(api_calls)
+            finally:
+                _close(view)
+
+            result = {
+                'notation': notation,
+                'size': size,
+                'bytes': len(text),
+                'samples': samples,
+                'unit': unit,
+                'p50': percentile(latencies, 50),
+                'p99': percentile(latencies, 99),
+                'api_calls_per_key': None if calls[0] is None else percentile(calls, 50),
+            }
+
+            results.append(result)
+
+            name = '%s (%s)' % (notation, _size_name(size))
+            report(name + ' p50 per ' + unit, result['p50'])
+            report(name + ' p99 per ' + unit, result['p99'])
+            if result['api_calls_per_key'] is not None:
+                print('{:<60} {:>12.1f} calls'.format(name + ' API calls per ' + unit, result['api_calls_per_key']))
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'label': label,
+                'sublime': sublime.version(),
+                'platform': sublime.platform(),
+                'results': results,
+            }, f, indent=4)
+
+    return results
+
+
+def compare(baseline: str, current: str, threshold: float = 0.1) -> list:
+    # Compares the p50 and p99 latencies of two results files written by run()
+    # and returns the results that are slower than the baseline by more than
+    # threshold, e.g. 0.1 is 10%.
+    def load(file_name: str) -> dict:
+        with open(file_name, encoding='utf-8') as f:
+            return {(r['notation'], r['size']): r for r in json.load(f)['results']}
+
+    before = load(baseline)
+    after = load(current)
+    regressions = []
+    for key, result in sorted(after.items(), key=lambda item: (item[0][1], item[0][0])):
+        if key not in before:
+            continue
+
+        for stat in ('p50', 'p99'):
+            old = before[key][stat]
+            new = result[stat]
+            change = (new - old) / old if old else 0.0
+            regressed = change > threshold
+            if regressed and result not in regressions:
+                regressions.append(result)
+
+            print('{:<50} {:>10.3f} us {:>10.3f} us {:>+8.1%}{}'.format(
+                '%s (%s) %s per %s' % (key[0], _size_name(key[1]), stat, _unit(key[0])),
+                old * 1000000,
+                new * 1000000,
+                change,
+                '  REGRESSION' if regressed else ''))
+
+    return regressions
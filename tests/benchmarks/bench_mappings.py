@@ -0,0 +1,51 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest import mock
+
+from NeoVintageous.nv.mappings import _PrefixTrie
+from NeoVintageous.nv.mappings import _has_partial_matches
+from NeoVintageous.nv.mappings import _mappings
+from NeoVintageous.nv.mappings import mappings_add
+from NeoVintageous.nv.vim import NORMAL
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+class _View:
+
+    def __init__(self, file_name: str):
+        self._file_name = file_name
+
+    def file_name(self) -> str:
+        return self._file_name
+
+
+def _populate(size: int) -> None:
+    for i in range(size):
+        mappings_add(NORMAL, ',x%d' % i, ':NeoVintageousBench%d<CR>' % i)
+        mappings_add(NORMAL, 'FileType', 'js,php ,y%d :NeoVintageousBench%d<CR>' % (i, i))
+
+
+def run(sizes: tuple = (10, 100, 1000, 10000)) -> None:
+    view = _View('/tmp/bench.php')
+    for size in sizes:
+        with mock.patch.dict('NeoVintageous.nv.mappings._mappings', {k: {} for k in _mappings}, clear=True), \
+                mock.patch.dict('NeoVintageous.nv.mappings._mappings_index', {k: _PrefixTrie() for k in _mappings}, clear=True):  # noqa: E501
+            _populate(size)
+            report('partial match hit  (%d mappings)' % size, measure(lambda: _has_partial_matches(view, NORMAL, ',y')))
+            report('partial match miss (%d mappings)' % size, measure(lambda: _has_partial_matches(view, NORMAL, ',z')))
@@ -0,0 +1,53 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest import mock
+
+from sublime import Region
+from sublime import active_window
+
+from NeoVintageous.nv.polyfill import set_selection
+from NeoVintageous.nv.vim import NORMAL
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def run(cursors: tuple = (10, 100, 1000, 5000)) -> None:
+    # Runs motions with a cursor on each line of buffers of increasing sizes,
+    # with and without reading the buffer up front.
+    for count in cursors:
+        view = active_window().new_file()
+        try:
+            view.run_command('append', {'characters': ''.join(
+                '    fizz buzz %d\n' % i for i in range(count))})
+            starts = [Region(view.text_point(row, 4)) for row in range(count)]
+
+            for name, command, args in (('l', 'nv_vi_l', {'mode': NORMAL}),
+                                        ('j', 'nv_vi_j', {'mode': NORMAL, 'xpos': 4}),
+                                        ('$', 'nv_vi_dollar', {'mode': NORMAL}),
+                                        ('^', 'nv_vi_hat', {'mode': NORMAL})):
+                def motion() -> None:
+                    set_selection(view, starts)
+                    view.run_command(command, args)
+
+                with mock.patch('NeoVintageous.nv.utils._BATCH_MIN_SELECTIONS', count + 1):
+                    report('%s per cursor (%d cursors)' % (name, count), measure(motion, number=1, repeat=3))
+
+                report('%s batched (%d cursors)' % (name, count), measure(motion, number=1, repeat=3))
+        finally:
+            view.set_scratch(True)
+            view.close()
@@ -0,0 +1,45 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from sublime import LITERAL
+from sublime import active_window
+
+from NeoVintageous.nv.polyfill import view_rfind
+from NeoVintageous.nv.vi.search import reverse_search
+from NeoVintageous.nv.vi.search import reverse_search_by_pt
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def run(sizes: tuple = (1000, 10000, 100000, 1000000)) -> None:
+    # Searches backward from the end of buffers of increasing sizes for a match
+    # a few lines away. The time should not depend on the buffer size.
+    for size in sizes:
+        view = active_window().new_file()
+        try:
+            view.run_command('append', {'characters': 'fizz buzz\n' * size + 'needle\n' + 'fizz buzz\n' * 5})
+            end = view.size()
+
+            report('reverse_search (%d lines)' % size, measure(
+                lambda: reverse_search(view, 'needle', 0, end, LITERAL), number=100))
+            report('reverse_search_by_pt (%d lines)' % size, measure(
+                lambda: reverse_search_by_pt(view, 'needle', 0, end, LITERAL), number=100))
+            report('view_rfind (%d lines)' % size, measure(
+                lambda: view_rfind(view, 'needle', end, LITERAL), number=100))
+        finally:
+            view.set_scratch(True)
+            view.close()
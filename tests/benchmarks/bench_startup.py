@@ -0,0 +1,58 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+import sys
+
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def _is_nv_module(name: str) -> bool:
+    return name == 'NeoVintageous.nv' or name.startswith('NeoVintageous.nv.')
+
+
+def _startup(eager: bool) -> None:
+    # Import the modules the plugin imports at startup, from scratch.
+    for name in [name for name in sys.modules if _is_nv_module(name)]:
+        del sys.modules[name]
+
+    from NeoVintageous.nv import commands  # noqa: F401
+    from NeoVintageous.nv import events  # noqa: F401
+    from NeoVintageous.nv import plugin
+    from NeoVintageous.nv import plugin_input_method  # noqa: F401
+    from NeoVintageous.nv.vi import keys
+
+    if eager:
+        plugin.load_plugins()
+        for defs in list(keys.mappings.values()) + list(plugin.mappings.values()):
+            for seq in defs:
+                defs.get(seq)
+
+
+def run(number: int = 5) -> None:
+    # The reimported modules are discarded, and the loaded modules restored.
+    saved = {name: module for name, module in sys.modules.items() if _is_nv_module(name)}
+    try:
+        report('eager startup', measure(lambda: _startup(eager=True), number=number, repeat=3))
+        report('lazy startup', measure(lambda: _startup(eager=False), number=number, repeat=3))
+    finally:
+        for name in [name for name in sys.modules if _is_nv_module(name)]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+        for name, module in saved.items():
+            parent, _, child = name.rpartition('.')
+            setattr(sys.modules[parent], child, module)
@@ -0,0 +1,44 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from sublime import active_window
+
+from NeoVintageous.tests.benchmarks.benchmark import measure
+from NeoVintageous.tests.benchmarks.benchmark import report
+
+
+def run(sizes: tuple = (1000, 10000, 100000, 500000)) -> None:
+    # Substitutes every 1000th line, every line, and counts the matches, of
+    # buffers of increasing sizes.
+    for size in sizes:
+        view = active_window().new_file()
+        try:
+            view.run_command('append', {'characters': ''.join(
+                'fizz %d\n' % i if i % 1000 else 'buzz %d\n' % i for i in range(size))})
+
+            for name, command in (('sparse', ':%s/buzz/BUZZ/g'),
+                                  ('dense', ':%s/fizz/FIZZ/g'),
+                                  ('count', ':%s/fizz//gn')):
+                def substitute() -> None:
+                    view.run_command('nv_ex_cmd_edit_wrap', {'_line': command})
+                    if name != 'count':
+                        view.run_command('undo')
+
+                report(':s %s (%d lines)' % (name, size), measure(substitute, number=1, repeat=3))
+        finally:
+            view.set_scratch(True)
+            view.close()
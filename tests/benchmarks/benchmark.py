@@ -0,0 +1,55 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# Benchmarks are not collected by the test runner. Run them from the Sublime
+# Text console, for example:
+#
+#   from NeoVintageous.tests.benchmarks import bench_mappings
+#   bench_mappings.run()
+#
+# Or outside Sublime Text, against the headless sublime API stand-in, which
+# also counts the API calls made; see tests/headless/run.py:
+#
+#   python3 tests/headless/run.py bench --api-calls NeoVintageous.tests.benchmarks.bench_mappings
+
+from timeit import default_timer
+import math
+
+
+def measure(func, number: int = 1000, repeat: int = 5) -> float:
+    # Return the best average time, in seconds, of calling func number times.
+    best = None
+    for _ in range(repeat):
+        start = default_timer()
+        for _ in range(number):
+            func()
+        elapsed = (default_timer() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def report(name: str, seconds: float) -> None:
+    print('{:<60} {:>12.3f} us'.format(name, seconds * 1000000))
+
+
+def percentile(samples: list, p: float) -> float:
+    # Return the p-th percentile of samples, by the nearest-rank method.
+    ordered = sorted(samples)
+
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
@@ -138,6 +138,8 @@ class TestCmdlineEditing(unittest.FunctionalTestCase):
         self.feed('<tab>')
         self.assertNormal(':nohlsearch|')
         self.feed('<tab>')
+        self.assertNormal(':normal|')
+        self.feed('<tab>')
         self.assertNormal(':noremap|')
         self.feed('<tab>')
         self.assertNormal(':nunmap|')
@@ -153,6 +155,8 @@ class TestCmdlineEditing(unittest.FunctionalTestCase):
         self.feed('<S-tab>')
         self.assertNormal(':noremap|')
         self.feed('<S-tab>')
+        self.assertNormal(':normal|')
+        self.feed('<S-tab>')
         self.assertNormal(':nohlsearch|')
         self.feed('<S-tab>')
         self.assertNormal(':nnoremap|')
@@ -37,6 +37,10 @@ class Test_dollar(unittest.FunctionalTestCase):
         self.eq('\n\n|\n\n\n', 'n_2$', '\n\n\n|\n\n')
         self.eq('\n\n|\n\n\n', 'n_3$', '\n\n\n\n|\n')
 
+    def test_n_many_cursors(self):
+        self.eq('|abc\nx\n' * 10, 'n_$', 'ab|c\nx\n' * 10)
+        self.eq('|abc\nxy\n' * 10, 'n_2$', 'abc\nx|y\n' * 10)
+
     def test_v(self):
         self.eq('one |two three', 'v_$', 'one |two three|')
         self.eq('one |two three\nfour', 'v_$', 'one |two three\n|four')
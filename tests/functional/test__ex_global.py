@@ -71,7 +71,7 @@ class Test_ex_global(unittest.FunctionalTestCase):
         self.assertStatusMessage('Command not supported: nohlsearch')
 
     def test_issue_78_with_range(self):
-        self.eq('|1\n2\n3\n4\n5\n6\n7\n8\n9\n0', ':3,6g/^/d', '1\n2\n|8\n9\n0')
+        self.eq('|1\n2\n3\n4\n5\n6\n7\n8\n9\n0', ':3,6g/^/d', '1\n2\n|7\n8\n9\n0')
 
     def test_issue_78_delete(self):
         self.eq('|fizz\n\nbuzz\n', ':global/^$/d', 'fizz\nbuz|z\n')
@@ -91,3 +91,52 @@ class Test_ex_global(unittest.FunctionalTestCase):
     def test_issue_78_print(self):
         self.eq('|a\n1\n2b\n3\na', ':global/\\d/p', '|a\n1\n2b\n3\na')
         self.assertExPrintOutput('1\n2b\n3\n')
+
+    def test_global_substitute(self):
+        self.eq('|ab\ncd\nab ab\n', ':g/ab/s/b/x/', 'ax\ncd\n|ax ab\n')
+        self.eq('|ab\ncd\nab ab\n', ':g/ab/s/b/x/g', 'ax\ncd\n|ax ax\n')
+        self.eq('|ab\ncd\nab ab\n', ':g/ab/s//x/g', 'x\ncd\n|x x\n')
+        self.eq('|ab\ncd\nab ab\n', ':g/c/s/^/# /', 'ab\n|# cd\nab ab\n')
+        self.eq('|ab\ncd\nab\n', ':g/^/s/^/# /', '# ab\n# cd\n|# ab\n')
+        self.eq('|1\nx2\n3\nx4\n5\nx6', ':2,4g/x/s/x/y/', '1\ny2\n3\n|y4\n5\nx6')
+
+    def test_global_move(self):
+        self.eq('|1\n2\n3\n', ':g/^/m0', '|3\n2\n1\n')
+        self.eq('|1\n2\n3', ':g/^/m0', '|3\n2\n1')
+        self.eq('|x1\n2\nx3\n4\n', ':g/x/m$', '2\n4\nx1\n|x3\n')
+        self.eq('|x1\n2\nx3\n4\n', ':g/x/move 0', '|x3\nx1\n2\n4\n')
+        self.eq('|x1\n2\nx3\n4\n', ':g/x/m.+1', '2\nx1\n4\n|x3\n')
+
+    def test_global_copy(self):
+        self.eq('|x1\n2\nx3\n', ':g/x/t.', 'x1\nx1\n2\nx3\n|x3\n')
+        self.eq('|x1\n2\nx3\n', ':g/x/t$', 'x1\n2\nx3\nx1\n|x3\n')
+        self.eq('|x1\n2\nx3', ':g/x/t$', 'x1\n2\nx3\nx1\n|x3')
+        self.eq('|x1\n2\nx3\n', ':g/x/t0', '|x3\nx1\nx1\n2\nx3\n')
+        self.eq('|x1\n2\nx3\n', ':g/x/copy $', 'x1\n2\nx3\nx1\n|x3\n')
+
+    def test_global_range_excludes_the_next_line(self):
+        self.eq('|a\nb\nc\nd\n', ':2,3g/^/d', 'a\n|d\n')
+        self.eq('|a\nb\nc\nd\n', ':2,3g/^/m0', '|c\nb\na\nd\n')
+        self.eq('|a\nb\nc\nd', ':2,3g/^/d', 'a\n|d')
+        self.eq('|a\nb\nc\nd\n', ':2,3g/$/s/$/!/', 'a\nb!\n|c!\nd\n')
+
+    def test_global_normal(self):
+        self.eq('|x1\n2\nx3\n', ':g/x/normal x', '1\n2\n|3\n')
+        self.eq('|x1\n2\nx3\n', ':g/x/normal dd', '2\n|')
+
+    def test_vglobal(self):
+        self.eq('|fizz\nxyz\nbuzz\n', ':v/^x/d', 'xyz\n|')
+        self.eq('|fizz\nxyz\nbuzz\n', ':vglobal/^x/d', 'xyz\n|')
+        self.eq('|fizz\nxyz\nbuzz\n', ':v/^x/m0', '|buzz\nfizz\nxyz\n')
+        self.eq('|fizz\nxyz\nbuzz\n', ':v/^x/s/z/Z/g', 'fiZZ\nxyz\n|buZZ\n')
+        self.eq('|fizz\nxyz\nbuzz\n', ':v/^q/d', '|')
+
+    @unittest.mock_status_message()
+    def test_vglobal_pattern_found_in_every_line(self):
+        self.normal('|fizz\nxyz\nbuzz\n')
+        self.feed(':v/z/d')
+        self.assertNormal('|fizz\nxyz\nbuzz\n')
+        self.assertStatusMessage('Pattern found in every line: z')
+
+    def test_global_delete_line_with_more_than_one_match(self):
+        self.eq('|1\nx2x\n3\nx4x\n', ':g/x/d', '1\n3\n|')
@@ -110,3 +110,15 @@ class Test_ex_help(unittest.FunctionalTestCase):
 
         self.feed(':help CTRL-W')
         self.assertHelpView('index.txt', '*CTRL-W*')
+
+    @unittest.skipIf(platform() == 'windows', 'Test does not work on Windows')
+    def test_help_view_is_reused(self):
+        self.normal('fi|zz')
+        self.feed(':help w')
+        self.assertHelpView('motion.txt', '*w*')
+        self.feed(':help b')
+        self.assertHelpView('motion.txt', '*b*')
+        self.feed(':help v_x')
+        self.assertHelpView('change.txt', '*v_x*')
+        help_views = [v for v in self.view.window().views() if is_help_view(v)]  # type: ignore[union-attr]
+        self.assertEqual(1, len(help_views))
@@ -0,0 +1,37 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+
+class Test_ex_normal(unittest.FunctionalTestCase):
+
+    def test_normal(self):
+        self.eq('a|bc\n', ':normal x', 'a|c\n')
+        self.eq('a|bc\n', ':norm x', 'a|c\n')
+        self.eq('a|bc\n', ':normal 2x', '|a\n')
+
+    def test_normal_range(self):
+        self.eq('|abc\ndef\nghi\n', ':1,2normal x', 'bc\n|ef\nghi\n')
+        self.eq('|abc\ndef\nghi\n', ':%normal dd', '|')
+
+    @unittest.mock_status_message()
+    def test_normal_requires_keys(self):
+        self.normal('a|bc\n')
+        self.feed(':normal')
+        self.assertNormal('a|bc\n')
+        self.assertStatusMessage('E471: Argument required')
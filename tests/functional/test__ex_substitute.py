@@ -20,6 +20,7 @@ from NeoVintageous.tests import unittest
 
 @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {})
 @unittest.mock.patch('NeoVintageous.nv.session.save_session', unittest.mock.Mock())
+@unittest.mock.patch('NeoVintageous.nv.session._append_journal', unittest.mock.Mock())
 class Test_ex_substitute(unittest.FunctionalTestCase):
 
     def test_substitute(self):
@@ -108,6 +109,119 @@ class Test_ex_substitute(unittest.FunctionalTestCase):
         self.eq('a\n|b\n\nc\n\nd\n\n', ':%substitute/$/,/', 'a,\nb,\n,\nc,\n,\nd,\n|,\n')
         self.eq('a\n|b\n\nc\n\nd\n\n', ':%substitute/$/,/g', 'a,\nb,\n,\nc,\n,\nd,\n|,\n')
 
+    @unittest.mock_status_message()
+    def test_n_flag_counts_matches_without_substituting(self):
+        self.eq('axxa\n|bxxb\ncxxc\n', ':%substitute/x/y/n', 'axxa\n|bxxb\ncxxc\n')
+        self.assertStatusMessage('3 matches on 3 lines')
+        self.eq('axxa\n|bxxb\ncxxc\n', ':%substitute/x/y/gn', 'axxa\n|bxxb\ncxxc\n')
+        self.assertStatusMessage('6 matches on 3 lines')
+        self.eq('axxa\n|bxxb\ncxxc\n', ':substitute/x/y/n', 'axxa\n|bxxb\ncxxc\n')
+        self.assertStatusMessage('1 match on 1 line')
+        self.eq('axxa\n|bxxb\ncxxc\n', ':%substitute/x/y/cn', 'axxa\n|bxxb\ncxxc\n')
+        self.assertStatusMessage('3 matches on 3 lines')
+
+    @unittest.mock_status_message()
+    def test_n_flag_no_match(self):
+        self.eq('a|bc', ':substitute/x/y/n', 'a|bc')
+        self.assertStatusMessage('E486: Pattern not found: x')
+
+    @unittest.mock_status_message()
+    def test_reports_substitutions(self):
+        self.eq('axxa\n|bxxb\ncxxc\n', ':%substitute/x/y/g', 'ayya\nbyyb\n|cyyc\n')
+        self.assertStatusMessage('6 substitutions on 3 lines')
+
+    @unittest.mock_status_message()
+    def test_does_not_report_two_substitutions(self):
+        self.eq('axxa\n|bxxb\ncxxc\n', ':substitute/x/y/g', 'axxa\n|byyb\ncxxc\n')
+        self.assertNoStatusMessage()
+
+    def test_only_changed_lines_are_replaced(self):
+        self.eq('axxa\n|bbb\ncxxc\nddd\nexxe\n', ':%substitute/x/y/g', 'ayya\nbbb\ncyyc\nddd\n|eyye\n')
+        self.eq('axxa\n|bbb\ncxxc\nddd\neee\n', ':%substitute/x/y/g', 'ayya\nbbb\ncyyc\nddd\n|eee\n')
+        self.eq('axxa\n|bxxb\ncxxc\n', ':%substitute/x/\\n/', 'a\nxa\nb\nxb\n|c\nxc\n')
+
+    def answer(self, cmdline, key: str) -> None:
+        # Cmdline(view, type, on_done, on_change, on_cancel)
+        on_change = cmdline.call_args[0][3]
+        on_change(key)
+
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.set_timeout', lambda f, t: f())
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.Cmdline')
+    def test_c_flag(self, cmdline):
+        self.normal('axxa\n|bxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/gc')
+        self.assertEqual(cmdline.return_value.prompt.call_args[1], {'caption': 'replace with y (y/n/a/q/l)?'})
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'n')
+        self.answer(cmdline, 'y')
+        self.assertContent('ayxa\nbyxb\ncxxc\n')
+        # An invalid answer asks again for the same match.
+        self.answer(cmdline, 'z')
+        self.assertContent('ayxa\nbyxb\ncxxc\n')
+        self.answer(cmdline, 'a')
+        self.assertContent('ayxa\nbyyb\ncyyc\n')
+        self.assertEqual(cmdline.return_value.prompt.call_count, 5)
+
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.set_timeout', lambda f, t: f())
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.Cmdline')
+    def test_c_flag_empty_answer_does_not_prompt_again(self, cmdline):
+        self.normal('axxa\n|bxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/gc')
+        self.answer(cmdline, '')
+        self.assertContent('axxa\nbxxb\ncxxc\n')
+        self.assertEqual(cmdline.return_value.prompt.call_count, 1)
+        self.answer(cmdline, 'y')
+        self.assertContent('ayxa\nbxxb\ncxxc\n')
+        self.assertEqual(cmdline.return_value.prompt.call_count, 2)
+
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.set_timeout', lambda f, t: f())
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.Cmdline')
+    def test_c_flag_quit(self, cmdline):
+        self.normal('axxa\n|bxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/c')
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'q')
+        self.answer(cmdline, 'y')
+        self.assertContent('ayxa\nbxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/c')
+        self.answer(cmdline, 'n')
+        self.answer(cmdline, 'l')
+        self.answer(cmdline, 'y')
+        self.assertContent('ayxa\nbyxb\ncxxc\n')
+        self.feed(':%substitute/x/y/c')
+        cmdline.call_args[0][4]()
+        self.answer(cmdline, 'y')
+        self.assertContent('ayxa\nbyxb\ncxxc\n')
+
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.set_timeout', lambda f, t: f())
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.Cmdline')
+    def test_c_flag_is_undone_in_one_step(self, cmdline):
+        self.normal('axxa\n|bxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/gc')
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'n')
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'a')
+        self.assertContent('ayxa\nbyyb\ncyyc\n')
+        self.feed('u')
+        self.assertContent('axxa\nbxxb\ncxxc\n')
+        self.feed(':%substitute/x/y/gc')
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'y')
+        cmdline.call_args[0][4]()
+        self.assertContent('ayya\nbxxb\ncxxc\n')
+        self.feed('u')
+        self.assertContent('axxa\nbxxb\ncxxc\n')
+
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.set_timeout', lambda f, t: f())
+    @unittest.mock.patch('NeoVintageous.nv.ex_cmds.Cmdline')
+    def test_c_flag_with_groups(self, cmdline):
+        self.normal('|a(x) b(xx)')
+        self.feed(':substitute/(\\(x+\\))/[\\1]/gc')
+        self.answer(cmdline, 'y')
+        self.answer(cmdline, 'y')
+        self.assertContent('a[(x)] b[(xx)]')
+
     @unittest.mock.patch('NeoVintageous.nv.session._session', {})
     @unittest.mock_status_message()
     def test_repeat_no_previous(self):
@@ -35,6 +35,10 @@ class Test_j(unittest.PatchFeedCommandXpos, unittest.FunctionalTestCase):
         self.eq('aaa bb|b\naaa\n', 'n_j', 'aaa bbb\naa|a\n')
         self.eq('aaa bbb |ccc\naaa\n', 'n_j', 'aaa bbb ccc\naa|a\n')
 
+    def test_n_many_cursors(self):
+        self.eq('a|bc\n' * 10 + 'abc', 'n_j', 'abc\n' + 'a|bc\n' * 9 + 'a|bc')
+        self.eq('ab|c\n\n' * 10 + 'abc', 'n_2j', 'abc\n\n' + 'ab|c\n\n' * 9 + 'ab|c')
+
     def test_v(self):
         self.eq('a|b|c\nabc', 'v_1j', 'a|bc\nab|c')
         self.eq('r_a|bc\nabc\nab|c', 'v_1j', 'r_abc\na|bc\nab|c')
@@ -28,6 +28,10 @@ class Test_l(unittest.FunctionalTestCase):
         self.eq('|', 'n_l', '|')
         self.eq('\n\n|\n\n', 'n_l', '\n\n|\n\n')
 
+    def test_n_many_cursors(self):
+        self.eq('|abc\n' * 10, 'n_l', 'a|bc\n' * 10)
+        self.eq('|abc\n\n' * 10, 'n_9l', 'ab|c\n\n' * 10)
+
     def test_v(self):
         self.eq('|abc', 'v_l', '|ab|c')
         self.eq('|abc', 'v_1l', '|ab|c')
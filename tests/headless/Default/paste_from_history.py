@@ -0,0 +1,39 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# A headless stand-in for the clipboard history of the Sublime Text Default
+# package. See ../sublime.py.
+
+
+class ClipboardHistory():
+
+    def __init__(self) -> None:
+        self.storage = []  # type: list
+
+    def push_text(self, text: str) -> None:
+        if text:
+            self.storage.insert(0, text)
+            del self.storage[15:]
+
+    def get(self) -> list:
+        return list(self.storage)
+
+    def clear(self) -> None:
+        self.storage = []
+
+
+g_clipboard_history = ClipboardHistory()
@@ -0,0 +1,107 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# Runs NeoVintageous benchmarks and tests outside Sublime Text, against the
+# headless sublime and sublime_plugin stand-ins in this directory.
+#
+#   python3 tests/headless/run.py bench NeoVintageous.tests.benchmarks.bench_motions
+#   python3 tests/headless/run.py bench --api-calls NeoVintageous.tests.benchmarks.bench_motions
+#   python3 tests/headless/run.py test NeoVintageous.tests.functional.test_j
+#
+# Benchmarks that write machine readable results, e.g. bench_keystrokes, are
+# passed --output:
+#
+#   python3 tests/headless/run.py bench --output=keys.json NeoVintageous.tests.benchmarks.bench_keystrokes
+#
+# The stand-ins are pure Python, so absolute timings are not comparable with
+# timings in Sublime Text, but relative timings and API call counts are.
+
+from importlib import import_module
+import os
+import sys
+import types
+import unittest
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(os.path.dirname(_HERE))
+
+
+def bootstrap() -> None:
+    # Loads the NeoVintageous plugin, as Sublime Text does at startup.
+    if _HERE not in sys.path:
+        sys.path.insert(0, _HERE)
+
+    import sublime
+    import sublime_plugin
+
+    if 'NeoVintageous' not in sys.modules:
+        package = types.ModuleType('NeoVintageous')
+        package.__path__ = [_ROOT]  # type: ignore[attr-defined]
+        sys.modules['NeoVintageous'] = package
+
+    sublime.add_package('NeoVintageous', _ROOT)
+    os.makedirs(os.path.join(sublime.packages_path(), 'User'), exist_ok=True)
+    sublime_plugin.reload_plugin('NeoVintageous.plugin')
+    sublime.active_window().new_file()
+    sublime.run_timeouts()
+
+
+def _print_api_calls() -> None:
+    import sublime
+
+    print('API calls:')
+    for name, count in sublime.api_calls.most_common():
+        print('  {:<40} {:>10}'.format(name, count))
+
+
+def main(argv: list) -> int:
+    api_calls = '--api-calls' in argv
+    output = None
+    for arg in argv:
+        if arg.startswith('--output='):
+            output = arg[9:]
+
+    argv = [arg for arg in argv if not arg.startswith('--')]
+    if len(argv) < 2 or argv[0] not in ('bench', 'test'):
+        print('usage: run.py bench [--api-calls] [--output=<file>] <module>...')
+        print('       run.py test <module>...')
+        return 2
+
+    bootstrap()
+
+    if argv[0] == 'bench':
+        import sublime
+
+        for name in argv[1:]:
+            sublime.reset_api_calls()
+            if output:
+                import_module(name).run(output=output)
+            else:
+                import_module(name).run()
+            if api_calls:
+                _print_api_calls()
+
+        return 0
+
+    suite = unittest.defaultTestLoader.loadTestsFromNames(argv[1:])
+    result = unittest.TextTestRunner(verbosity=1).run(suite)
+
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,1785 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# A headless, in-memory stand-in for the Sublime Text "sublime" module, for
+# running and profiling NeoVintageous outside Sublime Text, e.g. benchmarks
+# on large synthetic buffers in CI. It implements the parts of the API that
+# NeoVintageous uses, in pure Python. See run.py for how to use it.
+#
+# Every call to the View, Window, Selection, and Settings APIs, i.e. every
+# call that is a round trip to Sublime Text in the real API, is counted in
+# api_calls by its qualified name e.g. "View.substr".
+
+from bisect import bisect_right
+from collections import Counter
+from functools import wraps
+from itertools import accumulate
+from itertools import chain
+from itertools import count
+from operator import add
+import atexit
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+api_calls = Counter()  # type: Counter
+
+
+def reset_api_calls() -> None:
+    api_calls.clear()
+
+
+def _api(f):
+    name = f.__qualname__
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        api_calls[name] += 1
+
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+HOVER_TEXT = 1
+HOVER_GUTTER = 2
+HOVER_MARGIN = 3
+
+ENCODED_POSITION = 1
+TRANSIENT = 4
+FORCE_GROUP = 8
+SEMI_TRANSIENT = 16
+ADD_TO_SELECTION = 32
+REPLACE_MRU = 64
+CLEAR_TO_RIGHT = 128
+IGNORECASE = 2
+LITERAL = 1
+MONOSPACE_FONT = 1
+KEEP_OPEN_ON_FOCUS_LOST = 2
+WANT_EVENT = 4
+
+HTML = 1
+COOPERATE_WITH_AUTO_COMPLETE = 2
+HIDE_ON_MOUSE_MOVE = 4
+HIDE_ON_MOUSE_MOVE_AWAY = 8
+KEEP_ON_SELECTION_MODIFIED = 16
+HIDE_ON_CHARACTER_EVENT = 32
+
+DRAW_EMPTY = 1
+HIDE_ON_MINIMAP = 2
+DRAW_EMPTY_AS_OVERWRITE = 4
+PERSISTENT = 16
+DRAW_OUTLINED = 32
+DRAW_NO_FILL = 32
+DRAW_NO_OUTLINE = 256
+DRAW_SOLID_UNDERLINE = 512
+DRAW_STIPPLED_UNDERLINE = 1024
+DRAW_SQUIGGLY_UNDERLINE = 2048
+HIDDEN = 128
+NO_UNDO = 8192
+
+OP_EQUAL = 0
+OP_NOT_EQUAL = 1
+OP_REGEX_MATCH = 2
+OP_NOT_REGEX_MATCH = 3
+OP_REGEX_CONTAINS = 4
+OP_NOT_REGEX_CONTAINS = 5
+
+CLASS_WORD_START = 1
+CLASS_WORD_END = 2
+CLASS_PUNCTUATION_START = 4
+CLASS_PUNCTUATION_END = 8
+CLASS_SUB_WORD_START = 16
+CLASS_SUB_WORD_END = 32
+CLASS_LINE_START = 64
+CLASS_LINE_END = 128
+CLASS_EMPTY_LINE = 256
+
+INHIBIT_WORD_COMPLETIONS = 8
+INHIBIT_EXPLICIT_COMPLETIONS = 16
+
+DIALOG_CANCEL = 0
+DIALOG_YES = 1
+DIALOG_NO = 2
+
+UI_ELEMENT_SIDE_BAR = 1
+UI_ELEMENT_MINIMAP = 2
+UI_ELEMENT_TABS = 4
+UI_ELEMENT_STATUS_BAR = 8
+UI_ELEMENT_MENU = 16
+UI_ELEMENT_OPEN_FILES = 32
+
+LAYOUT_INLINE = 0
+LAYOUT_BELOW = 1
+LAYOUT_BLOCK = 2
+
+# The defaults of the Sublime Text preferences that NeoVintageous reads.
+_DEFAULT_PREFERENCES = {
+    'auto_indent': True,
+    'draw_white_space': 'selection',
+    'line_numbers': True,
+    'relative_line_numbers': False,
+    'scroll_context_lines': 0,
+    'spell_check': False,
+    'tab_size': 4,
+    'translate_tabs_to_spaces': False,
+    'word_separators': './\\()"\'-:,.;<>~!@#$%^&*|+=[]{}`~?',
+    'word_wrap': 'auto',
+    'wrap_width': 0,
+}
+
+# Each process has its own data directory, so that concurrent runs don't share
+# sessions, registers, and user settings.
+_DATA_PATH = tempfile.mkdtemp(prefix='sublime-headless-')
+_PACKAGES_PATH = os.path.join(_DATA_PATH, 'Packages')
+atexit.register(shutil.rmtree, _DATA_PATH, True)
+
+# The packages that resources are loaded from, by name e.g. "NeoVintageous".
+_packages = {}  # type: dict
+
+
+def add_package(name: str, path: str) -> None:
+    # Make the package at path available as Packages/{name}/... resources.
+    _packages[name] = path
+
+
+def version() -> str:
+    return '4169'
+
+
+def platform() -> str:
+    if sys.platform.startswith('darwin'):
+        return 'osx'
+
+    if sys.platform.startswith('win'):
+        return 'windows'
+
+    return 'linux'
+
+
+def arch() -> str:
+    return 'x64'
+
+
+def channel() -> str:
+    return 'stable'
+
+
+def executable_path() -> str:
+    return sys.executable
+
+
+def packages_path() -> str:
+    return _PACKAGES_PATH
+
+
+def installed_packages_path() -> str:
+    return os.path.join(os.path.dirname(_PACKAGES_PATH), 'Installed Packages')
+
+
+def cache_path() -> str:
+    return os.path.join(os.path.dirname(_PACKAGES_PATH), 'Cache')
+
+
+def _resource_path(name: str) -> str:
+    parts = name.split('/')
+    if len(parts) < 3 or parts[0] != 'Packages':
+        raise FileNotFoundError('resource not found')
+
+    if parts[1] in _packages:
+        return os.path.join(_packages[parts[1]], *parts[2:])
+
+    return os.path.join(_PACKAGES_PATH, *parts[1:])
+
+
+def load_resource(name: str) -> str:
+    try:
+        with open(_resource_path(name), encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        raise FileNotFoundError('resource not found')
+
+
+def load_binary_resource(name: str) -> bytes:
+    try:
+        with open(_resource_path(name), 'rb') as f:
+            return f.read()
+    except OSError:
+        raise FileNotFoundError('resource not found')
+
+
+def find_resources(pattern: str) -> list:
+    import fnmatch
+
+    found = []
+    for name, path in sorted(_packages.items()):
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for file in files:
+                if fnmatch.fnmatch(file, pattern):
+                    rel = os.path.relpath(os.path.join(root, file), path).replace(os.sep, '/')
+                    found.append('Packages/%s/%s' % (name, rel))
+
+    return found
+
+
+def _strip_json_comments(text: str) -> str:
+    # Removes // and /* */ comments, outside strings, and trailing commas.
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == '"':
+            j = i + 1
+            while j < n and text[j] != '"':
+                j += 2 if text[j] == '\\' else 1
+            out.append(text[i:j + 1])
+            i = j + 1
+        elif text.startswith('//', i):
+            i = text.find('\n', i)
+            if i == -1:
+                i = n
+        elif text.startswith('/*', i):
+            i = text.find('*/', i)
+            i = n if i == -1 else i + 2
+        else:
+            out.append(c)
+            i += 1
+
+    return re.sub(',(\\s*[\\]}])', '\\1', ''.join(out))
+
+
+def decode_value(data: str):
+    return json.loads(_strip_json_comments(data))
+
+
+def encode_value(value, pretty: bool = False) -> str:
+    return json.dumps(value, indent=4 if pretty else None)
+
+
+_clipboard = ''
+
+
+def get_clipboard(size_limit: int = 16777216) -> str:
+    return _clipboard
+
+
+def set_clipboard(text: str) -> None:
+    global _clipboard
+    _clipboard = text
+
+
+def status_message(msg: str) -> None:
+    _status_messages.append(msg)
+
+
+_status_messages = []  # type: list
+
+
+def error_message(msg: str) -> None:
+    print('error:', msg)
+
+
+def message_dialog(msg: str) -> None:
+    print('message:', msg)
+
+
+def ok_cancel_dialog(msg: str, ok_title: str = '', title: str = '') -> bool:
+    return True
+
+
+def yes_no_cancel_dialog(msg: str, yes_title: str = '', no_title: str = '', title: str = '') -> int:
+    return DIALOG_YES
+
+
+def log_commands(flag: bool = None) -> None:
+    pass
+
+
+def log_input(flag: bool = None) -> None:
+    pass
+
+
+def log_result_regex(flag: bool = None) -> None:
+    pass
+
+
+def score_selector(scope_name: str, selector: str) -> int:
+    return 0
+
+
+def find_syntax_for_file(path: str, first_line: str = ''):
+    return None
+
+
+def find_syntax_by_name(name: str) -> list:
+    return []
+
+
+def list_syntaxes() -> list:
+    return []
+
+
+def get_macro() -> list:
+    return []
+
+
+# Callbacks scheduled by set_timeout() and set_timeout_async(), as a list of
+# (due time, sequence, callback) tuples. Time is virtual, in milliseconds, so
+# that runs are deterministic: run_timeouts(), which the headless command
+# dispatch calls after each command, i.e. when Sublime Text would next get
+# back to its event loop, runs the callbacks that are due now, and
+# advance_time() moves the clock on.
+_timeouts = []  # type: list
+_timeouts_sequence = 0
+_clock = 0
+
+
+def set_timeout(f, timeout_ms: int = 0) -> None:
+    global _timeouts_sequence
+
+    _timeouts_sequence += 1
+    _timeouts.append((_clock + timeout_ms, _timeouts_sequence, f))
+
+
+def set_timeout_async(f, timeout_ms: int = 0) -> None:
+    set_timeout(f, timeout_ms)
+
+
+def run_timeouts() -> None:
+    while _timeouts:
+        _timeouts.sort(key=lambda t: t[:2])
+        due, _, f = _timeouts[0]
+        if due > _clock:
+            return
+
+        del _timeouts[0]
+        f()
+
+
+def advance_time(ms: int) -> None:
+    # Move the clock on by ms, running the callbacks as they fall due.
+    global _clock
+
+    end = _clock + ms
+    while True:
+        _timeouts.sort(key=lambda t: t[:2])
+        if not _timeouts or _timeouts[0][0] > end:
+            break
+
+        _clock = max(_clock, _timeouts[0][0])
+        run_timeouts()
+
+    _clock = end
+
+
+class Region():
+
+    __slots__ = ('a', 'b', 'xpos')
+
+    def __init__(self, a: int, b: int = None, xpos: int = -1) -> None:
+        if b is None:
+            b = a
+
+        self.a = a
+        self.b = b
+        self.xpos = xpos
+
+    def __str__(self) -> str:
+        return '(' + str(self.a) + ', ' + str(self.b) + ')'
+
+    def __repr__(self) -> str:
+        return '(' + str(self.a) + ', ' + str(self.b) + ')'
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __eq__(self, rhs) -> bool:
+        return isinstance(rhs, Region) and self.a == rhs.a and self.b == rhs.b
+
+    def __hash__(self) -> int:
+        return hash((self.a, self.b))
+
+    def __lt__(self, rhs) -> bool:
+        lhs_begin = self.begin()
+        rhs_begin = rhs.begin()
+
+        if lhs_begin == rhs_begin:
+            return self.end() < rhs.end()
+
+        return lhs_begin < rhs_begin
+
+    def __contains__(self, v) -> bool:
+        if isinstance(v, Region):
+            return v.a in self and v.b in self
+
+        return self.begin() <= v <= self.end()
+
+    def __iter__(self):
+        return iter((self.a, self.b))
+
+    def to_tuple(self) -> tuple:
+        return (self.a, self.b)
+
+    def empty(self) -> bool:
+        return self.a == self.b
+
+    def begin(self) -> int:
+        return self.a if self.a < self.b else self.b
+
+    def end(self) -> int:
+        return self.b if self.a < self.b else self.a
+
+    def size(self) -> int:
+        return abs(self.a - self.b)
+
+    def contains(self, x) -> bool:
+        return x in self
+
+    def cover(self, rhs):
+        a = min(self.begin(), rhs.begin())
+        b = max(self.end(), rhs.end())
+
+        if self.a < self.b:
+            return Region(a, b)
+
+        return Region(b, a)
+
+    def intersection(self, rhs):
+        if self.end() <= rhs.begin():
+            return Region(0)
+
+        if self.begin() >= rhs.end():
+            return Region(0)
+
+        return Region(max(self.begin(), rhs.begin()), min(self.end(), rhs.end()))
+
+    def intersects(self, rhs) -> bool:
+        lb = self.begin()
+        le = self.end()
+        rb = rhs.begin()
+        re_ = rhs.end()
+
+        return ((lb == rb and le == re_) or (rb > lb and rb < le) or (re_ > lb and re_ < le) or
+                (lb > rb and lb < re_) or (le > rb and le < re_))
+
+
+def _line_starts(text: str, offset: int) -> list:
+    # The starts of the lines after each newline in text, offset by offset.
+    # The start of each line is the sum of the lengths of the lines before it
+    # plus a newline for each, computed in C for speed.
+    ends = accumulate(chain((offset,), map(len, text.split('\n')[:-1])))
+    next(ends)
+
+    return list(map(add, ends, count(1)))
+
+
+class _GapBuffer():
+
+    # The text of a view, split at a gap into the text before the gap and the
+    # text after it. Edits are made at the gap, which is moved to each edit,
+    # so that edits near each other, e.g. typing, only copy the text between
+    # them. The text is held in strings rather than a list of characters so
+    # that buffers of hundreds of megabytes fit in memory. The whole text is
+    # computed on demand and kept until the next edit.
+    #
+    # The line starts are split at the gap too: the ones before the gap are
+    # positions, and the ones after it are positions relative to the end of
+    # the text, so that edits at the gap don't move them.
+
+    def __init__(self) -> None:
+        self._before = ''
+        self._after = ''
+        self._text = ''  # type: str
+        self._starts_before = [0]  # type: list
+        self._starts_after = []  # type: list
+
+    def __len__(self) -> int:
+        return len(self._before) + len(self._after)
+
+    def _move_gap(self, pt: int) -> None:
+        gap = len(self._before)
+        size = len(self)
+        if pt < gap:
+            self._after = self._before[pt:] + self._after
+            self._before = self._before[:pt]
+            i = bisect_right(self._starts_before, pt)
+            self._starts_after[0:0] = map((-size).__add__, self._starts_before[i:])
+            del self._starts_before[i:]
+        elif pt > gap:
+            self._before += self._after[:pt - gap]
+            self._after = self._after[pt - gap:]
+            i = bisect_right(self._starts_after, pt - size)
+            self._starts_before.extend(map(size.__add__, self._starts_after[:i]))
+            del self._starts_after[:i]
+
+    def insert(self, pt: int, text: str) -> None:
+        if text:
+            self._move_gap(pt)
+            self._before += text
+            self._text = None
+            self._starts_before.extend(_line_starts(text, pt))
+
+    def erase(self, a: int, b: int) -> None:
+        if a < b:
+            self._move_gap(a)
+            size = len(self)
+            self._after = self._after[b - a:]
+            self._text = None
+            del self._starts_after[:bisect_right(self._starts_after, b - size)]
+
+    def substr(self, a: int, b: int) -> str:
+        # The text from a to b, without computing the whole text.
+        if self._text is not None:
+            return self._text[a:b]
+
+        gap = len(self._before)
+        if b <= gap:
+            return self._before[a:b]
+
+        if a >= gap:
+            return self._after[a - gap:b - gap]
+
+        return self._before[a:] + self._after[:b - gap]
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._before + self._after
+
+        return self._text
+
+    def line_count(self) -> int:
+        return len(self._starts_before) + len(self._starts_after)
+
+    def line_start(self, i: int) -> int:
+        n = len(self._starts_before)
+        if i < n:
+            return self._starts_before[i]
+
+        return self._starts_after[i - n] + len(self)
+
+    def line_index(self, pt: int) -> int:
+        if pt <= len(self._before):
+            return bisect_right(self._starts_before, pt) - 1
+
+        return len(self._starts_before) + bisect_right(self._starts_after, pt - len(self)) - 1
+
+    def line_end(self, i: int) -> int:
+        if i + 1 < self.line_count():
+            return self.line_start(i + 1) - 1
+
+        return len(self)
+
+
+class Selection():
+
+    def __init__(self, view_id: int) -> None:
+        self.view_id = view_id
+        self._regions = []  # type: list
+
+    def __iter__(self):
+        api_calls['Selection.__iter__'] += 1
+
+        return iter([Region(r.a, r.b, r.xpos) for r in self._regions])
+
+    @_api
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    @_api
+    def __getitem__(self, index: int) -> Region:
+        region = self._regions[index]
+
+        return Region(region.a, region.b, region.xpos)
+
+    def __delitem__(self, index: int) -> None:
+        del self._regions[index]
+
+    def __eq__(self, rhs) -> bool:
+        return isinstance(rhs, Selection) and self._regions == rhs._regions
+
+    def __repr__(self) -> str:
+        return 'Selection(%r)' % self._regions
+
+    def __str__(self) -> str:
+        return str(self._regions)
+
+    @_api
+    def is_valid(self) -> bool:
+        return True
+
+    @_api
+    def clear(self) -> None:
+        self._regions = []
+
+    def _add(self, region) -> None:
+        if not isinstance(region, Region):
+            region = Region(region)
+
+        # Regions are clamped to the buffer, as in Sublime Text.
+        size = len(_views[self.view_id].buffer) if self.view_id in _views else sys.maxsize
+        self._regions.append(Region(max(0, min(region.a, size)), max(0, min(region.b, size)), region.xpos))
+
+    def _merge(self) -> None:
+        # Overlapping regions, and cursors inside other regions or at the
+        # same point as other cursors, are merged.
+        regions = sorted(self._regions)
+        merged = []  # type: list
+        for region in regions:
+            if merged:
+                last = merged[-1]
+                if region.begin() < last.end() or region == last:
+                    merged[-1] = region.cover(last) if last.empty() else last.cover(region)
+                    continue
+
+            merged.append(region)
+
+        self._regions = merged
+
+    @_api
+    def add(self, x) -> None:
+        self._add(x)
+        self._merge()
+
+    @_api
+    def add_all(self, regions) -> None:
+        for region in regions:
+            self._add(region)
+
+        self._merge()
+
+    @_api
+    def subtract(self, region: Region) -> None:
+        kept = []  # type: list
+        for r in self._regions:
+            if r.intersects(region) or region.contains(r):
+                if r.begin() < region.begin():
+                    kept.append(Region(r.begin(), region.begin()))
+                if r.end() > region.end():
+                    kept.append(Region(region.end(), r.end()))
+            else:
+                kept.append(r)
+
+        self._regions = kept
+
+    @_api
+    def contains(self, region: Region) -> bool:
+        return any(r.contains(region) for r in self._regions)
+
+    def _adjust(self, f) -> None:
+        for region in self._regions:
+            region.a = f(region.a)
+            region.b = f(region.b)
+
+        self._merge()
+
+
+class Settings():
+
+    def __init__(self, settings_id: int, parent=None) -> None:
+        self.settings_id = settings_id
+        self._values = {}  # type: dict
+        self._parent = parent
+        self._callbacks = []  # type: list
+
+    def _lookup(self, key: str):
+        settings = self
+        while settings is not None:
+            if key in settings._values:
+                return True, settings._values[key]
+
+            settings = settings._parent
+
+        return False, None
+
+    @_api
+    def get(self, key: str, default=None):
+        found, value = self._lookup(key)
+        if not found or value is None:
+            return default
+
+        return value
+
+    @_api
+    def has(self, key: str) -> bool:
+        return self._lookup(key)[0]
+
+    @_api
+    def set(self, key: str, value) -> None:
+        self._values[key] = value
+        self._changed()
+
+    @_api
+    def erase(self, key: str) -> None:
+        self._values.pop(key, None)
+        self._changed()
+
+    @_api
+    def to_dict(self) -> dict:
+        return dict(self._values)
+
+    @_api
+    def add_on_change(self, tag: str, callback) -> None:
+        self._callbacks.append((tag, callback))
+
+    @_api
+    def clear_on_change(self, tag: str) -> None:
+        self._callbacks = [c for c in self._callbacks if c[0] != tag]
+
+    def _changed(self) -> None:
+        for _, callback in list(self._callbacks):
+            callback()
+
+        for child in _settings_children.get(self.settings_id, ()):
+            child._changed()
+
+
+# The settings that inherit settings, by the id of the inherited settings.
+_settings_children = {}  # type: dict
+_settings_ids = iter(range(1, sys.maxsize))
+_loaded_settings = {}  # type: dict
+
+
+def _new_settings(parent=None) -> Settings:
+    settings = Settings(next(_settings_ids), parent)
+    if parent is not None:
+        _settings_children.setdefault(parent.settings_id, []).append(settings)
+
+    return settings
+
+
+def load_settings(base_name: str) -> Settings:
+    api_calls['load_settings'] += 1
+    try:
+        return _loaded_settings[base_name]
+    except KeyError:
+        settings = _loaded_settings[base_name] = _new_settings()
+        if base_name == 'Preferences.sublime-settings':
+            settings._values.update(_DEFAULT_PREFERENCES)
+
+        for name in sorted(_packages):
+            try:
+                settings._values.update(decode_value(load_resource('Packages/%s/%s' % (name, base_name))))
+            except (FileNotFoundError, ValueError):
+                pass
+
+        return settings
+
+
+def save_settings(base_name: str) -> None:
+    api_calls['save_settings'] += 1
+
+
+class Edit():
+
+    def __init__(self, edit_token: int) -> None:
+        self.edit_token = edit_token
+
+    def __repr__(self) -> str:
+        return 'Edit(%d)' % self.edit_token
+
+
+_ids = iter(range(1, sys.maxsize))
+_views = {}  # type: dict
+_windows = []  # type: list
+
+
+class View():
+
+    def __init__(self, id: int) -> None:
+        self.view_id = id
+        self.selection = Selection(id)
+
+    def __repr__(self) -> str:
+        return 'View(%d)' % self.view_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, View) and other.view_id == self.view_id
+
+    def __hash__(self) -> int:
+        return self.view_id
+
+    def __bool__(self) -> bool:
+        return self.view_id in _views
+
+    def __len__(self) -> int:
+        return self.size()
+
+    @property
+    def _state(self):
+        return _views[self.view_id]
+
+    @_api
+    def id(self) -> int:
+        return self.view_id
+
+    @_api
+    def buffer_id(self) -> int:
+        return self.view_id
+
+    @_api
+    def is_valid(self) -> bool:
+        return self.view_id in _views
+
+    @_api
+    def is_primary(self) -> bool:
+        return True
+
+    @_api
+    def window(self):
+        return self._state.window
+
+    @_api
+    def file_name(self):
+        return self._state.file_name
+
+    @_api
+    def is_loading(self) -> bool:
+        return False
+
+    @_api
+    def element(self):
+        return self._state.element
+
+    @_api
+    def close(self) -> bool:
+        window = self._state.window
+        if window:
+            window._close_view(self)
+
+        return True
+
+    @_api
+    def retarget(self, new_fname: str) -> None:
+        self._state.file_name = new_fname
+
+    @_api
+    def name(self) -> str:
+        return self._state.name
+
+    @_api
+    def set_name(self, name: str) -> None:
+        self._state.name = name
+
+    @_api
+    def reset_reference_document(self) -> None:
+        pass
+
+    @_api
+    def set_reference_document(self, reference: str) -> None:
+        pass
+
+    @_api
+    def is_dirty(self) -> bool:
+        state = self._state
+        return state.change_count != state.saved_change_count and not state.scratch
+
+    @_api
+    def is_read_only(self) -> bool:
+        return self._state.read_only
+
+    @_api
+    def set_read_only(self, read_only: bool) -> None:
+        self._state.read_only = read_only
+
+    @_api
+    def is_scratch(self) -> bool:
+        return self._state.scratch
+
+    @_api
+    def set_scratch(self, scratch: bool) -> None:
+        self._state.scratch = scratch
+
+    @_api
+    def encoding(self) -> str:
+        return 'UTF-8'
+
+    @_api
+    def set_encoding(self, encoding_name: str) -> None:
+        pass
+
+    @_api
+    def line_endings(self) -> str:
+        return 'Unix'
+
+    @_api
+    def set_line_endings(self, line_ending_name: str) -> None:
+        pass
+
+    @_api
+    def size(self) -> int:
+        return len(self._state.buffer)
+
+    @_api
+    def change_count(self) -> int:
+        return self._state.change_count
+
+    @_api
+    def change_id(self) -> tuple:
+        return (self._state.change_count, 0, 0)
+
+    def _check_edit(self, edit) -> None:
+        if not isinstance(edit, Edit):
+            raise ValueError('Edit objects may not be used after the TextCommand\'s run method has returned')
+
+        if self._state.read_only:
+            raise ValueError('view is read only')
+
+    def _text(self) -> str:
+        return self._state.buffer.text
+
+    def _clamp(self, pt: int) -> int:
+        return max(0, min(pt, len(self._state.buffer)))
+
+    def _changed(self, f) -> None:
+        # Moves the selection and the regions after an edit.
+        state = self._state
+        state.change_count += 1
+        self.selection._adjust(f)
+        for key, (regions, scope, icon, flags) in list(state.regions.items()):
+            for region in regions:
+                region.a = f(region.a)
+                region.b = f(region.b)
+
+    def _replace(self, a: int, b: int, text: str) -> None:
+        # Replaces the text from a to b, moving the selection and the regions,
+        # and records the edit, for undo, when a text command is running.
+        state = self._state
+        buffer = state.buffer
+        if a == b and not text:
+            return
+
+        if state.edits is not None:
+            state.edits.append((a, buffer.substr(a, b), text))
+
+        buffer.erase(a, b)
+        buffer.insert(a, text)
+        n = len(text)
+        if a == b:
+            self._changed(lambda x: x + n if x >= a else x)
+        else:
+            delta = n - (b - a)
+            end = a + n
+            self._changed(lambda x: x + delta if x >= b else (min(x, end) if x > a else x))
+
+    @_api
+    def insert(self, edit, pt: int, text: str) -> int:
+        self._check_edit(edit)
+        pt = self._clamp(pt)
+        self._replace(pt, pt, text)
+
+        return len(text)
+
+    @_api
+    def erase(self, edit, region: Region) -> None:
+        self._check_edit(edit)
+        self._replace(self._clamp(region.begin()), self._clamp(region.end()), '')
+
+    @_api
+    def replace(self, edit, region: Region, text: str) -> None:
+        self._check_edit(edit)
+        self._replace(self._clamp(region.begin()), self._clamp(region.end()), text)
+
+    @_api
+    def substr(self, x) -> str:
+        buffer = self._state.buffer
+        if isinstance(x, Region):
+            return buffer.substr(max(0, x.begin()), max(0, x.end()))
+
+        if 0 <= x < len(buffer):
+            return buffer.substr(x, x + 1)
+
+        return '\x00'
+
+    @_api
+    def sel(self) -> Selection:
+        return self.selection
+
+    def _line(self, x) -> Region:
+        buffer = self._state.buffer
+        if isinstance(x, Region):
+            a = buffer.line_index(self._clamp(x.begin()))
+            b = buffer.line_index(self._clamp(x.end()))
+
+            return Region(buffer.line_start(a), buffer.line_end(b))
+
+        i = buffer.line_index(self._clamp(x))
+
+        return Region(buffer.line_start(i), buffer.line_end(i))
+
+    def _full_line(self, x) -> Region:
+        line = self._line(x)
+        if line.b < len(self._state.buffer):
+            return Region(line.a, line.b + 1)
+
+        return line
+
+    @_api
+    def line(self, x) -> Region:
+        return self._line(x)
+
+    @_api
+    def full_line(self, x) -> Region:
+        return self._full_line(x)
+
+    @_api
+    def lines(self, region: Region) -> list:
+        buffer = self._state.buffer
+        a = buffer.line_index(self._clamp(region.begin()))
+        b = buffer.line_index(self._clamp(region.end()))
+        # A line that a region only touches at its start is not included.
+        if b > a and buffer.line_start(b) == region.end():
+            b -= 1
+
+        return [Region(buffer.line_start(i), buffer.line_end(i)) for i in range(a, b + 1)]
+
+    @_api
+    def split_by_newlines(self, region: Region) -> list:
+        a = region.begin()
+        b = region.end()
+        text = self._text()
+        regions = []
+        while True:
+            i = text.find('\n', a, b)
+            if i == -1:
+                regions.append(Region(a, b))
+                break
+
+            regions.append(Region(a, i))
+            a = i + 1
+
+        return regions
+
+    @_api
+    def rowcol(self, tp: int) -> tuple:
+        buffer = self._state.buffer
+        tp = self._clamp(tp)
+        i = buffer.line_index(tp)
+
+        return (i, tp - buffer.line_start(i))
+
+    def rowcol_utf8(self, tp: int) -> tuple:
+        return self.rowcol(tp)
+
+    def rowcol_utf16(self, tp: int) -> tuple:
+        return self.rowcol(tp)
+
+    @_api
+    def text_point(self, row: int, col: int) -> int:
+        buffer = self._state.buffer
+        row = max(0, min(row, buffer.line_count() - 1))
+
+        return self._clamp(buffer.line_start(row) + col)
+
+    def text_point_utf8(self, row: int, col: int) -> int:
+        return self.text_point(row, col)
+
+    def text_point_utf16(self, row: int, col: int) -> int:
+        return self.text_point(row, col)
+
+    def _separators(self, separators: str) -> str:
+        if separators:
+            return separators
+
+        return self._state.settings.get('word_separators', _DEFAULT_PREFERENCES['word_separators'])
+
+    def _classify(self, pt: int, separators: str) -> int:
+        text = self._text()
+        size = len(text)
+        before = text[pt - 1] if 0 < pt <= size else ''
+        after = text[pt] if 0 <= pt < size else ''
+
+        def kind(c: str) -> int:
+            # 0 is space or nothing, 1 is a word character, 2 is punctuation.
+            if not c or c.isspace():
+                return 0
+
+            return 2 if c in separators else 1
+
+        before_kind = kind(before)
+        after_kind = kind(after)
+        classes = 0
+        if after_kind == 1 and before_kind != 1:
+            classes |= CLASS_WORD_START
+        if before_kind == 1 and after_kind != 1:
+            classes |= CLASS_WORD_END
+        if after_kind == 2 and before_kind != 2:
+            classes |= CLASS_PUNCTUATION_START
+        if before_kind == 2 and after_kind != 2:
+            classes |= CLASS_PUNCTUATION_END
+        if pt == 0 or before == '\n':
+            classes |= CLASS_LINE_START
+        if pt >= size or after == '\n':
+            classes |= CLASS_LINE_END
+        if classes & CLASS_LINE_START and classes & CLASS_LINE_END:
+            classes |= CLASS_EMPTY_LINE
+
+        return classes
+
+    @_api
+    def classify(self, pt: int) -> int:
+        return self._classify(pt, self._separators(''))
+
+    @_api
+    def find_by_class(self, pt: int, forward: bool, classes: int, separators: str = '') -> int:
+        separators = self._separators(separators)
+        size = len(self._state.buffer)
+        if forward:
+            pt += 1
+            while pt < size:
+                if self._classify(pt, separators) & classes:
+                    return pt
+                pt += 1
+
+            return size
+
+        pt -= 1
+        while pt > 0:
+            if self._classify(pt, separators) & classes:
+                return pt
+            pt -= 1
+
+        return 0
+
+    def _expand_by_class(self, x, classes: int, separators: str) -> Region:
+        if not isinstance(x, Region):
+            x = Region(x)
+
+        separators = self._separators(separators)
+        size = len(self._state.buffer)
+        # The region always grows, unless it's at the start or end of the
+        # buffer, so that repeatedly expanding it moves on to the next class.
+        a = x.begin() if x.empty() else x.begin() - 1
+        while a > 0 and not self._classify(a, separators) & classes:
+            a -= 1
+
+        b = x.end() + 1
+        while b < size and not self._classify(b, separators) & classes:
+            b += 1
+
+        return Region(max(0, a), min(b, size))
+
+    @_api
+    def expand_by_class(self, x, classes: int, separators: str = '') -> Region:
+        return self._expand_by_class(x, classes, separators)
+
+    @_api
+    def word(self, x) -> Region:
+        return self._expand_by_class(x, CLASS_WORD_START | CLASS_WORD_END, '')
+
+    def _compile(self, pattern: str, flags: int):
+        if flags & LITERAL:
+            pattern = re.escape(pattern)
+
+        re_flags = re.MULTILINE
+        if flags & IGNORECASE:
+            re_flags |= re.IGNORECASE
+
+        return re.compile(pattern, re_flags)
+
+    @_api
+    def find(self, pattern: str, start_pt: int, flags: int = 0) -> Region:
+        try:
+            match = self._compile(pattern, flags).search(self._text(), max(0, start_pt))
+        except re.error:
+            return Region(-1, -1)
+
+        if match:
+            return Region(match.start(), match.end())
+
+        return Region(-1, -1)
+
+    @_api
+    def find_all(self, pattern: str, flags: int = 0, fmt: str = None, extractions: list = None) -> list:
+        try:
+            compiled = self._compile(pattern, flags)
+        except re.error:
+            return []
+
+        regions = []
+        for match in compiled.finditer(self._text()):
+            regions.append(Region(match.start(), match.end()))
+            if fmt is not None and extractions is not None:
+                extractions.append(match.expand(re.sub('\\$(\\d)', '\\\\\\1', fmt)))
+
+        return regions
+
+    @_api
+    def settings(self) -> Settings:
+        return self._state.settings
+
+    @_api
+    def meta_info(self, key: str, pt: int):
+        if key == 'shellVariables':
+            return []
+
+        return None
+
+    @_api
+    def extract_tokens_with_scopes(self, region: Region) -> list:
+        return []
+
+    @_api
+    def extract_scope(self, pt: int) -> Region:
+        return self._line(pt)
+
+    @_api
+    def scope_name(self, pt: int) -> str:
+        return 'text.plain '
+
+    @_api
+    def match_selector(self, pt: int, selector: str) -> bool:
+        return False
+
+    @_api
+    def score_selector(self, pt: int, selector: str) -> int:
+        return 0
+
+    @_api
+    def syntax(self):
+        return None
+
+    @_api
+    def assign_syntax(self, syntax_file) -> None:
+        self._state.syntax = syntax_file
+
+    @_api
+    def set_syntax_file(self, syntax_file: str) -> None:
+        self._state.syntax = syntax_file
+
+    @_api
+    def indentation_level(self, pt: int) -> int:
+        line = self.substr(self._line(pt))
+        tab_size = self._state.settings.get('tab_size', 4)
+        width = 0
+        for c in line:
+            if c == ' ':
+                width += 1
+            elif c == '\t':
+                width += tab_size - (width % tab_size)
+            else:
+                break
+
+        return width // tab_size
+
+    @_api
+    def indented_region(self, pt: int) -> Region:
+        return Region(pt)
+
+    @_api
+    def has_non_empty_selection_region(self) -> bool:
+        return any(not r.empty() for r in self.selection._regions)
+
+    @_api
+    def add_regions(self, key: str, regions: list, scope: str = '', icon: str = '', flags: int = 0, *args,
+                    **kwargs) -> None:
+        self._state.regions[key] = ([Region(r.a, r.b) for r in regions], scope, icon, flags)
+
+    @_api
+    def get_regions(self, key: str) -> list:
+        try:
+            return [Region(r.a, r.b) for r in self._state.regions[key][0]]
+        except KeyError:
+            return []
+
+    @_api
+    def erase_regions(self, key: str) -> None:
+        self._state.regions.pop(key, None)
+
+    @_api
+    def set_status(self, key: str, value: str) -> None:
+        self._state.status[key] = value
+
+    @_api
+    def get_status(self, key: str) -> str:
+        return self._state.status.get(key, '')
+
+    @_api
+    def erase_status(self, key: str) -> None:
+        self._state.status.pop(key, None)
+
+    @_api
+    def command_history(self, index: int, modifying_only: bool = False) -> tuple:
+        history = self._state.command_history
+        try:
+            return history[index - 1]
+        except IndexError:
+            return ('', None, 0)
+
+    @_api
+    def overwrite_status(self) -> bool:
+        return self._state.overwrite
+
+    @_api
+    def set_overwrite_status(self, value: bool) -> None:
+        self._state.overwrite = value
+
+    @_api
+    def show(self, x, show_surrounds: bool = True, keep_to_left: bool = False, animate: bool = True) -> None:
+        pass
+
+    @_api
+    def show_at_center(self, x, animate: bool = True) -> None:
+        pass
+
+    @_api
+    def visible_region(self) -> Region:
+        return Region(0, len(self._state.buffer))
+
+    @_api
+    def viewport_position(self) -> tuple:
+        return self._state.viewport_position
+
+    @_api
+    def set_viewport_position(self, xy: tuple, animate: bool = True) -> None:
+        self._state.viewport_position = xy
+
+    @_api
+    def viewport_extent(self) -> tuple:
+        return (800.0, 600.0)
+
+    @_api
+    def layout_extent(self) -> tuple:
+        return (800.0, float(self._state.buffer.line_count()))
+
+    @_api
+    def text_to_layout(self, tp: int) -> tuple:
+        row, col = self.rowcol(tp)
+
+        return (float(col), float(row))
+
+    @_api
+    def text_to_window(self, tp: int) -> tuple:
+        return self.text_to_layout(tp)
+
+    @_api
+    def layout_to_text(self, vector: tuple) -> int:
+        return self.text_point(int(vector[1]), int(vector[0]))
+
+    @_api
+    def window_to_text(self, vector: tuple) -> int:
+        return self.layout_to_text(vector)
+
+    @_api
+    def line_height(self) -> float:
+        return 1.0
+
+    @_api
+    def em_width(self) -> float:
+        return 1.0
+
+    @_api
+    def is_folded(self, region: Region) -> bool:
+        return False
+
+    @_api
+    def folded_regions(self) -> list:
+        return []
+
+    @_api
+    def fold(self, x) -> bool:
+        return False
+
+    @_api
+    def unfold(self, x) -> list:
+        return []
+
+    @_api
+    def is_auto_complete_visible(self) -> bool:
+        return False
+
+    @_api
+    def is_popup_visible(self) -> bool:
+        return False
+
+    @_api
+    def hide_popup(self) -> None:
+        pass
+
+    @_api
+    def show_popup(self, content: str, *args, **kwargs) -> None:
+        pass
+
+    @_api
+    def run_command(self, cmd: str, args: dict = None) -> None:
+        import sublime_plugin
+        sublime_plugin.run_text_command(self, cmd, args)
+
+
+class _ViewState():
+
+    # The state of a view, which View objects look up by view id.
+
+    def __init__(self, window, element=None) -> None:
+        self.window = window
+        self.element = element
+        self.buffer = _GapBuffer()
+        self.settings = _new_settings(load_settings('Preferences.sublime-settings'))
+        self.regions = {}  # type: dict
+        self.status = {}  # type: dict
+        self.name = ''
+        self.file_name = None
+        self.syntax = None
+        self.scratch = False
+        self.read_only = False
+        self.overwrite = False
+        self.change_count = 0
+        self.saved_change_count = 0
+        self.viewport_position = (0.0, 0.0)
+        self.command_history = []  # type: list
+        self.undo = []  # type: list
+        self.redo = []  # type: list
+        # The edits of the running top level text command, see View._replace().
+        self.edits = None
+        self.glue_mark = None
+
+
+def _new_view(window, element=None) -> View:
+    view = View(next(_ids))
+    _views[view.view_id] = _ViewState(window, element)
+    view.selection._regions = [Region(0)]
+
+    return view
+
+
+class Window():
+
+    def __init__(self, id: int) -> None:
+        self.window_id = id
+        self._views = []  # type: list
+        self._active_view = None
+        self._panels = {}  # type: dict
+        self._active_panel = None
+        self._settings = _new_settings()
+        self._template_settings = _new_settings()
+        self._layout = {'cols': [0.0, 1.0], 'rows': [0.0, 1.0], 'cells': [[0, 0, 1, 1]]}
+        self._visible = {
+            'menu': True,
+            'minimap': True,
+            'sidebar': True,
+            'status_bar': True,
+            'tabs': True,
+        }
+        self.quick_panels = []  # type: list
+        self.input_panels = []  # type: list
+
+    def __repr__(self) -> str:
+        return 'Window(%d)' % self.window_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Window) and other.window_id == self.window_id
+
+    def __hash__(self) -> int:
+        return self.window_id
+
+    def __bool__(self) -> bool:
+        return self in _windows
+
+    def __getattr__(self, name: str):
+        # is_*_visible() and set_*_visible() for the ui elements.
+        match = re.match('^(is|set)_(menu|minimap|sidebar|status_bar|tabs)_visible$', name)
+        if not match:
+            raise AttributeError(name)
+
+        if match.group(1) == 'is':
+            def is_visible() -> bool:
+                api_calls['Window.' + name] += 1
+                return self._visible[match.group(2)]
+
+            return is_visible
+
+        def set_visible(flag: bool) -> None:
+            api_calls['Window.' + name] += 1
+            self._visible[match.group(2)] = flag
+
+        return set_visible
+
+    @_api
+    def id(self) -> int:
+        return self.window_id
+
+    @_api
+    def is_valid(self) -> bool:
+        return self in _windows
+
+    @_api
+    def views(self, include_transient: bool = False) -> list:
+        return list(self._views)
+
+    @_api
+    def active_view(self):
+        return self._active_view
+
+    @_api
+    def active_sheet(self):
+        return None
+
+    @_api
+    def selected_sheets(self) -> list:
+        return []
+
+    @_api
+    def selected_sheets_in_group(self, group: int) -> list:
+        return []
+
+    @_api
+    def new_file(self, flags: int = 0, syntax: str = '') -> View:
+        view = _new_view(self)
+        self._views.append(view)
+        self._activate(view)
+        import sublime_plugin
+        sublime_plugin.on_new(view)
+
+        return view
+
+    @_api
+    def open_file(self, fname: str, flags: int = 0, group: int = -1) -> View:
+        if flags & ENCODED_POSITION:
+            fname = re.sub(':\\d+(:\\d+)?$', '', fname)
+
+        view = self.find_open_file(fname)
+        if view:
+            self._activate(view)
+            return view
+
+        view = _new_view(self)
+        state = _views[view.view_id]
+        state.file_name = fname
+        try:
+            with open(fname, encoding='utf-8', errors='replace') as f:
+                state.buffer.insert(0, f.read())
+        except OSError:
+            pass
+
+        self._views.append(view)
+        self._activate(view)
+        import sublime_plugin
+        sublime_plugin.on_load(view)
+
+        return view
+
+    @_api
+    def find_open_file(self, fname: str):
+        for view in self._views:
+            if _views[view.view_id].file_name == fname:
+                return view
+
+        return None
+
+    def _activate(self, view) -> None:
+        previous = self._active_view
+        if previous == view:
+            return
+
+        self._active_view = view
+        import sublime_plugin
+        if previous:
+            sublime_plugin.on_deactivated(previous)
+
+        sublime_plugin.on_activated(view)
+
+    def _close_view(self, view) -> None:
+        import sublime_plugin
+        sublime_plugin.on_pre_close(view)
+        if view in self._views:
+            self._views.remove(view)
+
+        for name, panel in list(self._panels.items()):
+            if panel == view:
+                del self._panels[name]
+
+        if self._active_view == view:
+            self._active_view = None
+            if self._views:
+                self._activate(self._views[-1])
+
+        sublime_plugin.on_close(view)
+        _views.pop(view.view_id, None)
+
+    @_api
+    def focus_view(self, view) -> None:
+        if view in self._views:
+            self._activate(view)
+
+    @_api
+    def focus_sheet(self, sheet) -> None:
+        pass
+
+    @_api
+    def get_view_index(self, view) -> tuple:
+        if view in self._views:
+            return (0, self._views.index(view))
+
+        return (-1, -1)
+
+    @_api
+    def set_view_index(self, view, group: int, index: int) -> None:
+        if view in self._views:
+            self._views.remove(view)
+            self._views.insert(index, view)
+
+    @_api
+    def num_groups(self) -> int:
+        return 1
+
+    @_api
+    def active_group(self) -> int:
+        return 0
+
+    @_api
+    def focus_group(self, idx: int) -> None:
+        pass
+
+    @_api
+    def active_view_in_group(self, group: int):
+        return self._active_view if group == 0 else None
+
+    @_api
+    def views_in_group(self, group: int) -> list:
+        return list(self._views) if group == 0 else []
+
+    @_api
+    def sheets_in_group(self, group: int) -> list:
+        return []
+
+    @_api
+    def get_layout(self) -> dict:
+        return self._layout
+
+    @_api
+    def layout(self) -> dict:
+        return self._layout
+
+    @_api
+    def set_layout(self, layout: dict) -> None:
+        self._layout = layout
+
+    @_api
+    def settings(self) -> Settings:
+        return self._settings
+
+    @_api
+    def template_settings(self) -> Settings:
+        return self._template_settings
+
+    @_api
+    def folders(self) -> list:
+        return []
+
+    @_api
+    def project_file_name(self):
+        return None
+
+    @_api
+    def project_data(self):
+        return None
+
+    @_api
+    def extract_variables(self) -> dict:
+        variables = {'packages': _PACKAGES_PATH, 'platform': platform()}
+        view = self._active_view
+        if view and _views[view.view_id].file_name:
+            file_name = _views[view.view_id].file_name
+            variables['file'] = file_name
+            variables['file_path'] = os.path.dirname(file_name)
+            variables['file_name'] = os.path.basename(file_name)
+
+        return variables
+
+    @_api
+    def lookup_symbol_in_index(self, symbol: str) -> list:
+        return []
+
+    @_api
+    def lookup_symbol_in_open_files(self, symbol: str) -> list:
+        return []
+
+    @_api
+    def lookup_references_in_index(self, symbol: str) -> list:
+        return []
+
+    @_api
+    def lookup_references_in_open_files(self, symbol: str) -> list:
+        return []
+
+    @_api
+    def create_output_panel(self, name: str, unlisted: bool = False) -> View:
+        if name not in self._panels:
+            self._panels[name] = _new_view(self, element='output:output')
+
+        return self._panels[name]
+
+    @_api
+    def find_output_panel(self, name: str):
+        return self._panels.get(name)
+
+    @_api
+    def destroy_output_panel(self, name: str) -> None:
+        self._panels.pop(name, None)
+
+    @_api
+    def active_panel(self):
+        return self._active_panel
+
+    @_api
+    def panels(self) -> list:
+        return ['output.' + name for name in self._panels]
+
+    @_api
+    def show_quick_panel(self, items: list, on_select, flags: int = 0, selected_index: int = -1,
+                         on_highlight=None, placeholder: str = '') -> None:
+        self.quick_panels.append((items, on_select, flags, selected_index, on_highlight))
+
+    @_api
+    def show_input_panel(self, caption: str, initial_text: str, on_done, on_change, on_cancel) -> View:
+        panel = _new_view(self, element='input:input')
+        self.input_panels.append((caption, initial_text, on_done, on_change, on_cancel, panel))
+
+        return panel
+
+    @_api
+    def status_message(self, msg: str) -> None:
+        status_message(msg)
+
+    @_api
+    def run_command(self, cmd: str, args: dict = None) -> None:
+        import sublime_plugin
+        sublime_plugin.run_window_command(self, cmd, args)
+
+
+def active_window():
+    api_calls['active_window'] += 1
+    if not _windows:
+        _windows.append(Window(next(_ids)))
+
+    return _windows[0]
+
+
+def windows() -> list:
+    api_calls['windows'] += 1
+
+    return list(_windows)
+
+
+def run_command(cmd: str, args: dict = None) -> None:
+    import sublime_plugin
+    sublime_plugin.run_application_command(cmd, args)
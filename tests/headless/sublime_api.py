@@ -0,0 +1,32 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# A headless stand-in for the private "sublime_api" module, for the parts of
+# it that the test helpers use. See sublime.py.
+
+import sublime
+import sublime_plugin
+
+
+def view_run_command(view_id: int, cmd: str, args: dict = None) -> None:
+    sublime_plugin.run_text_command(sublime.View(view_id), cmd, args)
+
+
+def window_run_command(window_id: int, cmd: str, args: dict = None) -> None:
+    for window in sublime._windows:
+        if window.window_id == window_id:
+            sublime_plugin.run_window_command(window, cmd, args)
@@ -0,0 +1,571 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+# A headless stand-in for the Sublime Text "sublime_plugin" module. See
+# sublime.py. Commands and event listeners are registered by reload_plugin()
+# and run by the View, Window, and module run_command() functions.
+#
+# The builtin Sublime Text commands that NeoVintageous depends on for editing
+# e.g. "insert", "left_delete", "move", and "undo" are implemented here, in a
+# simplified form. Other builtin commands are no-ops. Key binding contexts are
+# not supported: keys are fed with the nv_feed_key command.
+
+from importlib import import_module
+from importlib import reload
+import sys
+
+import sublime
+
+application_command_classes = []  # type: list
+window_command_classes = []  # type: list
+text_command_classes = []  # type: list
+view_event_listener_classes = []  # type: list
+event_listeners = []  # type: list
+
+# The classes registered by each module, by module name.
+_registered = {}  # type: dict
+
+# The view event listener instances, by view id.
+_view_event_listeners = {}  # type: dict
+
+# The depth of the current text command. Top level commands are undo groups.
+_depth = 0
+
+
+def _command_name(cls) -> str:
+    clsname = cls.__name__
+    name = clsname[0].lower()
+    last_upper = False
+    for c in clsname[1:]:
+        if c.isupper() and not last_upper:
+            name += '_'
+            name += c.lower()
+        else:
+            name += c
+        last_upper = c.isupper()
+
+    if name.endswith('_command'):
+        name = name[0:-8]
+
+    return name
+
+
+class Command():
+
+    def name(self) -> str:
+        return _command_name(self.__class__)
+
+    def is_enabled(self, *args, **kwargs) -> bool:
+        return True
+
+    def is_enabled_(self, args: dict) -> bool:
+        # As in Sublime Text, the arguments are passed to is_enabled() only if
+        # it accepts them.
+        try:
+            return self.is_enabled(**args) if args else self.is_enabled()
+        except TypeError:
+            return self.is_enabled()
+
+    def is_visible(self, *args, **kwargs) -> bool:
+        return True
+
+    def is_checked(self, *args, **kwargs) -> bool:
+        return False
+
+    def description(self, *args, **kwargs):
+        return None
+
+
+class ApplicationCommand(Command):
+    pass
+
+
+class WindowCommand(Command):
+
+    def __init__(self, window) -> None:
+        self.window = window
+
+
+class TextCommand(Command):
+
+    def __init__(self, view) -> None:
+        self.view = view
+
+
+class EventListener():
+    pass
+
+
+class ViewEventListener():
+
+    @classmethod
+    def is_applicable(cls, settings) -> bool:
+        return True
+
+    @classmethod
+    def applies_to_primary_view_only(cls) -> bool:
+        return True
+
+    def __init__(self, view) -> None:
+        self.view = view
+
+
+def _unregister(module_name: str) -> None:
+    registered = _registered.pop(module_name, ())
+    for classes in (application_command_classes, window_command_classes, text_command_classes,
+                    view_event_listener_classes):
+        classes[:] = [c for c in classes if c not in registered]
+
+    event_listeners[:] = [e for e in event_listeners if e.__class__ not in registered]
+    _view_event_listeners.clear()
+
+
+def register_module(module) -> None:
+    # Registers the commands and event listeners in module, including the
+    # ones that it imports, e.g. "from NeoVintageous.nv.commands import *",
+    # as Sublime Text does.
+    _unregister(module.__name__)
+    registered = _registered[module.__name__] = set()
+    for item in vars(module).values():
+        if not isinstance(item, type):
+            continue
+
+        if issubclass(item, ApplicationCommand) and item is not ApplicationCommand:
+            application_command_classes.append(item)
+        elif issubclass(item, WindowCommand) and item is not WindowCommand:
+            window_command_classes.append(item)
+        elif issubclass(item, TextCommand) and item is not TextCommand:
+            text_command_classes.append(item)
+        elif issubclass(item, EventListener) and item is not EventListener:
+            event_listeners.append(item())
+        elif issubclass(item, ViewEventListener) and item is not ViewEventListener:
+            view_event_listener_classes.append(item)
+        else:
+            continue
+
+        registered.add(item)
+
+    plugin_loaded = getattr(module, 'plugin_loaded', None)
+    if plugin_loaded:
+        plugin_loaded()
+
+
+def reload_plugin(module_name: str) -> None:
+    if module_name in sys.modules:
+        module = reload(sys.modules[module_name])
+    else:
+        module = import_module(module_name)
+
+    register_module(module)
+
+
+def _find_class(classes: list, name: str):
+    for cls in reversed(classes):
+        if _command_name(cls) == name:
+            return cls
+
+    return None
+
+
+def _view_listeners(view) -> list:
+    try:
+        return _view_event_listeners[view.view_id]
+    except KeyError:
+        listeners = _view_event_listeners[view.view_id] = [
+            cls(view) for cls in view_event_listener_classes if cls.is_applicable(view.settings())
+        ]
+
+        return listeners
+
+
+def _dispatch(event: str, view, *args) -> list:
+    results = []
+    for listener in event_listeners:
+        method = getattr(listener, event, None)
+        if method:
+            results.append(method(view, *args))
+
+    if isinstance(view, sublime.View) and event != 'on_new':
+        for listener in _view_listeners(view):
+            method = getattr(listener, event, None)
+            if method:
+                results.append(method(*args))
+
+    return results
+
+
+def on_new(view) -> None:
+    _dispatch('on_new', view)
+
+
+def on_load(view) -> None:
+    _dispatch('on_load', view)
+
+
+def on_activated(view) -> None:
+    _dispatch('on_activated', view)
+
+
+def on_deactivated(view) -> None:
+    _dispatch('on_deactivated', view)
+
+
+def on_pre_close(view) -> None:
+    _dispatch('on_pre_close', view)
+
+
+def on_close(view) -> None:
+    _dispatch('on_close', view)
+    _view_event_listeners.pop(view.view_id, None)
+
+
+def _rewrite(results: list, cmd: str, args):
+    # An on_*_command listener can rewrite a command by returning a tuple of
+    # the new command and arguments.
+    for result in results:
+        if isinstance(result, tuple) and result:
+            return result[0], result[1] if len(result) > 1 else None
+
+    return cmd, args
+
+
+def _selection(view) -> list:
+    return [sublime.Region(r.a, r.b, r.xpos) for r in view.selection._regions]
+
+
+def run_text_command(view, cmd: str, args: dict = None) -> None:
+    global _depth
+
+    if not view:
+        return
+
+    cmd, args = _rewrite(_dispatch('on_text_command', view, cmd, args), cmd, args)
+    cls = _find_class(text_command_classes, cmd)
+    builtin = _BUILTIN_TEXT_COMMANDS.get(cmd)
+    if cls is None and builtin is None:
+        return
+
+    state = view._state
+    top_level = _depth == 0 and cmd not in _UNDO_COMMANDS
+    if top_level:
+        before = _selection(view)
+        state.edits = []
+
+    _depth += 1
+    try:
+        if cls is not None:
+            command = cls(view)
+            if command.is_enabled_(args):
+                edit = sublime.Edit(_depth)
+                command.run(edit, **(args or {}))
+        else:
+            builtin(view, **(args or {}))
+    finally:
+        _depth -= 1
+        if top_level:
+            edits = state.edits
+            state.edits = None
+
+    if not view:
+        return
+
+    if top_level:
+        # An undo group is the edits of the command and the selections before
+        # and after it.
+        if edits:
+            state.undo.append((edits, before, _selection(view)))
+            state.redo = []
+            _dispatch('on_modified', view)
+
+        state.command_history.insert(0, (cmd, args, 1))
+
+    _dispatch('on_post_text_command', view, cmd, args)
+
+    if _depth == 0:
+        sublime.run_timeouts()
+
+
+def run_window_command(window, cmd: str, args: dict = None) -> None:
+    cmd, args = _rewrite(_dispatch('on_window_command', window, cmd, args), cmd, args)
+    cls = _find_class(window_command_classes, cmd)
+    if cls is not None:
+        command = cls(window)
+        if command.is_enabled_(args):
+            command.run(**(args or {}))
+
+        _dispatch('on_post_window_command', window, cmd, args)
+        if _depth == 0:
+            sublime.run_timeouts()
+
+        return
+
+    builtin = _BUILTIN_WINDOW_COMMANDS.get(cmd)
+    if builtin is not None:
+        builtin(window, **(args or {}))
+        return
+
+    run_text_command(window.active_view(), cmd, args)
+
+
+def run_application_command(cmd: str, args: dict = None) -> None:
+    cls = _find_class(application_command_classes, cmd)
+    if cls is not None:
+        command = cls()
+        if command.is_enabled_(args):
+            command.run(**(args or {}))
+
+        if _depth == 0:
+            sublime.run_timeouts()
+
+
+def _edit(view):
+    return sublime.Edit(_depth)
+
+
+def _insert(view, characters: str = '') -> None:
+    edit = _edit(view)
+    for region in reversed(list(view.selection._regions)):
+        view.replace(edit, region, characters)
+
+    view.selection._regions = [sublime.Region(r.end()) for r in view.selection._regions]
+
+
+def _append(view, characters: str = '', force: bool = False, scroll_to_end: bool = False) -> None:
+    # Appending doesn't move the selection.
+    regions = [sublime.Region(r.a, r.b, r.xpos) for r in view.selection._regions]
+    view.insert(_edit(view), len(view._state.buffer), characters)
+    view.selection._regions = regions
+
+
+def _left_delete(view) -> None:
+    edit = _edit(view)
+    for region in reversed(list(view.selection._regions)):
+        if region.empty():
+            if region.a > 0:
+                view.erase(edit, sublime.Region(region.a - 1, region.a))
+        else:
+            view.erase(edit, region)
+
+
+def _right_delete(view) -> None:
+    edit = _edit(view)
+    size = len(view._state.buffer)
+    for region in reversed(list(view.selection._regions)):
+        if region.empty():
+            if region.a < size:
+                view.erase(edit, sublime.Region(region.a, region.a + 1))
+        else:
+            view.erase(edit, region)
+
+
+def _move(view, by: str = 'characters', forward: bool = True, extend: bool = False, **kwargs) -> None:
+    size = len(view._state.buffer)
+    regions = []
+    for region in view.selection._regions:
+        if by == 'lines':
+            row, col = view.rowcol(region.b)
+            if region.xpos >= 0:
+                col = int(region.xpos)
+
+            row += 1 if forward else -1
+            if row < 0:
+                b = 0
+            elif row >= view._state.buffer.line_count():
+                b = size
+            else:
+                line = view._line(view.text_point(row, 0))
+                b = min(line.a + col, line.b)
+            xpos = col
+        else:
+            if not extend and not region.empty():
+                b = region.end() if forward else region.begin()
+            else:
+                b = min(size, region.b + 1) if forward else max(0, region.b - 1)
+            xpos = -1
+
+        regions.append(sublime.Region(region.a if extend else b, b, xpos))
+
+    view.selection._regions = regions
+    view.selection._merge()
+
+
+def _select_all(view) -> None:
+    view.selection._regions = [sublime.Region(0, len(view._state.buffer))]
+
+
+def _swap_case(view) -> None:
+    edit = _edit(view)
+    for region in reversed(list(view.selection._regions)):
+        if not region.empty():
+            view.replace(edit, region, view.substr(region).swapcase())
+
+
+def _indent_text(view) -> str:
+    settings = view._state.settings
+    if settings.get('translate_tabs_to_spaces'):
+        return ' ' * settings.get('tab_size', 4)
+
+    return '\t'
+
+
+def _selected_rows(view) -> list:
+    rows = set()
+    for region in view.selection._regions:
+        first = view.rowcol(region.begin())[0]
+        last = view.rowcol(region.end())[0]
+        if last > first and view.rowcol(region.end())[1] == 0:
+            last -= 1
+
+        rows.update(range(first, last + 1))
+
+    return sorted(rows, reverse=True)
+
+
+def _indent(view) -> None:
+    edit = _edit(view)
+    text = _indent_text(view)
+    for row in _selected_rows(view):
+        pt = view.text_point(row, 0)
+        if view._line(pt).size():
+            view.insert(edit, pt, text)
+
+
+def _unindent(view) -> None:
+    edit = _edit(view)
+    tab_size = view._state.settings.get('tab_size', 4)
+    for row in _selected_rows(view):
+        pt = view.text_point(row, 0)
+        line = view.substr(view._line(pt))
+        if line.startswith('\t'):
+            n = 1
+        else:
+            n = len(line[:tab_size]) - len(line[:tab_size].lstrip(' '))
+
+        if n:
+            view.erase(edit, sublime.Region(pt, pt + n))
+
+
+def _undo(view) -> None:
+    state = view._state
+    if state.undo:
+        edits, before, after = state.undo.pop()
+        for a, removed, inserted in reversed(edits):
+            view._replace(a, a + len(inserted), removed)
+
+        view.selection._regions = [sublime.Region(r.a, r.b, r.xpos) for r in before]
+        state.redo.append((edits, before, after))
+
+
+def _redo(view) -> None:
+    state = view._state
+    if state.redo:
+        edits, before, after = state.redo.pop()
+        for a, removed, inserted in edits:
+            view._replace(a, a + len(removed), inserted)
+
+        view.selection._regions = [sublime.Region(r.a, r.b, r.xpos) for r in after]
+        state.undo.append((edits, before, after))
+
+
+def _mark_undo_groups_for_gluing(view) -> None:
+    view._state.glue_mark = len(view._state.undo)
+
+
+def _maybe_mark_undo_groups_for_gluing(view) -> None:
+    if view._state.glue_mark is None:
+        _mark_undo_groups_for_gluing(view)
+
+
+def _unmark_undo_groups_for_gluing(view) -> None:
+    view._state.glue_mark = None
+
+
+def _glue_marked_undo_groups(view) -> None:
+    # The undo groups since the mark are glued into the first one.
+    state = view._state
+    mark = state.glue_mark
+    if mark is not None:
+        groups = state.undo[mark:]
+        if len(groups) > 1:
+            edits = [edit for group in groups for edit in group[0]]
+            state.undo[mark:] = [(edits, groups[0][1], groups[-1][2])]
+
+        state.glue_mark = None
+
+
+def _noop(view, **kwargs) -> None:
+    pass
+
+
+_BUILTIN_TEXT_COMMANDS = {
+    'append': _append,
+    'glue_marked_undo_groups': _glue_marked_undo_groups,
+    'hide_auto_complete': _noop,
+    'indent': _indent,
+    'insert': _insert,
+    'left_delete': _left_delete,
+    'mark_undo_groups_for_gluing': _mark_undo_groups_for_gluing,
+    'maybe_mark_undo_groups_for_gluing': _maybe_mark_undo_groups_for_gluing,
+    'move': _move,
+    'redo': _redo,
+    'reindent': _noop,
+    'right_delete': _right_delete,
+    'scroll_lines': _noop,
+    'select_all': _select_all,
+    'soft_redo': _redo,
+    'soft_undo': _undo,
+    'swap_case': _swap_case,
+    'undo': _undo,
+    'unindent': _unindent,
+    'unmark_undo_groups_for_gluing': _unmark_undo_groups_for_gluing,
+}
+
+# Commands that manage the undo stack, and so are not undo groups.
+_UNDO_COMMANDS = (
+    'glue_marked_undo_groups',
+    'mark_undo_groups_for_gluing',
+    'maybe_mark_undo_groups_for_gluing',
+    'redo',
+    'soft_redo',
+    'soft_undo',
+    'undo',
+    'unmark_undo_groups_for_gluing',
+)
+
+
+def _new_file(window, **kwargs) -> None:
+    window.new_file()
+
+
+def _close(window, **kwargs) -> None:
+    view = window.active_view()
+    if view:
+        view.close()
+
+
+def _window_noop(window, **kwargs) -> None:
+    pass
+
+
+_BUILTIN_WINDOW_COMMANDS = {
+    'close': _close,
+    'close_file': _close,
+    'hide_overlay': _window_noop,
+    'hide_panel': _window_noop,
+    'new_file': _new_file,
+    'show_panel': _window_noop,
+}
@@ -15,7 +15,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+import re
 import unittest
+from unittest import mock
 
 from NeoVintageous.nv.ex.scanner import Scanner
 from NeoVintageous.nv.ex.scanner import _ScannerState
@@ -257,7 +260,7 @@ class TestScanner(unittest.TestCase):
     def test_can_scan_empty_range(self):
         scanner = Scanner("s")
         tokens = list(scanner.scan())
-        self.assertEqual([TokenCommand('substitute', addressable=True), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True), TokenEof()], tokens)  # noqa: E501
         self.assertEqual(1, scanner.state.position)
 
     def test_whitespace_is_ingored(self):
@@ -321,19 +324,19 @@ class TestScannerCommandName(unittest.TestCase):
     def test_can_instantiate(self):
         scanner = Scanner("substitute")
         tokens = list(scanner.scan())
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=None), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=None), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramaters(self):
         scanner = Scanner("substitute:foo:bar:")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 1}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramaters_with_flags(self):
         scanner = Scanner("substitute:foo:bar:r")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": ['r'], "count": 1}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_scan_can_fail_if_substitute_paramaters_flags_have_wrong_order(self):
         scanner = Scanner("substitute:foo:bar:r&")
@@ -343,13 +346,13 @@ class TestScannerCommandName(unittest.TestCase):
         scanner = Scanner("substitute:foo:bar: 10")
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 10}
-        self.assertEqual([TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)
+        self.assertEqual([TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
     def test_can_scan_substitute_paramater_with_range(self):
         scanner = Scanner(r'%substitute:foo:bar: 10')
         tokens = list(scanner.scan())
         params = {"pattern": "foo", "replacement": "bar", "flags": [], "count": 10}
-        self.assertEqual([TokenPercent(), TokenCommand('substitute', addressable=True, params=params), TokenEof()], tokens)  # noqa: E501
+        self.assertEqual([TokenPercent(), TokenCommand('substitute', addressable=True, cooperates_with_global=True, params=params), TokenEof()], tokens)  # noqa: E501
 
 
 class TestScannerMarksScanner(unittest.TestCase):
@@ -477,6 +480,36 @@ class TestScannerWriteCommand(unittest.TestCase):
         self.assertEqual([TokenCommand('write', addressable=True, params=params), TokenEof()], tokens)
 
 
+class TestScanCommandRoutes(unittest.TestCase):
+
+    def scan(self, source: str, routes: list) -> list:
+        with mock.patch('NeoVintageous.nv.ex.scanner.ex_routes', OrderedDict(routes)), \
+                mock.patch('NeoVintageous.nv.ex.scanner._routes_pattern', None), \
+                mock.patch.dict('NeoVintageous.nv.ex.scanner._routes_commands', {}, clear=True):
+            return _scan_command(_ScannerState(source))[1]
+
+    def test_first_matching_route_wins(self):
+        routes = [
+            (re.compile(r'x(?:y)?'), lambda state: TokenCommand('first')),
+            (re.compile(r'xy'), lambda state: TokenCommand('second')),
+            (re.compile(r'(z)(z)?'), lambda state: TokenCommand('groups')),
+            (re.compile(r'zx'), lambda state: TokenCommand('third')),
+        ]
+
+        self.assertEqual(self.scan('xy', routes), [TokenCommand('first'), TokenEof()])
+        self.assertEqual(self.scan('zz', routes), [TokenCommand('groups'), TokenEof()])
+        with self.assertRaisesRegex(Exception, 'E492: Not an editor command: zx'):
+            self.scan('zx', routes)
+
+    def test_route_after_capturing_groups(self):
+        routes = [
+            (re.compile(r'(a)(b)?'), lambda state: TokenCommand('first')),
+            (re.compile(r'c'), lambda state: TokenCommand('second')),
+        ]
+
+        self.assertEqual(self.scan('c', routes), [TokenCommand('second'), TokenEof()])
+
+
 class TestExCommands(unittest.TestCase):
 
     def assertCommand(self, sources: list, expected: tuple) -> None:
@@ -516,9 +549,9 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['cd'], cmd('cd'))
         self.assertCommand(['close!', 'clo!'], cmd('close', forced=True))
         self.assertCommand(['close', 'clo'], cmd('close'))
-        self.assertCommand(['copy .', 'co .'], cmd('copy', params={'address': '.'}, addressable=True))
-        self.assertCommand(['copy .+3', 'co .+3'], cmd('copy', params={'address': '.+3'}, addressable=True))
-        self.assertCommand(['copy', 'co'], cmd('copy', addressable=True))
+        self.assertCommand(['copy .', 'co .'], cmd('copy', params={'address': '.'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['copy .+3', 'co .+3'], cmd('copy', params={'address': '.+3'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['copy', 'co'], cmd('copy', addressable=True, cooperates_with_global=True))
         self.assertCommand(['cquit', 'cq'], cmd('cquit'))
         self.assertCommand(['delete x', 'd x'], cmd('delete', params={'count': None, 'register': 'x'}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['delete', 'd'], cmd('delete', params={'count': None, 'register': '"'}, addressable=True, cooperates_with_global=True))  # noqa: E501
@@ -539,6 +572,8 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['help fizz', 'h fizz'], cmd('help', params={'subject': 'fizz'}))
         self.assertCommand(['help!', 'h!'], cmd('help', params={'subject': None}, forced=True))
         self.assertCommand(['help', 'h'], cmd('help', params={'subject': None}))
+        self.assertCommand(['helpgrep fizz', 'helpg fizz'], cmd('helpgrep', params={'pattern': 'fizz'}))
+        self.assertCommand(['helpgrep fizz\\c buzz'], cmd('helpgrep', params={'pattern': 'fizz\\c buzz'}))
         self.assertCommand(['history /', 'his /'], cmd('history', params={'name': '/'}))
         self.assertCommand(['history :', 'his :'], cmd('history', params={'name': ':'}))
         self.assertCommand(['history ?', 'his ?'], cmd('history', params={'name': '?'}))
@@ -549,9 +584,9 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['inoremap', 'ino'], cmd('inoremap'))
         self.assertCommand(['let n=v'], cmd('let', params={'name': 'n', 'value': 'v'}))
         self.assertCommand(['marks'], cmd('marks'))
-        self.assertCommand(['move .', 'm .'], cmd('move', params={'address': '.'}, addressable=True))
-        self.assertCommand(['move 3', 'm 3'], cmd('move', params={'address': '3'}, addressable=True))
-        self.assertCommand(['move', 'm'], cmd('move', addressable=True))
+        self.assertCommand(['move .', 'm .'], cmd('move', params={'address': '.'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['move 3', 'm 3'], cmd('move', params={'address': '3'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['move', 'm'], cmd('move', addressable=True, cooperates_with_global=True))
         self.assertCommand(['new /tmp/fizz/buzz.txt'], cmd('new', params={'file': '/tmp/fizz/buzz.txt'}))  # noqa: E501
         self.assertCommand(['new file.txt'], cmd('new', params={'file': 'file.txt'}))
         self.assertCommand(['new tmp/file.txt'], cmd('new', params={'file': 'tmp/file.txt'}))
@@ -561,6 +596,8 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['nohlsearch', 'noh'], cmd('nohlsearch'))
         self.assertCommand(['noremap abc xyz', 'no abc xyz'], cmd('noremap', params={'lhs': 'abc', 'rhs': 'xyz'}))
         self.assertCommand(['noremap', 'no'], cmd('noremap'))
+        self.assertCommand(['normal! dd', 'norm! dd'], cmd('normal', params={'keys': 'dd'}, forced=True, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['normal Ax y', 'norm Ax y'], cmd('normal', params={'keys': 'Ax y'}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['nunmap xyz', 'nun xyz'], cmd('nunmap', params={'lhs': 'xyz'}))
         self.assertCommand(['only!', 'on!'], cmd('only', forced=True))
         self.assertCommand(['only', 'on'], cmd('only'))
@@ -621,11 +658,11 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['split file.txt', 'sp file.txt'], cmd('split', params={'file': 'file.txt'}))
         self.assertCommand(['split tmp/file.txt', 'sp tmp/file.txt'], cmd('split', params={'file': 'tmp/file.txt'}))
         self.assertCommand(['split', 'sp'], cmd('split'))
-        self.assertCommand(['substitute', 's'], cmd('substitute', addressable=True))
-        self.assertCommand(['substitute/x/', 's/x/'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x//', 's/x//'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x/y/', 's/x/y/'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': [], 'count': 1}, addressable=True))  # noqa: E501
-        self.assertCommand(['substitute/x/y/ic', 's/x/y/ic'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': ['i', 'c'], 'count': 1}, addressable=True))  # noqa: E501
+        self.assertCommand(['substitute', 's'], cmd('substitute', addressable=True, cooperates_with_global=True))
+        self.assertCommand(['substitute/x/', 's/x/'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x//', 's/x//'], cmd('substitute', params={'pattern': 'x', 'replacement': '', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x/y/', 's/x/y/'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': [], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['substitute/x/y/ic', 's/x/y/ic'], cmd('substitute', params={'pattern': 'x', 'replacement': 'y', 'flags': ['i', 'c'], 'count': 1}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['sunmap xyz', 'sunm xyz'], cmd('sunmap', params={'lhs': 'xyz'}))
         self.assertCommand(['tabNext 11', 'tabN 11', 'tabprevious 11', 'tabp 11'], cmd('tabprevious', params={'count': 11}))  # noqa: E501
         self.assertCommand(['tabNext', 'tabN', 'tabprevious', 'tabp'], cmd('tabprevious'))
@@ -635,6 +672,9 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['tabnext 7', 'tabn 7'], cmd('tabnext', params={'count': 7}))
         self.assertCommand(['tabnext', 'tabn'], cmd('tabnext'))
         self.assertCommand(['tabonly', 'tabo'], cmd('tabonly'))
+        self.assertCommand(['t .', 't.'], cmd('copy', params={'address': '.'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['t 0', 't0'], cmd('copy', params={'address': '0'}, addressable=True, cooperates_with_global=True))  # noqa: E501
+        self.assertCommand(['t $', 't$'], cmd('copy', params={'address': '$'}, addressable=True, cooperates_with_global=True))  # noqa: E501
         self.assertCommand(['unmap xyz', 'unm xyz'], cmd('unmap', params={'lhs': 'xyz'}))
         self.assertCommand(['vnew /tmp/fizz/buzz.txt'], cmd('vnew', params={'file': '/tmp/fizz/buzz.txt'}))  # noqa: E501
         self.assertCommand(['vnew file.txt'], cmd('vnew', params={'file': 'file.txt'}))
@@ -647,6 +687,7 @@ class TestExCommands(unittest.TestCase):
         self.assertCommand(['vsplit tmp/file.txt', 'vs tmp/file.txt'], cmd('vsplit', params={'file': 'tmp/file.txt'}))
         self.assertCommand(['vsplit', 'vs'], cmd('vsplit'))
         self.assertCommand(['vunmap xyz', 'vu xyz'], cmd('vunmap', params={'lhs': 'xyz'}))
+        self.assertCommand(['vglobal/x/y', 'v/x/y'], cmd('global', params={'pattern': 'x', 'cmd': 'y'}, forced=True, addressable=True))  # noqa: E501
         self.assertCommand(['wall!', 'wa!'], cmd('wall', forced=True))
         self.assertCommand(['wall', 'wa'], cmd('wall'))
         self.assertCommand(['wq!'], cmd('wq', forced=True))
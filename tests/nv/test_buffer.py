@@ -0,0 +1,138 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.buffer import BufferReader
+from NeoVintageous.nv.buffer import BufferSnapshot
+
+
+class TestBufferReader(unittest.ViewTestCase):
+
+    def reader(self, text: str, chunk_size: int = 2) -> BufferReader:
+        self.write(text)
+
+        return BufferReader(self.view, chunk_size)
+
+    def test_char(self):
+        reader = self.reader('abc')
+        self.assertEqual(reader.char(0), 'a')
+        self.assertEqual(reader.char(2), 'c')
+        self.assertEqual(reader.char(3), '\x00')
+        self.assertEqual(reader.char(-1), '\x00')
+
+    def test_skip_forward(self):
+        reader = self.reader('a  \t  b  ')
+        self.assertEqual(reader.skip_forward(0, ' \t'), 0)
+        self.assertEqual(reader.skip_forward(1, ' \t'), 6)
+        self.assertEqual(reader.skip_forward(7, ' \t'), 9)
+        self.assertEqual(reader.skip_forward(9, ' \t'), 9)
+        self.assertEqual(reader.skip_forward(12, ' \t'), 12)
+
+    def test_skip_backward(self):
+        reader = self.reader('  a \n\n\n b')
+        self.assertEqual(reader.skip_backward(8, ' \n'), 8)
+        self.assertEqual(reader.skip_backward(7, ' \n'), 2)
+        self.assertEqual(reader.skip_backward(6, '\n'), 3)
+        self.assertEqual(reader.skip_backward(1, ' \n'), 0)
+        self.assertEqual(reader.skip_backward(0, ' \n'), 0)
+        self.assertEqual(reader.skip_backward(7, ' \n', stop=4), 4)
+        self.assertEqual(reader.skip_backward(12, ' \n'), 12)
+
+    def test_find_forward(self):
+        reader = self.reader('abc\tdef ')
+        self.assertEqual(reader.find_forward(0, ' \t'), 3)
+        self.assertEqual(reader.find_forward(4, ' \t'), 7)
+        self.assertEqual(reader.find_forward(8, ' \t'), 9)
+        self.assertEqual(reader.find_forward(-2, ' \t'), 3)
+        self.assertEqual(reader.find_forward(12, ' \t'), 12)
+
+    def test_find_backward(self):
+        reader = self.reader(' abc\tdef')
+        self.assertEqual(reader.find_backward(7, ' \t'), 4)
+        self.assertEqual(reader.find_backward(3, ' \t'), 0)
+        self.assertEqual(reader.find_backward(12, ' \t'), 4)
+        self.assertEqual(self.reader('abc').find_backward(2, ' \t'), -1)
+        self.assertEqual(reader.find_backward(-2, ' \t'), -2)
+
+    def test_line_chunks(self):
+        reader = self.reader('ab\ncd\nefgh\n\ni', chunk_size=4)
+        self.assertEqual(list(reader.line_chunks(0, 13)), [(0, 'ab'), (3, 'cd'), (6, 'efgh\n\ni')])
+        self.assertEqual(list(reader.line_chunks(3, 10)), [(3, 'cd'), (6, 'efgh')])
+        self.assertEqual(list(reader.line_chunks(11, 11)), [(11, '')])
+        self.assertEqual(list(reader.line_chunks(12, 13)), [(12, 'i')])
+        self.assertEqual(list(self.reader('ab\ncd', chunk_size=8).line_chunks(0, 5)), [(0, 'ab\ncd')])
+
+    def test_reads_text_in_chunks(self):
+        self.write('a' + ' ' * 98 + 'b')
+        with unittest.mock.patch.object(self.view, 'substr', wraps=self.view.substr) as substr:
+            self.assertEqual(BufferReader(self.view, 10).skip_forward(1, ' '), 99)
+            self.assertEqual(substr.call_count, 10)
+
+
+class TestBufferSnapshot(unittest.ViewTestCase):
+
+    def test_answers_like_the_view(self):
+        self.write('ab\n\ncd  \n\tefg\nh\nij\n')
+        snapshot = BufferSnapshot(self.view, [self.Region(3), self.Region(9, 11)], before=1, after=1)
+        for pt in range(self.view.size() + 1):
+            self.assertEqual(snapshot.line(pt), self.view.line(pt), pt)
+            self.assertEqual(snapshot.full_line(pt), self.view.full_line(pt), pt)
+            self.assertEqual(snapshot.substr(pt), self.view.substr(pt), pt)
+            self.assertEqual(snapshot.rowcol(pt), self.view.rowcol(pt), pt)
+            self.assertEqual(snapshot.line(self.Region(pt, 9)), self.view.line(self.Region(pt, 9)), pt)
+            self.assertEqual(snapshot.substr(self.Region(pt, 9)), self.view.substr(self.Region(pt, 9)), pt)
+
+        for row in range(8):
+            for col in range(4):
+                self.assertEqual(snapshot.text_point(row, col), self.view.text_point(row, col), (row, col))
+
+        self.assertEqual(snapshot.size(), self.view.size())
+
+    def test_does_not_call_the_view_within_the_lines(self):
+        self.write('ab\ncd\nef\n')
+        snapshot = BufferSnapshot(self.view, [self.Region(0), self.Region(4)])
+        with unittest.mock.patch.object(snapshot, 'view') as view:
+            self.assertEqual(snapshot.line(4), self.Region(3, 5))
+            self.assertEqual(snapshot.rowcol(4), (1, 1))
+            self.assertEqual(snapshot.substr(self.Region(1, 4)), 'b\nc')
+            self.assertEqual(snapshot.text_point(1, 1), 4)
+            self.assertMockNotCalled(view.line)
+            self.assertMockNotCalled(view.rowcol)
+            self.assertMockNotCalled(view.substr)
+            self.assertMockNotCalled(view.text_point)
+
+    @unittest.mock.patch('NeoVintageous.nv.buffer._SNAPSHOT_GAP', 2)
+    def test_reads_only_the_lines_of_selections_far_apart(self):
+        self.write('ab\ncd\nef\ngh\nij\nkl\nmn\n')
+        with unittest.mock.patch.object(self.view, 'substr', wraps=self.view.substr) as substr:
+            snapshot = BufferSnapshot(self.view, [self.Region(19), self.Region(1), self.Region(4)], after=1)
+            self.assertEqual([
+                unittest.mock.call(self.Region(0, 8)),
+                unittest.mock.call(self.Region(18, 21)),
+            ], substr.call_args_list)
+
+        for pt in range(self.view.size() + 1):
+            self.assertEqual(snapshot.line(pt), self.view.line(pt), pt)
+            self.assertEqual(snapshot.substr(pt), self.view.substr(pt), pt)
+            self.assertEqual(snapshot.rowcol(pt), self.view.rowcol(pt), pt)
+            self.assertEqual(snapshot.line(self.Region(pt, 19)), self.view.line(self.Region(pt, 19)), pt)
+            self.assertEqual(snapshot.substr(self.Region(pt, 19)), self.view.substr(self.Region(pt, 19)), pt)
+
+        for row in range(8):
+            for col in range(4):
+                self.assertEqual(snapshot.text_point(row, col), self.view.text_point(row, col), (row, col))
@@ -118,3 +118,24 @@ class TestCmdline(unittest.ViewTestCase):
         self.assertEqual(self.view.name(), 'Command-line mode')
         self.assertTrue(self.view.settings().get('_nv_ex_mode'))
         self.assertTrue(self.view.settings().get('is_widget'))
+
+    def test_confirm_callbacks(self):
+        cmdline = self.createCmdline(Cmdline.CONFIRM)
+        cmdline._on_change('y')
+        cmdline._on_done('n')
+        self.on_change.assert_called_once_with('y')
+        self.on_done.assert_called_once_with('n')
+        self.assertMockNotCalled(self.on_cancel)
+
+    def test_confirm_prompt(self):
+        cmdline = self.createCmdline(Cmdline.CONFIRM)
+        cmdline.prompt('', caption='replace with x (y/n/a/q/l)?')
+        self.window.show_input_panel.assert_called_once_with(
+            initial_text='',
+            on_change=cmdline._on_change,
+            caption='replace with x (y/n/a/q/l)?',
+            on_done=cmdline._on_done,
+            on_cancel=cmdline._on_cancel
+        )
+        self.assertFalse(self.view.settings().get('_nv_ex_mode'))
+        self.assertTrue(self.view.settings().get('is_widget'))
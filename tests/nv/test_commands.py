@@ -22,6 +22,7 @@ from NeoVintageous.nv.settings import set_reset_during_init
 
 @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {})
 @unittest.mock.patch('NeoVintageous.nv.session.save_session', unittest.mock.Mock())
+@unittest.mock.patch('NeoVintageous.nv.session._append_journal', unittest.mock.Mock())
 class TestFeedKey(unittest.ResetRegisters, unittest.ResetCommandLineOutput, unittest.FunctionalTestCase):
 
     def feedkey(self, key):
@@ -30,6 +30,7 @@ from NeoVintageous.nv.ex_routes import _ex_route_only
 from NeoVintageous.nv.ex_routes import _ex_route_onoremap
 from NeoVintageous.nv.ex_routes import _ex_route_substitute
 from NeoVintageous.nv.ex_routes import _ex_route_tabnext
+from NeoVintageous.nv.ex_routes import _ex_route_vglobal
 from NeoVintageous.nv.ex_routes import ex_routes
 from NeoVintageous.nv.ex_routes import TokenCommand
 
@@ -101,6 +102,16 @@ class Test_ex_route_global(unittest.TestCase):
         self.assertEqual(actual, TokenCommand('global', addressable=True, forced=True, params={'pattern': '111', 'cmd': 'delete'}))  # noqa: E501
 
 
+class Test_ex_route_vglobal(unittest.TestCase):
+
+    def test_can_scan(self):
+        actual = _ex_route_vglobal(_ScannerState('/111/print'))
+        self.assertEqual(actual, TokenCommand('global', addressable=True, forced=True, params={'pattern': '111', 'cmd': 'print'}))  # noqa: E501
+
+        actual = _ex_route_vglobal(_ScannerState('/111/s/x/y/'))
+        self.assertEqual(actual, TokenCommand('global', addressable=True, forced=True, params={'pattern': '111', 'cmd': 's/x/y/'}))  # noqa: E501
+
+
 class Test_ex_route_noremap(unittest.TestCase):
 
     def test_ex_route_noremap(self):
@@ -132,7 +143,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
     def test_none(self):
         actual = _ex_route_substitute(_ScannerState(''))
-        self.assertEqual(actual, TokenCommand('substitute', addressable=True))
+        self.assertEqual(actual, TokenCommand('substitute', addressable=True, cooperates_with_global=True))
 
     def test_raises_exception(self):
         with self.assertRaisesRegex(ValueError, 'bad command'):
@@ -144,7 +155,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def _test_ex_route_substitute(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -155,7 +166,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_empty(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('///')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': '',
                 'replacement': '',
                 'count': 1,
@@ -166,7 +177,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_flags(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/g')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -176,7 +187,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/i')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -186,7 +197,7 @@ class Test_ex_route_substitute(unittest.TestCase):
 
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def/gi')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -197,7 +208,7 @@ class Test_ex_route_substitute(unittest.TestCase):
     def test_closing_delimiter_is_not_required(self):
         self.assertEqual(
             _ex_route_substitute(_ScannerState('/abc/def')),
-            TokenCommand('substitute', addressable=True, params={
+            TokenCommand('substitute', addressable=True, cooperates_with_global=True, params={
                 'pattern': 'abc',
                 'replacement': 'def',
                 'count': 1,
@@ -254,7 +265,7 @@ class TestRoutes(unittest.TestCase):
         self.assertRoute('_ex_route_buffers', ['files', 'buffers', 'ls'])
         self.assertRoute('_ex_route_cd', ['cd'])
         self.assertRoute('_ex_route_close', ['close', 'clo'])
-        self.assertRoute('_ex_route_copy', ['copy', 'co'])
+        self.assertRoute('_ex_route_copy', ['copy', 'co', 't'])
         self.assertRoute('_ex_route_cquit', ['cquit', 'cq'])
         self.assertRoute('_ex_route_delete', ['delete', 'd'])
         self.assertRoute('_ex_route_delmarks', ['delmarks', 'delm'])
@@ -262,6 +273,7 @@ class TestRoutes(unittest.TestCase):
         self.assertRoute('_ex_route_file', ['file', 'f'])
         self.assertRoute('_ex_route_global', ['global', 'g'])
         self.assertRoute('_ex_route_help', ['help', 'h'])
+        self.assertRoute('_ex_route_helpgrep', ['helpgrep', 'helpg'])
         self.assertRoute('_ex_route_history', ['history', 'his'])
         self.assertRoute('_ex_route_inoremap', ['inoremap', 'ino'])
         self.assertRoute('_ex_route_let', ['let '])
@@ -271,6 +283,7 @@ class TestRoutes(unittest.TestCase):
         self.assertRoute('_ex_route_nnoremap', ['nnoremap', 'nn'])
         self.assertRoute('_ex_route_nohlsearch', ['nohlsearch', 'noh'])
         self.assertRoute('_ex_route_noremap', ['noremap', 'no'])
+        self.assertRoute('_ex_route_normal', ['normal', 'norm'])
         self.assertRoute('_ex_route_nunmap', ['nunmap', 'nun'])
         self.assertRoute('_ex_route_only', ['only', 'on'])
         self.assertRoute('_ex_route_onoremap', ['onoremap', 'ono'])
@@ -305,6 +318,7 @@ class TestRoutes(unittest.TestCase):
         self.assertRoute('_ex_route_vnoremap', ['vnoremap', 'vn'])
         self.assertRoute('_ex_route_vsplit', ['vsplit', 'vs'])
         self.assertRoute('_ex_route_vunmap', ['vunmap', 'vu'])
+        self.assertRoute('_ex_route_vglobal', ['vglobal', 'v'])
         self.assertRoute('_ex_route_wall', ['wall', 'wa'])
         self.assertRoute('_ex_route_wq', ['wq', 'exit', 'exi', 'xit', 'x'])
         self.assertRoute('_ex_route_wqall', ['wqall', 'wqa', 'xall', 'xa'])
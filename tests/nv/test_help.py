@@ -0,0 +1,110 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+import re
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.help import _candidate_lines
+from NeoVintageous.nv.help import build_grep_index
+from NeoVintageous.nv.help import build_index
+from NeoVintageous.nv.help import find_help_tag
+from NeoVintageous.nv.help import grep_help
+
+
+_TAGS = '\n'.join([
+    '!\tchange.txt\t/*!*',
+    ':copy\tchange.txt\t/*:copy*',
+    'CTRL-K\tinsert.txt\t/*CTRL-K*',
+    'c_CTRL-K\tcmdline.txt\t/*c_CTRL-K*',
+    'i_CTRL-K\tinsert.txt\t/*i_CTRL-K*',
+    'bar\tmotion.txt\t/*bar*',
+    'copy-move\tchange.txt\t/*copy-move*',
+    'v_x\tchange.txt\t/*v_x*',
+    'x\tchange.txt\t/*x*',
+    '',
+])
+
+
+class TestHelpIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = build_index(_TAGS)
+
+    def test_build_index(self):
+        self.assertEqual(['change.txt', '/*:copy*'], self.index['tags'][':copy'])
+        self.assertEqual([[1, ':copy']], self.index['keys']['copy'])
+        self.assertEqual([[0, 'CTRL-K'], [2, 'c_CTRL-K'], [3, 'i_CTRL-K']], self.index['keys']['ctrl-k'])
+        self.assertEqual({}, self.index['offsets'])
+
+    def test_find_help_tag(self):
+        def assertTag(expected, subject):
+            self.assertEqual(expected, find_help_tag(subject, self.index), subject)
+
+        assertTag('!', '!')
+        assertTag(':copy', ':copy')
+        assertTag(':copy', 'copy')
+        assertTag(':copy', 'COPY')
+        assertTag('CTRL-K', 'ctrl-k')
+        assertTag('CTRL-K', 'CTRL-K')
+        assertTag('c_CTRL-K', 'c_ctrl-k')
+        assertTag('bar', '|')
+        assertTag('x', 'x')
+        assertTag('v_x', 'v_x')
+        assertTag(None, 'foobar')
+        assertTag(None, 'move')
+
+
+_DOCS = [
+    ('change.txt', 'Copying and moving text\n\n:copy the lines\nCopy-move\n'),
+    ('motion.txt', 'Motions move the cursor\nword motions\n'),
+]
+
+
+@unittest.mock.patch.dict('NeoVintageous.nv.help._doc_lines', {
+    help_file: text.split('\n') for help_file, text in _DOCS
+})
+class TestHelpGrep(unittest.TestCase):
+
+    def setUp(self):
+        self.index = build_grep_index(_DOCS)
+
+    def assertGrep(self, expected, pattern, flags=0):
+        self.assertEqual(expected, grep_help(self.index, re.compile(pattern, flags)))
+
+    def test_build_grep_index(self):
+        self.assertEqual([['change.txt', 0], ['motion.txt', 5]], self.index['files'])
+        self.assertEqual([2, 1], self.index['words']['copy'])
+        self.assertEqual([5, 1], self.index['words']['motions'])
+
+    def test_candidate_lines(self):
+        self.assertEqual({0, 2, 3}, _candidate_lines(self.index, 'copy', 0))
+        self.assertEqual({2, 3}, _candidate_lines(self.index, ' copy ', 0))
+        self.assertEqual({0}, _candidate_lines(self.index, 'ying', 0))
+        self.assertEqual({3}, _candidate_lines(self.index, 'copy-move', 0))
+        self.assertEqual({6}, _candidate_lines(self.index, 'word motion', 0))
+        self.assertEqual(set(), _candidate_lines(self.index, 'foobar', 0))
+        self.assertIsNone(_candidate_lines(self.index, 'copy|move', 0))
+        self.assertIsNone(_candidate_lines(self.index, 'co*', 0))
+
+    def test_grep_help(self):
+        self.assertGrep([('change.txt', 2, ':copy the lines')], 'copy')
+        self.assertGrep([('change.txt', 2, ':copy the lines'), ('change.txt', 3, 'Copy-move')], '\\bcopy\\b', re.I)
+        self.assertGrep([('change.txt', 0, 'Copying and moving text'), ('change.txt', 3, 'Copy-move')], 'Cop')
+        self.assertGrep([('change.txt', 3, 'Copy-move'), ('motion.txt', 0, 'Motions move the cursor')], 'move|Motions')
+        self.assertGrep([('motion.txt', 1, 'word motions')], 'word mo')
+        self.assertGrep([], 'foobar')
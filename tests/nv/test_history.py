@@ -50,6 +50,7 @@ _patch_max_items = lambda n: unittest.mock.patch('NeoVintageous.nv.history._MAX_
 
 @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {})
 @unittest.mock.patch('NeoVintageous.nv.session.save_session', unittest.mock.Mock())
+@unittest.mock.patch('NeoVintageous.nv.session._append_journal', unittest.mock.Mock())
 class TestHistory(unittest.TestCase):
     histories = ('cmd', ':', 'search', '/', '?', 'expr', '=', 'input', '@', 'debug', '>')
 
@@ -366,6 +367,53 @@ class TestHistory(unittest.TestCase):
             _HIST_DEBUG: {'num': 0, 'items': {}}
         })
 
+    @unittest.mock.patch.dict('NeoVintageous.nv.options._session', {'history': 2})
+    @_patch_storage
+    def test_history_option(self, _storage):
+        self.assertTrue(history_add(':', 'c1'))
+        self.assertTrue(history_add(':', 'c2'))
+        self.assertTrue(history_add(':', 'c3'))
+        self.assertEqual(_storage[_HIST_CMD], {'num': 3, 'items': {2: 'c2', 3: 'c3'}})
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.options._session', {'history': 0})
+    @_patch_storage
+    def test_history_option_zero(self, _storage):
+        self.assertFalse(history_add(':', 'c1'))
+        self.assertEqual("'history' option is zero", history(':'))
+
+    @_patch_storage
+    def test_history_add_moves_existing_item_to_newest(self, _storage):
+        _storage[_HIST_CMD]['num'] = 9
+        _storage[_HIST_CMD]['items'] = {9: 'c', 2: 'a', 5: 'b'}
+
+        self.assertEqual('b', history_get(':', -2))
+        self.assertEqual('a', history_get(':', -3))
+        self.assertEqual('', history_get(':', -4))
+        self.assertTrue(history_add(':', 'a'))
+        self.assertEqual(_storage[_HIST_CMD], {'num': 10, 'items': {5: 'b', 9: 'c', 10: 'a'}})
+        self.assertEqual('a', history_get(':'))
+        self.assertEqual('c', history_get(':', -2))
+        self.assertEqual('b', history_get(':', -3))
+        self.assertTrue(history_add(':', 'b'))
+        self.assertEqual(_storage[_HIST_CMD], {'num': 11, 'items': {9: 'c', 10: 'a', 11: 'b'}})
+        self.assertEqual(11, history_nr(':'))
+        self.assertEqual(3, history_len(':'))
+
+    @_patch_storage
+    def test_history_negative_index_after_deletes(self, _storage):
+        for item in ('a', 'b', 'c', 'd', 'e'):
+            self.assertTrue(history_add(':', item))
+
+        self.assertTrue(history_del(':', 3))
+        self.assertTrue(history_del(':', -1))
+        self.assertEqual('d', history_get(':', -1))
+        self.assertEqual('b', history_get(':', -2))
+        self.assertEqual('a', history_get(':', -3))
+        self.assertEqual('', history_get(':', -4))
+        self.assertTrue(history_add(':', 'f'))
+        self.assertEqual('f', history_get(':', -1))
+        self.assertEqual('d', history_get(':', -2))
+
     @_patch_storage
     def test_history(self, _storage):
         self.assertTrue(history_add(':', 'a'))
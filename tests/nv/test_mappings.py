@@ -279,6 +279,28 @@ class TestMappings(unittest.ViewTestCase):
         self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'fj1'))
         self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 't'))
 
+    @unittest.mock_mappings()
+    def test_find_partial_match_after_remove_and_clear(self):
+        mappings_add(unittest.NORMAL, 'abc', 'x')
+        mappings_add(unittest.NORMAL, 'abd', 'x')
+        mappings_add(unittest.NORMAL, 'FileType', 'js abe x')
+        mappings_remove(unittest.NORMAL, 'abc')
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 'ab'))
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'abc'))
+        mappings_remove(unittest.NORMAL, 'abd')
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'ab'))
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, ''))
+        self.assignFileName('test.js')
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 'ab'))
+        mappings_add(unittest.NORMAL, 'abe', 'y')
+        self.assertTrue(_has_partial_matches(self.view, unittest.NORMAL, 'abe'))
+        mappings_remove(unittest.NORMAL, 'abe')
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'a'))
+        mappings_add(unittest.NORMAL, 'abf', 'y')
+        clear_mappings()
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, ''))
+        self.assertFalse(_has_partial_matches(self.view, unittest.NORMAL, 'a'))
+
     @unittest.mock_mappings()
     def test_find_full_match(self):
         self.assertEqual(_find_full_match(self.view, unittest.NORMAL, ''), None)
@@ -472,6 +494,7 @@ class TestSeqToCommand(unittest.TestCase):
         'b': {'s': 'bsv', 't': 'tsv', 'ep': 'ep', 'dp2': 'dp2'}
     })
     @unittest.mock.patch('NeoVintageous.nv.mappings.plugin')
+    @unittest.mock.patch.dict('NeoVintageous.nv.settings._views_settings')
     def test_seq_to_command(self, plugin):
         class Plugin():
             pass
@@ -488,7 +511,16 @@ class TestSeqToCommand(unittest.TestCase):
             def get(self, name, default=None):
                 return True
 
+            def add_on_change(self, tag, callback):
+                pass
+
+            def clear_on_change(self, tag):
+                pass
+
         class View():
+            def id(self):
+                return 1
+
             def settings(self):
                 return Settings()
 
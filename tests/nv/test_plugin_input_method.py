@@ -16,6 +16,10 @@
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
 from unittest.mock import call
+import os
+import tempfile
+
+from sublime import platform
 
 from NeoVintageous.tests import unittest
 
@@ -128,12 +132,14 @@ class TestInputMethod(unittest.ViewTestCase):
 
         # 1. ENTER insert stay in "ie" (Insert mode)
         listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.assertTrue(switcher.wait(5))
 
         self.assertMockNotCalled(shell)
         self.assertEqual('', switcher.saved_im)
 
         # 2. LEAVE insert switch to "en" (Normal mode)
         listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertTrue(switcher.wait(5))
 
         self.assertEqual(2, shell.call_count)
         self.assertEqual('ie', switcher.saved_im)
@@ -144,6 +150,7 @@ class TestInputMethod(unittest.ViewTestCase):
 
         # 3. ENTER insert switch to "ie" (Insert mode)
         listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.assertTrue(switcher.wait(5))
         self.assertEqual(3, shell.call_count)
         self.assertEqual('ie', switcher.saved_im)
         shell.assert_has_calls([
@@ -152,6 +159,7 @@ class TestInputMethod(unittest.ViewTestCase):
 
         # 4. LEAVE insert switch to "en" (Normal mode)
         listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertTrue(switcher.wait(5))
 
         self.assertEqual(5, shell.call_count)
         self.assertEqual('ie', switcher.saved_im)
@@ -159,3 +167,56 @@ class TestInputMethod(unittest.ViewTestCase):
             call(self.view, '/path/to/im-get'),
             call(self.view, '/path/to/im-set en'),
         ])
+
+
+@unittest.skipIf(platform() == 'windows', 'Test does not work on Windows')
+class TestInputMethodSwitching(unittest.ViewTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # The stub commands log each invocation, so they can be counted.
+        fd, self.log = tempfile.mkstemp()
+        os.close(fd)
+        self.set_setting('auto_switch_input_method', True)
+        self.set_setting('auto_switch_input_method_default', 'en')
+        self.set_setting('auto_switch_input_method_get_cmd', 'echo get >> %s; echo ie' % self.log)
+        self.set_setting('auto_switch_input_method_set_cmd', 'echo set {im} >> %s' % self.log)
+        self.switcher = IMSwitcher()
+        self.listener = Listener(self.switcher)
+
+    def tearDown(self):
+        os.remove(self.log)
+        super().tearDown()
+
+    def assertInvocations(self, expected: list) -> None:
+        self.assertTrue(self.switcher.wait(5))
+        with open(self.log) as f:
+            self.assertEqual(expected, f.read().splitlines())
+
+    def test_switches_in_the_background(self):
+        self.listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.assertInvocations([])
+        self.listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertInvocations(['get', 'set en'])
+        self.listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.assertInvocations(['get', 'set en', 'set ie'])
+
+    def test_rapid_mode_changes_are_debounced(self):
+        for i in range(10):
+            self.listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+            self.listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+
+        self.assertInvocations(['get', 'set en'])
+
+    def test_mode_flipped_back_before_it_settles_is_noop(self):
+        self.listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertInvocations(['get', 'set en'])
+        self.listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertInvocations(['get', 'set en'])
+
+    def test_is_noop_when_disabled(self):
+        self.set_setting('auto_switch_input_method', False)
+        self.listener.on_insert_enter(self.view, prev_mode=unittest.NORMAL)
+        self.listener.on_insert_leave(self.view, new_mode=unittest.NORMAL)
+        self.assertInvocations([])
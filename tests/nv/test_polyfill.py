@@ -20,6 +20,9 @@ from NeoVintageous.tests import unittest
 
 from NeoVintageous.nv.polyfill import view_find
 from NeoVintageous.nv.polyfill import view_find_in_range
+from NeoVintageous.nv.polyfill import view_find_iter
+from NeoVintageous.nv.polyfill import view_rfind
+from NeoVintageous.nv.polyfill import view_rfind_all
 
 
 class TestViewFind(unittest.ViewTestCase):
@@ -54,3 +57,46 @@ class TestViewFindInRange(unittest.ViewTestCase):
         self.normal('|fizz buzz')
         self.assertIsNone(view_find_in_range(self.view, 'x', 0, 9))
         self.assertIsNone(view_find_in_range(self.view, 'u', 1, 6))
+
+
+class TestViewFindIter(unittest.ViewTestCase):
+
+    def test_match(self):
+        self.normal('|fizz buzz')
+        self.assertEqual([(r.a, r.b) for r in view_find_iter(self.view, 'z', 0)], [(2, 3), (3, 4), (7, 8), (8, 9)])
+        self.assertEqual([(r.a, r.b) for r in view_find_iter(self.view, 'z', 4)], [(7, 8), (8, 9)])
+
+    def test_no_match(self):
+        self.normal('|fizz buzz')
+        self.assertEqual(list(view_find_iter(self.view, 'x', 0)), [])
+
+    def test_zero_length_match(self):
+        self.normal('|fizz\nbuzz')
+        self.assertEqual([(r.a, r.b) for r in view_find_iter(self.view, '^', 0)], [(0, 0), (5, 5)])
+
+
+class TestViewRFindAll(unittest.ViewTestCase):
+
+    def assertRFindAll(self, pattern: str, start_pt: int, expected: list, **kwargs) -> None:
+        self.assertEqual([(r.a, r.b) for r in view_rfind_all(self.view, pattern, start_pt, **kwargs)], expected)
+
+    def test_match(self):
+        self.normal('|fizz\nbuzz\nfizz')
+        self.assertRFindAll('z', 14, [(13, 14), (12, 13), (8, 9), (7, 8), (3, 4), (2, 3)])
+        self.assertRFindAll('z', 8, [(7, 8), (3, 4), (2, 3)])
+        self.assertRFindAll('z', 3, [(2, 3)])
+        self.assertRFindAll('z', 2, [])
+        self.assertRFindAll('z', 14, [(13, 14), (12, 13), (8, 9), (7, 8)], stop_pt=5)
+
+    @unittest.mock.patch('NeoVintageous.nv.polyfill._RFIND_CHUNK_SIZE', 2)
+    def test_match_across_chunks(self):
+        self.normal('|fizz\nbuzz\nfizz')
+        self.assertRFindAll('z', 14, [(13, 14), (12, 13), (8, 9), (7, 8), (3, 4), (2, 3)])
+        self.assertRFindAll('zz', 14, [(12, 14), (7, 9), (2, 4)])
+        self.assertRFindAll('z', 13, [(12, 13), (8, 9), (7, 8), (3, 4), (2, 3)])
+
+    def test_view_rfind(self):
+        self.normal('|fizz\nbuzz\nfizz')
+        self.assertRegion(view_rfind(self.view, 'z', 14), (13, 14))
+        self.assertRegion(view_rfind(self.view, 'b', 14), (5, 6))
+        self.assertIsNone(view_rfind(self.view, 'x', 14))
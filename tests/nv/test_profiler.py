@@ -0,0 +1,68 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv import profiler
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.patches = [
+            unittest.mock.patch.object(profiler, '_enabled', True),
+            unittest.mock.patch.object(profiler, '_imports', []),
+            unittest.mock.patch.object(profiler, '_phases', []),
+            unittest.mock.patch.object(profiler, '_rc_lines', []),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        super().tearDown()
+        for patch in self.patches:
+            patch.stop()
+
+    def test_phase(self):
+        with profiler.phase('fizz'):
+            pass
+        with self.assertRaises(ValueError):
+            with profiler.phase('buzz'):
+                raise ValueError('buzz')
+        self.assertEqual(['fizz', 'buzz'], [name for name, _ in profiler._phases])
+
+    def test_disabled_phase_is_not_recorded(self):
+        with unittest.mock.patch.object(profiler, '_enabled', False):
+            with profiler.phase('fizz'):
+                pass
+        self.assertEqual([], profiler._phases)
+
+    def test_report(self):
+        profiler._phases.append(('load rc', 0.002))
+        profiler._imports.append(('NeoVintageous.nv.fizz', 0.003, 0.001))
+        profiler.record_rc_line('rc', ':set ignorecase', 0.0005)
+        report = profiler.report()
+        self.assertIn('load rc', report)
+        self.assertIn('2.00 ms', report)
+        self.assertIn('NeoVintageous.nv.fizz', report)
+        self.assertIn('Sourced rc lines (1 lines, 0.50 ms)', report)
+        self.assertIn(':set ignorecase', report)
+
+    def test_report_when_disabled(self):
+        with unittest.mock.patch.object(profiler, '_enabled', False):
+            self.assertIn('SUBLIME_NEOVINTAGEOUS_PROFILE', profiler.report())
@@ -15,8 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from sublime import IGNORECASE
+from sublime import LITERAL
+
 from NeoVintageous.tests import unittest
 
+from NeoVintageous.nv.search import filter_literal_search_occurrences
+from NeoVintageous.nv.search import find_search_occurrences
+from NeoVintageous.nv.search import is_self_overlapping_pattern
 from NeoVintageous.nv.search import process_search_pattern
 from NeoVintageous.nv.search import process_word_search_pattern
 
@@ -71,3 +77,31 @@ class Test_flags(unittest.ViewTestCase):
         self.set_option('magic', False)
         self.set_option('ignorecase', True)
         self.assertEqual(('\\bfizz\\b', 2), process_word_search_pattern(self.view, 'fizz'))
+
+
+class TestIncrementalSearchHelpers(unittest.ViewTestCase):
+
+    def test_is_self_overlapping_pattern(self):
+        for pattern in ('aa', 'aba', 'abca', 'abab', 'xyzxy'):
+            self.assertTrue(is_self_overlapping_pattern(pattern), pattern)
+
+        for pattern in ('', 'a', 'ab', 'abc', 'aab', 'abcb'):
+            self.assertFalse(is_self_overlapping_pattern(pattern), pattern)
+
+    def test_filter_literal_search_occurrences(self):
+        self.normal('|fizz fiz fizzbuzz fiZZ fi')
+        candidates = find_search_occurrences(self.view, 'fi', LITERAL)
+        for pattern, flags in (('fiz', LITERAL), ('fizz', LITERAL), ('fizz', LITERAL | IGNORECASE), ('fizzb', LITERAL)):
+            self.assertEqual(
+                list(filter_literal_search_occurrences(self.view, candidates, pattern, flags)),
+                find_search_occurrences(self.view, pattern, flags),
+                pattern
+            )
+
+    def test_filter_literal_search_occurrences_does_not_overlap(self):
+        self.normal('|abababab')
+        candidates = find_search_occurrences(self.view, 'ab', LITERAL)
+        self.assertEqual(
+            list(filter_literal_search_occurrences(self.view, candidates, 'abab', LITERAL)),
+            [self.Region(0, 4), self.Region(4, 8)]
+        )
@@ -55,7 +55,7 @@ class TestSession(unittest.ViewTestCase):
         if unittest.ST_VERSION >= 4081:
             self.assertSessionNotSaved()
         else:
-            self.assertSessionSaved()
+            self.assertSessionJournaled(([['fizz'], 'buzz'],))
 
     @unittest.mock_session()
     @unittest.mock.patch('NeoVintageous.nv.session._get_session_file')
@@ -165,3 +165,68 @@ class TestSession(unittest.ViewTestCase):
                     self.assertEqual(
                         sorted(json.loads(f.read())),
                         sorted(json.loads(s.read())))
+
+
+class TestSessionJournal(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.session_file = os.path.join(self.tmpdir.name, 'test.session')
+        patcher = unittest.mock.patch('NeoVintageous.nv.session._get_session_file')
+        self.addCleanup(patcher.stop)
+        patcher.start().return_value = self.session_file
+        patcher = unittest.mock.patch.dict('NeoVintageous.nv.session._journal', {'records': 0})
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def writeSession(self, content: str) -> None:
+        with open(self.session_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def readJournal(self) -> list:
+        with open(self.session_file + '.journal', 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {}, clear=True)
+    def test_append_journal(self):
+        session._append_journal(([['last_substitute_string'], 'buzz'], [['macros', 'q']]))
+        session._append_journal(([['registers', 'a'], [['x'], False]],))
+        self.assertEqual([
+            [['last_substitute_string'], 'buzz'],
+            [['macros', 'q']],
+            [['registers', 'a'], [['x'], False]],
+        ], self.readJournal())
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {}, clear=True)
+    def test_load_session_replays_journal(self):
+        self.writeSession(json.dumps({
+            'last_substitute_string': 'fizz',
+            'macros': {'q': [['nv_vi_w', {}]], 'w': [['nv_vi_b', {}]]},
+        }))
+        session._append_journal((
+            [['last_substitute_string'], 'buzz'],
+            [['macros', 'q']],
+            [['registers', '1-9'], [[['x'], False]]],
+        ))
+        with open(self.session_file + '.journal', 'a', encoding='utf-8') as f:
+            f.write('[["last_used_register_name"],"incomplete')
+
+        session.load_session()
+
+        self.assertEqual('buzz', session._session['last_substitute_string'])
+        self.assertEqual({'w': [['nv_vi_b', {}]]}, session._session['macros'])
+        self.assertEqual([(['x'], False)], [tuple(r) for r in session._session['registers']['1-9']])
+        self.assertNotIn('last_used_register_name', session._session)
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.session._session', {'last_substitute_string': 'buzz'}, clear=True)
+    @unittest.mock.patch('NeoVintageous.nv.session._JOURNAL_MAX_RECORDS', 2)
+    def test_journal_is_compacted(self):
+        session._append_journal(([['last_substitute_string'], 'fizz'],))
+        self.assertTrue(os.path.exists(self.session_file + '.journal'))
+        session._append_journal(([['last_substitute_string'], 'buzz'],))
+        self.assertFalse(os.path.exists(self.session_file + '.journal'))
+        self.assertFalse(os.path.exists(self.session_file + '.tmp'))
+        with open(self.session_file, 'r', encoding='utf-8') as f:
+            self.assertEqual({'last_substitute_string': 'buzz'}, json.loads(f.read()))
@@ -19,8 +19,14 @@ import os
 
 from NeoVintageous.tests import unittest
 
+from NeoVintageous.nv import settings
 from NeoVintageous.nv.settings import get_cmdline_cwd
+from NeoVintageous.nv.settings import get_setting
+from NeoVintageous.nv.settings import get_setting_neo
+from NeoVintageous.nv.settings import reset_setting
 from NeoVintageous.nv.settings import set_cmdline_cwd
+from NeoVintageous.nv.settings import set_setting
+from NeoVintageous.nv.settings import settings_on_close
 
 
 class TestCmdlineCwd(unittest.ViewTestCase):
@@ -56,3 +62,37 @@ class TestCmdlineCwd(unittest.ViewTestCase):
     def test_can_return_session_cwd(self):
         set_cmdline_cwd('/tmp/fizz')
         self.assertEqual(get_cmdline_cwd(), '/tmp/fizz')
+
+
+class TestSettingsCache(unittest.ViewTestCase):
+
+    def test_get_setting(self):
+        self.assertEqual(get_setting(self.view, 'fizz', 'default'), 'default')
+        set_setting(self.view, 'fizz', 'buzz')
+        self.assertEqual(get_setting(self.view, 'fizz'), 'buzz')
+        self.assertEqual(get_setting(self.view, 'fizz'), 'buzz')
+        set_setting(self.view, 'fizz', False)
+        self.assertEqual(get_setting(self.view, 'fizz', True), False)
+        reset_setting(self.view, 'fizz')
+        self.assertIsNone(get_setting(self.view, 'fizz'))
+
+    def test_reads_are_cached(self):
+        set_setting(self.view, 'fizz', 'buzz')
+        get_setting(self.view, 'fizz')
+        with unittest.mock.patch.object(self.view, 'settings') as view_settings:
+            self.assertEqual(get_setting(self.view, 'fizz'), 'buzz')
+            self.assertMockNotCalled(view_settings)
+
+    def test_changed_settings_are_not_cached(self):
+        self.assertIsNone(get_setting(self.view, 'fizz'))
+        self.settings().set('vintageous_fizz', 'buzz')
+        self.assertEqual(get_setting(self.view, 'fizz'), 'buzz')
+        self.assertIsNone(get_setting_neo(self.view, 'fizz2'))
+        self.settings().set('neovintageous_fizz2', 'buzz2')
+        self.assertEqual(get_setting_neo(self.view, 'fizz2'), 'buzz2')
+
+    def test_settings_on_close(self):
+        get_setting(self.view, 'fizz')
+        self.assertIn(self.view.id(), settings._views_settings)
+        settings_on_close(self.view)
+        self.assertNotIn(self.view.id(), settings._views_settings)
@@ -0,0 +1,76 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from sublime import platform
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.session import get_session_view_value
+from NeoVintageous.nv.shell import ShellJob
+from NeoVintageous.nv.shell import cancel
+from NeoVintageous.nv.shell import start_filter
+from NeoVintageous.nv.shell import start_read
+
+
+@unittest.skipIf(platform() == 'windows', 'Test does not work on Windows')
+class TestShellJob(unittest.ViewTestCase):
+
+    def test_read(self):
+        job = start_read(self.view, 'echo fizz; echo buzz')
+        self.assertTrue(job.wait(5))
+        self.assertFalse(job.interrupted)
+        self.assertEqual('fizz\nbuzz\n', job.output())
+
+    @unittest.mock.patch('NeoVintageous.nv.shell.set_timeout')
+    def test_stream_delivers_lines_in_order(self, set_timeout):
+        process = unittest.mock.Mock(stdout=BytesIO(b'one\ntwo\nthree\n'))
+        job = ShellJob(self.view, [])
+        lines = []
+        job.follow(lines.append)
+        self.assertEqual('one\ntwo\nthree\n', job.stream(process))
+        # The callbacks run on the main thread after the lines have been read.
+        for args, _ in set_timeout.call_args_list:
+            args[0]()
+        self.assertEqual(['one\n', 'two\n', 'three\n'], lines)
+
+    def test_filter_results_are_in_region_order(self):
+        self.write('a\nbb\nccc\ndddd\neeeee\n')
+        regions = [self.view.full_line(pt) for pt in (0, 2, 5, 9, 14)]
+        job = start_filter(self.view, regions, 'tr a-e A-E')
+        self.assertTrue(job.wait(5))
+        self.assertEqual(['A\n', 'BB\n', 'CCC\n', 'DDDD\n', 'EEEEE\n'], job.results)
+
+    def test_cancel(self):
+        job = start_read(self.view, 'echo fizz; sleep 10')
+        self.assertFalse(job.wait(0.2))
+        job.cancel()
+        self.assertTrue(job.wait(5))
+        self.assertTrue(job.interrupted)
+
+    def test_shelltimeout(self):
+        self.set_option('shelltimeout', 100)
+        job = start_read(self.view, 'sleep 10')
+        self.assertTrue(job.wait(5))
+        self.assertTrue(job.interrupted)
+
+    @unittest.mock_status_message()
+    def test_cancel_is_noop_without_job(self):
+        self.assertFalse(cancel(self.view))
+        self.assertIsNone(get_session_view_value(self.view, 'shell_job'))
+        self.assertNoStatusMessage()
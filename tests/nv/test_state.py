@@ -131,6 +131,34 @@ class TestState(unittest.ViewTestCase):
         self.assertTrue(_should_scroll_into_view(get_motion(self.view), get_action(self.view)))
 
 
+class TestStateCommandDefinitions(unittest.ViewTestCase):
+
+    def test_set_action_stores_a_live_copy(self):
+        action = cmd_defs.ViReplaceCharacters()
+        set_action(self.view, action)
+        live = get_action(self.view)
+        self.assertIsInstance(live, cmd_defs.ViReplaceCharacters)
+        self.assertIsNot(live, action)
+        self.assertIs(live, get_action(self.view))
+        live.accept('x')
+        self.assertEqual('x', get_action(self.view).inp)
+        self.assertEqual('', action.inp)
+        set_action(self.view, live)
+        self.assertIs(live, get_action(self.view))
+
+    def test_set_motion_stores_a_live_copy(self):
+        motion = cmd_defs.ViSearchCharForward()
+        set_motion(self.view, motion)
+        live = get_motion(self.view)
+        self.assertIsInstance(live, cmd_defs.ViSearchCharForward)
+        self.assertIsNot(live, motion)
+        live.accept('x')
+        self.assertEqual('x', get_motion(self.view).inp)
+        self.assertEqual('', motion.inp)
+        set_motion(self.view, None)
+        self.assertIsNone(get_motion(self.view))
+
+
 class TestStateResettingState(unittest.ViewTestCase):
 
     def test_reset_command_data(self):
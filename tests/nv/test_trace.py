@@ -0,0 +1,97 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv import trace
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.patches = [
+            unittest.mock.patch.object(trace, '_events', None),
+            unittest.mock.patch.object(trace, 'enabled', False),
+            unittest.mock.patch.object(trace, 'log_debug', trace.log_debug),
+            unittest.mock.patch.object(trace, 'log_info', trace.log_info),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        super().tearDown()
+        for patch in self.patches:
+            patch.stop()
+
+    def test_configure(self):
+        logger = logging.getLogger('NeoVintageous')
+        level = logger.level
+        try:
+            logger.setLevel(logging.INFO)
+            trace.configure()
+            self.assertTrue(trace.log_info)
+            self.assertFalse(trace.log_debug)
+            logger.setLevel(logging.WARNING)
+            trace.configure()
+            self.assertFalse(trace.log_info)
+            self.assertFalse(trace.log_debug)
+        finally:
+            logger.setLevel(level)
+
+    def test_disabled_record_is_not_recorded(self):
+        trace.record('key', 'j')
+        self.assertEqual([], trace.events())
+
+    def test_record(self):
+        trace.enable()
+        trace.record('key', 'j', 'normal mode', None)
+        trace.record('resolve', 'j', None, 'ViMoveByLines')
+        self.assertEqual([
+            ('key', ('j', 'normal mode', None)),
+            ('resolve', ('j', None, 'ViMoveByLines')),
+        ], [(event, fields) for _, event, fields in trace.events()])
+
+    def test_ring_buffer_keeps_the_most_recent_events(self):
+        trace.enable(3)
+        for key in 'abcde':
+            trace.record('key', key)
+        self.assertEqual(['c', 'd', 'e'], [fields[0] for _, _, fields in trace.events()])
+        trace.clear()
+        self.assertEqual([], trace.events())
+
+    def test_report(self):
+        trace.enable(10)
+        trace.record('key', 'j', 'normal mode', None)
+        trace.record('key done', 'j', '0.250 ms')
+        report = trace.report()
+        self.assertIn('Events (2 of the last 10, oldest first)', report)
+        self.assertIn('key        j normal mode None', report)
+        self.assertIn('key done   j 0.250 ms', report)
+
+    def test_size(self):
+        self.assertEqual(1000, trace._size('1'))
+        self.assertEqual(1000, trace._size('true'))
+        self.assertEqual(1000, trace._size('0'))
+        self.assertEqual(1000, trace._size('-5'))
+        self.assertEqual(2, trace._size('2'))
+        self.assertEqual(5000, trace._size('5000'))
+
+    def test_report_when_disabled(self):
+        self.assertIn('SUBLIME_NEOVINTAGEOUS_TRACE', trace.report())
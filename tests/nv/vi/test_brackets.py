@@ -0,0 +1,72 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.vi.brackets import find_unbalanced_bracket
+
+
+class TestFindUnbalancedBracket(unittest.ViewTestCase):
+
+    def assertFind(self, content: str, pt: int, expected, **kwargs) -> None:
+        self.write(content)
+        self.assertEqual(find_unbalanced_bracket(self.view, pt, ('(', ')'), **kwargs), expected)
+
+    def test_forward(self):
+        self.assertFind('(a (b) c)', 1, 8)
+        self.assertFind('(a (b) c)', 4, 5)
+        self.assertFind('(a (b) c)', 5, 5)
+        self.assertFind('(a (b) c)', 6, 8)
+        self.assertFind('(a (b) c)', 9, None)
+        self.assertFind('a (b) c', 0, None)
+        self.assertFind('x(a)(b))', 0, 7)
+
+    def test_backward(self):
+        self.assertFind('(a (b) c)', 8, 0, forward=False)
+        self.assertFind('(a (b) c)', 5, 3, forward=False)
+        self.assertFind('(a (b) c)', 3, 0, forward=False)
+        self.assertFind('(a (b) c)', 0, None, forward=False)
+        self.assertFind('a (b) c', 7, None, forward=False)
+
+    def test_count(self):
+        self.assertFind('((a (b) c))', 2, 10, count=2)
+        self.assertFind('((a (b) c))', 2, None, count=3)
+        self.assertFind('((a (b) c))', 9, 0, forward=False, count=2)
+        self.assertFind('((a (b) c))', 9, None, forward=False, count=3)
+
+    def test_escaped_brackets_are_ignored(self):
+        self.assertFind('(a \\) b)', 1, 7)
+        self.assertFind('(a \\( b)', 7, 0, forward=False)
+        self.assertFind('\\(a)', 1, 3)
+        self.assertFind('\\(a)', 3, None, forward=False)
+
+    @unittest.mock.patch('NeoVintageous.nv.vi.brackets._CHUNK_SIZE', 2)
+    def test_across_chunks(self):
+        self.assertFind('(a (b\n\n) c) d)', 1, 10)
+        self.assertFind('(a (b\n\n) c)', 10, 0, forward=False)
+        self.assertFind('(a\\)b)', 1, 5)
+        self.assertFind('x(\\(b)', 5, 1, forward=False)
+
+    def test_repeated_searches(self):
+        # Repeated searches of an unchanged buffer use an index.
+        self.write('((a \\) (b) c)) (')
+        for _ in range(3):
+            self.assertEqual(find_unbalanced_bracket(self.view, 2, ('(', ')')), 12)
+            self.assertEqual(find_unbalanced_bracket(self.view, 10, ('(', ')'), count=2), 13)
+            self.assertEqual(find_unbalanced_bracket(self.view, 16, ('(', ')')), None)
+            self.assertEqual(find_unbalanced_bracket(self.view, 11, ('(', ')'), forward=False), 1)
+            self.assertEqual(find_unbalanced_bracket(self.view, 14, ('(', ')'), forward=False, count=2), None)
@@ -15,8 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import partial
 import unittest
 
+from NeoVintageous.nv import variables
+from NeoVintageous.nv.vi.keys import CommandDefs
 from NeoVintageous.nv.vi.keys import to_bare_command_name
 from NeoVintageous.nv.vi.keys import tokenize_keys
 
@@ -163,6 +166,25 @@ class TestKeySequenceTokenizer(unittest.TestCase):
                 _tokenize(invalid_token)
 
 
+class TestTokenizeKeysCache(unittest.TestCase):
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.variables._variables', {}, clear=True)
+    def test_returns_the_same_tuple_for_the_same_sequence(self):
+        tokens = tokenize_keys('3w<C-w>b')
+        self.assertEqual(('3', 'w', '<C-w>', 'b'), tokens)
+        self.assertIs(tokens, tokenize_keys('3w<C-w>b'))
+
+    @unittest.mock.patch.dict('NeoVintageous.nv.variables._variables', {}, clear=True)
+    def test_setting_leader_invalidates_cache(self):
+        self.assertEqual(('<bslash>', 'd'), tokenize_keys('<leader>d'))
+        variables.set('mapleader', ',')
+        self.assertEqual((',', 'd'), tokenize_keys('<leader>d'))
+        self.assertEqual(',d', to_bare_command_name('2<leader>d'))
+        variables.clear_variables()
+        self.assertEqual(('<bslash>', 'd'), tokenize_keys('<leader>d'))
+        self.assertEqual('<bslash>d', to_bare_command_name('2<leader>d'))
+
+
 class TestToBareCommandName(unittest.TestCase):
 
     def test_basic(self):
@@ -178,3 +200,28 @@ class TestToBareCommandName(unittest.TestCase):
         self.assertEquals('daw', to_bare_command_name('d2aw'))
         self.assertEquals('daw', to_bare_command_name('daw'))
         self.assertEquals('dd', to_bare_command_name('d2d'))
+
+
+class TestCommandDefs(unittest.TestCase):
+
+    def test_instantiates_on_first_lookup(self):
+        class Command():
+            instances = 0
+
+            def __init__(self, name):
+                Command.instances += 1
+                self.name = name
+
+        defs = CommandDefs()
+        defs['a'] = partial(Command, 'x')
+        defs['b'] = partial(Command, 'y')
+        self.assertEqual(0, Command.instances)
+        command = defs['a']
+        self.assertIsInstance(command, Command)
+        self.assertEqual('x', command.name)
+        self.assertIs(command, defs.get('a'))
+        self.assertEqual(1, Command.instances)
+        self.assertEqual('y', defs.get('b').name)
+        self.assertEqual(2, Command.instances)
+        self.assertIsNone(defs.get('c'))
+        self.assertEqual('default', defs.get('c', 'default'))
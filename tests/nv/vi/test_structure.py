@@ -0,0 +1,47 @@
+# Copyright (C) 2018-2023 The NeoVintageous Team (NeoVintageous).
+#
+# This file is part of NeoVintageous.
+#
+# NeoVintageous is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# NeoVintageous is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NeoVintageous.  If not, see <https://www.gnu.org/licenses/>.
+
+from NeoVintageous.tests import unittest
+
+from NeoVintageous.nv.vi.structure import get_structure_index
+
+
+class TestGetStructureIndex(unittest.ViewTestCase):
+
+    def test_index_is_built_on_second_request(self):
+        build = unittest.mock.Mock(return_value='index')
+        self.write('fizz')
+        self.assertIsNone(get_structure_index(self.view, 'x', build))
+        self.assertEqual(build.call_count, 0)
+        self.assertEqual(get_structure_index(self.view, 'x', build), 'index')
+        self.assertEqual(get_structure_index(self.view, 'x', build), 'index')
+        self.assertEqual(build.call_count, 1)
+
+    def test_indexes_are_keyed(self):
+        self.write('fizz')
+        get_structure_index(self.view, 'x', lambda: 'x')
+        get_structure_index(self.view, 'y', lambda: 'y')
+        self.assertEqual(get_structure_index(self.view, 'x', lambda: 'x'), 'x')
+        self.assertEqual(get_structure_index(self.view, 'y', lambda: 'y'), 'y')
+
+    def test_index_is_invalidated_when_buffer_changes(self):
+        self.write('fizz')
+        get_structure_index(self.view, 'x', lambda: 'x1')
+        self.assertEqual(get_structure_index(self.view, 'x', lambda: 'x1'), 'x1')
+        self.write('buzz')
+        self.assertIsNone(get_structure_index(self.view, 'x', lambda: 'x2'))
+        self.assertEqual(get_structure_index(self.view, 'x', lambda: 'x2'), 'x2')
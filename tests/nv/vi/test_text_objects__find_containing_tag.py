@@ -32,6 +32,8 @@ TESTS_CONTAINING_TAG = (
     test_data(content='<div>foo</div>', args={'start': 2}, expected=(unittest.Region(0, 5), unittest.Region(8, 14), 'div'), msg='find tag from within start tag'),  # noqa: E501
     test_data(content='<div>foo</div>', args={'start': 13}, expected=(unittest.Region(0, 5), unittest.Region(8, 14), 'div'), msg='find tag from within end tag'),  # noqa: E501
     test_data(content='<div>foo <p>bar</p></div>', args={'start': 12}, expected=(unittest.Region(9, 12), unittest.Region(15, 19), 'p'), msg='find nested tag from inside'),  # noqa: E501
+    test_data(content='<DIV>foo</div>', args={'start': 5}, expected=(unittest.Region(0, 5), unittest.Region(8, 14), 'div'), msg='find mixed case tag'),  # noqa: E501
+    test_data(content='<x<b>foo</b>', args={'start': 6}, expected=(unittest.Region(2, 5), unittest.Region(8, 12), 'b'), msg='find tag overlapping a bad tag'),  # noqa: E501
     test_data(content='<head><link rel="shortcut icon" href="favicon.png"></head>', args={'start': 16}, expected=(unittest.Region(0, 6), unittest.Region(51, 58), 'head'), msg='find head'),  # noqa: E501
 )
 
@@ -46,3 +48,14 @@ class Test_find_containing_tag(unittest.ViewTestCase):
 
             msg = "failed at test index {0}: {1}".format(i, data.msg)
             self.assertEqual(data.expected, actual, msg)
+
+    def test_find_containing_tag_repeatedly(self):
+        # Repeated searches of an unchanged buffer use an index.
+        self.view.set_syntax_file('Packages/HTML/HTML.tmLanguage')
+        for (i, data) in enumerate(TESTS_CONTAINING_TAG):
+            self.write(data.content)
+            for _ in range(3):
+                actual = find_containing_tag(self.view, **data.args)
+
+                msg = "failed at test index {0}: {1}".format(i, data.msg)
+                self.assertEqual(data.expected, actual, msg)
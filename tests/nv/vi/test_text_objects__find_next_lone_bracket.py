@@ -28,6 +28,8 @@ TESTS_NEXT_BRACKET = (
     test(content='a\\}bc', start=2, brackets=('\\{', '\\}'), expected=None, msg='should not find escaped bracket at caret position'),  # noqa: E501
     test(content='a\\}bc', start=0, brackets=('\\{', '\\}'), expected=None, msg='should not find escaped bracket'),
     test(content='foo {bar foo bar}', start=16, brackets=('\\{', '\\}'), expected=unittest.Region(16, 17), msg='should find next bracket at caret position'),  # noqa: E501
+    test(content='x(a)(b))', start=0, brackets=('\\(', '\\)'), expected=unittest.Region(7, 8), msg='should skip balanced pairs'),  # noqa: E501
+    test(content='{(\n)()', start=0, brackets=('\\(', '\\)'), expected=None, msg='should not find closing bracket of a later pair'),  # noqa: E501
 )
 
 
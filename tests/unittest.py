@@ -1287,7 +1287,9 @@ def mock_session():
         @mock.patch.dict('NeoVintageous.nv.session._session', {}, clear=True)
         @mock.patch.dict('NeoVintageous.nv.history._storage', {}, clear=True)
         @mock.patch('NeoVintageous.nv.session.save_session')
+        @mock.patch('NeoVintageous.nv.session._append_journal')
         def wrapped(self, *args, **kwargs):
+            journal = args[-2]
             save = args[-1]
 
             def _assertSessionEqual(*args) -> None:
@@ -1317,13 +1319,15 @@ def mock_session():
 
             def _assertNotSaved() -> None:
                 self.assertMockNotCalled(save)
+                self.assertMockNotCalled(journal)
 
             self.assertSessionNotSaved = _assertNotSaved
             self.assertSessionSaved = save.assert_called_once_with
+            self.assertSessionJournaled = journal.assert_called_once_with
             self.assertSession = _assertSessionEqual
             self.assertSessionEmpty = _assertSessionEmpty
 
-            return f(self, *args[:-1], **kwargs)
+            return f(self, *args[:-2], **kwargs)
         return wrapped
     return wrapper
 
@@ -1382,10 +1386,12 @@ def mock_mappings(*mappings):
     """
     def wrapper(f):
 
+        from NeoVintageous.nv.mappings import _PrefixTrie
         from NeoVintageous.nv.mappings import _mappings
         from NeoVintageous.nv.mappings import mappings_add
 
         @unittest.mock.patch.dict('NeoVintageous.nv.mappings._mappings', {k: {} for k in _mappings}, clear=True)
+        @unittest.mock.patch.dict('NeoVintageous.nv.mappings._mappings_index', {k: _PrefixTrie() for k in _mappings}, clear=True)  # noqa: E501
         def wrapped(self, *args, **kwargs):
             for mapping in mappings:
                 mappings_add(*mapping)